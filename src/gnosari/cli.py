@@ -29,7 +29,7 @@ from rich.markdown import Markdown
 
 from .engine.builder import TeamBuilder
 from .engine.runner import TeamRunner
-from .prompts.prompts import build_agent_system_prompt
+from .prompts.prompts import build_agent_system_prompt, render_system_prompt
 from .prompts.manager import PromptManager
 
 
@@ -529,22 +529,8 @@ async def show_team_prompts(config_path: str, model: str = "gpt-4o", temperature
                 )
                 agent_type = "Specialized Agent"
             
-            # Combine all prompt components
-            prompt_parts = []
-            
-            # Add background if not empty
-            if prompt_components['background']:
-                prompt_parts.append(chr(10).join(prompt_components['background']))
-            
-            # Add steps if not empty
-            if prompt_components['steps']:
-                prompt_parts.append(chr(10).join(prompt_components['steps']))
-            
-            # Add output instructions if not empty
-            if prompt_components['output_instructions']:
-                prompt_parts.append(chr(10).join(prompt_components['output_instructions']))
-            
-            full_prompt = chr(10).join(prompt_parts)
+            # Combine all prompt components the same way agents receive them
+            full_prompt = render_system_prompt(prompt_components)
             
             # Display agent information
             console.print(f"[bold green]{'='*60}[/bold green]")
@@ -1229,7 +1215,8 @@ def main() -> NoReturn:
     worker_parser = subparsers.add_parser('worker', help='Run Celery worker for queue processing')
     worker_parser.add_argument('action', nargs='?', default='start', choices=['start', 'stop', 'restart', 'status'], help='Worker action (default: start)')
     worker_parser.add_argument('--concurrency', '-c', type=int, default=1, help='Number of concurrent workers (default: 1)')
-    worker_parser.add_argument('--queue', '-q', default='gnosari_queue', help='Queue name to process (default: gnosari_queue)')
+    worker_parser.add_argument('--queue', '-q', default='gnosari_interactive,gnosari_queue,gnosari_long', help='Comma-separated queue names to process with one worker (default: all Gnosari queues)')
+    worker_parser.add_argument('--queues', help="Start one worker per queue with its own concurrency: 'queue:concurrency,...' or 'all' for the configured defaults (GNOSARI_QUEUE_CONCURRENCY)")
     worker_parser.add_argument('--loglevel', '-l', default='info', choices=['debug', 'info', 'warning', 'error'], help='Log level (default: info)')
     
     # Flower subcommand  
@@ -1238,6 +1225,15 @@ def main() -> NoReturn:
     flower_parser.add_argument('--auth', help='Basic auth in format user:password (default: admin:admin)')
     flower_parser.add_argument('--broker', help='Broker URL (default: redis://localhost:6379/0)')
     
+    # Serve subcommand
+    serve_parser = subparsers.add_parser('serve', help='Run an HTTP server that keeps teams warm and streams responses')
+    serve_parser.add_argument('--config', '-c', dest='serve_config', help='Default team configuration YAML file')
+    serve_parser.add_argument('--teams-dir', help="Directory of team YAML files selectable with the request's 'team' field")
+    serve_parser.add_argument('--host', default=os.getenv('GNOSARI_SERVE_HOST', '127.0.0.1'), help='Interface to bind (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', '-p', type=int, default=int(os.getenv('GNOSARI_SERVE_PORT', '8080')), help='Port to listen on (default: 8080)')
+    serve_parser.add_argument('--max-teams', type=int, help='Maximum number of resident teams (default: GNOSARI_RUNTIME_MAX_TEAMS or 16)')
+    serve_parser.add_argument('--idle-timeout', type=float, help='Seconds before an unused team is evicted (default: GNOSARI_RUNTIME_IDLE_TIMEOUT or 900)')
+    
     # Prompts subcommand
     prompts_parser = subparsers.add_parser('prompts', help='Manage prompt templates')
     prompts_subparsers = prompts_parser.add_subparsers(dest='prompts_command', help='Prompt commands')
@@ -1351,6 +1347,47 @@ def main() -> NoReturn:
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         pass
         
+        # Start one worker per queue (for start, restart actions)
+        if args.action in ['start', 'restart'] and args.queues:
+            from .queue.config import CeleryConfig
+            
+            if args.queues == 'all':
+                queue_concurrency = {queue: CeleryConfig.queue_concurrency.get(queue, 1) for queue in CeleryConfig.QUEUES}
+            else:
+                queue_concurrency = {}
+                for item in args.queues.split(','):
+                    name, _, count = item.strip().partition(':')
+                    queue_concurrency[name] = int(count) if count else args.concurrency
+            
+            processes = []
+            for queue, concurrency in queue_concurrency.items():
+                worker_cmd = [
+                    "celery", "-A", "gnosari.queue.app.celery_app", "worker",
+                    "--concurrency", str(concurrency),
+                    "--queues", queue,
+                    "--hostname", f"{queue}@%h",
+                    "--loglevel", args.loglevel
+                ]
+                print(f"Starting Celery worker for '{queue}' with command: {' '.join(worker_cmd)}")
+                processes.append(subprocess.Popen(worker_cmd))
+            
+            try:
+                exit_codes = [process.wait() for process in processes]
+            except KeyboardInterrupt:
+                for process in processes:
+                    process.terminate()
+                for process in processes:
+                    try:
+                        process.wait(timeout=10)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                print("\nWorkers stopped.")
+                return
+            if any(exit_codes):
+                print(f"Error running workers: exit codes {exit_codes}")
+                sys.exit(1)
+            return
+        
         # Start worker (for start, restart actions)
         if args.action in ['start', 'restart']:
             # Build celery worker command
@@ -1403,6 +1440,26 @@ def main() -> NoReturn:
             sys.exit(1)
         return
     
+    # Handle serve command
+    if args.command == 'serve':
+        if not args.serve_config and not args.teams_dir:
+            print("Error: --config or --teams-dir is required to serve teams")
+            sys.exit(1)
+        
+        from .server import run_server
+        run_server(
+            host=args.host,
+            port=args.port,
+            default_config=args.serve_config,
+            teams_dir=args.teams_dir,
+            model=args.model,
+            temperature=args.temperature,
+            api_key=args.api_key or os.getenv("OPENAI_API_KEY"),
+            max_teams=args.max_teams,
+            idle_timeout=args.idle_timeout
+        )
+        return
+    
     # Handle prompts command
     if args.command == 'prompts':
         # Parse dynamic variable arguments from unknown_args for both view and use commands
@@ -1484,16 +1541,17 @@ def main() -> NoReturn:
                 console.print("🚀 [bold cyan]GNOSARI TEAM INITIALIZATION[/bold cyan]", style="bold")
                 console.print("─" * 80, style="dim")
                 
-                # Start Live display for team building
-                with Live("", refresh_per_second=4, auto_refresh=True, console=console) as live:
-                    live.update(Text.assemble(("⏳ Building team from configuration...", "dim")))
-                    
-                    def progress_callback(message):
-                        live.update(Text.assemble((f"⏳ {message}", "yellow")))
-                        # Small delay to make progress visible
-                        import time
-                        time.sleep(0.3)
-                    
+                # Progress messages only record state; the Live display renders the
+                # latest one at its own refresh rate, so the build never waits on drawing
+                progress = {"icon": "⏳", "message": "Building team from configuration...", "style": "dim"}
+                
+                def render_progress():
+                    return Text.assemble((f"{progress['icon']} {progress['message']}", progress["style"]))
+                
+                def progress_callback(message):
+                    progress.update(icon="⏳", message=message, style="yellow")
+                
+                with Live(get_renderable=render_progress, refresh_per_second=10, auto_refresh=True, console=console):
                     # Create team builder with progress callback
                     builder = TeamBuilder(
                         api_key=api_key,
@@ -1506,11 +1564,8 @@ def main() -> NoReturn:
                     # Build the team with progress updates
                     team = await builder.build_team(args.config, debug=args.debug)
                     
-                    live.update(Text.assemble(("✅ Team built successfully!", "green")))
-                    
-                    # Pause to show completion
-                    import asyncio
-                    await asyncio.sleep(1.0)
+                    # Rendered by the final refresh when the display closes
+                    progress.update(icon="✅", message="Team built successfully!", style="green")
                 
                 console.print("─" * 80, style="dim")
             else:
@@ -13,7 +13,8 @@ from .exceptions import (
     AgentError, 
     ToolError, 
     KnowledgeError, 
-    ProviderError
+    ProviderError,
+    AdmissionRejectedError
 )
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     'AgentError',
     'ToolError',
     'KnowledgeError',
-    'ProviderError'
+    'ProviderError',
+    'AdmissionRejectedError'
 ]
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Concurrency limits and admission control.
+
+Runs, and model requests per provider endpoint, take a slot from a named
+limit before they start. When every slot is taken a caller waits in a
+bounded admission queue; callers that find the queue full, or that wait
+longer than the queue timeout, are rejected with ``AdmissionRejectedError``
+instead of piling more load onto an overloaded provider.
+
+Limits (0 means unlimited) come from the environment and can be overridden
+per team with a ``concurrency`` section in the team configuration:
+
+- ``GNOSARI_MAX_TEAM_RUNS``: concurrent runs per team (``max_runs``)
+- ``GNOSARI_MAX_AGENT_RUNS``: concurrent runs per starting agent (``max_agent_runs``)
+- ``GNOSARI_MAX_PROVIDER_REQUESTS``: concurrent model requests per provider endpoint
+- ``GNOSARI_ADMISSION_QUEUE_SIZE``: callers waiting per limit (``max_queue``, default 100)
+- ``GNOSARI_ADMISSION_TIMEOUT``: seconds a caller may wait (``queue_timeout``, default 30)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .exceptions import AdmissionRejectedError
+
+logger = logging.getLogger(__name__)
+
+# Teams whose run the current task (and tasks it spawned) was admitted for.
+# Runs nested in an admitted run, such as delegations, belong to that run and
+# must not wait for another slot of the team the parent run is holding.
+_admitted_teams: ContextVar[frozenset] = ContextVar("gnosari_admitted_teams", default=frozenset())
+
+
+class ConcurrencyLimit:
+    """A named semaphore with a bounded, timed admission queue."""
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int = 100, queue_timeout: float = 30.0):
+        """Initialize the limit.
+
+        Args:
+            name: Limit name, used in logs and rejection errors
+            max_concurrent: Maximum number of slots held at once
+            max_queue: Maximum number of callers waiting for a slot
+            queue_timeout: Seconds a caller may wait for a slot
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Semaphores bind to the event loop they are first used on
+        self.loop = asyncio.get_running_loop()
+        self._active = 0
+        self._waiting = 0
+        self._stats = {"admitted": 0, "rejected": 0, "timed_out": 0, "max_waiting": 0, "wait_seconds": 0.0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limit statistics.
+
+        Returns:
+            Dict with active and waiting callers, admissions and rejections
+        """
+        return {"max_concurrent": self.max_concurrent, "active": self._active, "waiting": self._waiting, **self._stats}
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the admission queue if needed.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait times out
+        """
+        if self._semaphore.locked():
+            if self._waiting >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise AdmissionRejectedError(self.name, f"admission queue full ({self.max_queue} waiting)")
+
+            self._waiting += 1
+            self._stats["max_waiting"] = max(self._stats["max_waiting"], self._waiting)
+            started = time.monotonic()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._stats["timed_out"] += 1
+                raise AdmissionRejectedError(
+                    self.name, f"no slot free after {self.queue_timeout:g}s", retry_after=self.queue_timeout
+                )
+            finally:
+                self._waiting -= 1
+                self._stats["wait_seconds"] += time.monotonic() - started
+        else:
+            await self._semaphore.acquire()
+
+        self._active += 1
+        self._stats["admitted"] += 1
+
+    def release(self) -> None:
+        """Return a slot."""
+        self._active -= 1
+        self._semaphore.release()
+
+
+class AdmissionController:
+    """Registry of named concurrency limits."""
+
+    def __init__(self):
+        self._limits: Dict[str, ConcurrencyLimit] = {}
+        self.max_team_runs = int(os.getenv("GNOSARI_MAX_TEAM_RUNS", "0"))
+        self.max_agent_runs = int(os.getenv("GNOSARI_MAX_AGENT_RUNS", "0"))
+        self.max_provider_requests = int(os.getenv("GNOSARI_MAX_PROVIDER_REQUESTS", "0"))
+        self.max_queue = int(os.getenv("GNOSARI_ADMISSION_QUEUE_SIZE", "100"))
+        self.queue_timeout = float(os.getenv("GNOSARI_ADMISSION_TIMEOUT", "30"))
+
+    def get_limit(self, name: str, max_concurrent: int, max_queue: Optional[int] = None,
+                  queue_timeout: Optional[float] = None) -> Optional[ConcurrencyLimit]:
+        """Get or create a named limit.
+
+        Args:
+            name: Limit name
+            max_concurrent: Maximum concurrent slots (0 or less disables the limit)
+            max_queue: Maximum waiting callers (default from the controller)
+            queue_timeout: Maximum wait in seconds (default from the controller)
+
+        Returns:
+            The limit, or None if it is disabled
+        """
+        if max_concurrent <= 0:
+            return None
+        limit = self._limits.get(name)
+        if limit is not None and limit.loop is not asyncio.get_running_loop():
+            # Created under an earlier event loop (e.g. a previous asyncio.run)
+            limit = None
+        if limit is None or limit.max_concurrent != max_concurrent:
+            if limit is not None and (limit._active or limit._waiting):
+                # Keep the limit in use; the new size applies once it drains
+                return limit
+            limit = ConcurrencyLimit(
+                name, max_concurrent,
+                self.max_queue if max_queue is None else max_queue,
+                self.queue_timeout if queue_timeout is None else queue_timeout
+            )
+            self._limits[name] = limit
+        return limit
+
+    @asynccontextmanager
+    async def slot(self, name: str, max_concurrent: int, max_queue: Optional[int] = None,
+                   queue_timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """Hold a slot of a named limit for the duration of the block.
+
+        Args:
+            name: Limit name
+            max_concurrent: Maximum concurrent slots (0 or less disables the limit)
+            max_queue: Maximum waiting callers
+            queue_timeout: Maximum wait in seconds
+
+        Raises:
+            AdmissionRejectedError: If no slot could be taken
+        """
+        limit = self.get_limit(name, max_concurrent, max_queue, queue_timeout)
+        if limit is None:
+            yield
+            return
+        await limit.acquire()
+        try:
+            yield
+        finally:
+            limit.release()
+
+    @asynccontextmanager
+    async def admit_run(self, team_name: str, agent_name: str,
+                        team_config: Optional[Dict[str, Any]] = None) -> AsyncIterator[None]:
+        """Admit a run of a team starting at an agent.
+
+        Args:
+            team_name: Team name
+            agent_name: Agent the run starts with
+            team_config: Team configuration; its ``concurrency`` section overrides the defaults
+
+        Runs nested in an admitted run of the same team (delegations) are
+        admitted without taking further slots.
+
+        Raises:
+            AdmissionRejectedError: If the team or agent limit rejects the run
+        """
+        admitted_teams = _admitted_teams.get()
+        if team_name in admitted_teams:
+            yield
+            return
+
+        settings = (team_config or {}).get("concurrency") or {}
+        max_queue = settings.get("max_queue")
+        queue_timeout = settings.get("queue_timeout")
+        async with self.slot(f"team:{team_name}", int(settings.get("max_runs", self.max_team_runs)),
+                             max_queue, queue_timeout):
+            async with self.slot(f"agent:{team_name}/{agent_name}",
+                                 int(settings.get("max_agent_runs", self.max_agent_runs)),
+                                 max_queue, queue_timeout):
+                token = _admitted_teams.set(admitted_teams | {team_name})
+                try:
+                    yield
+                finally:
+                    _admitted_teams.reset(token)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics of all limits.
+
+        Returns:
+            Dict mapping limit names to their statistics
+        """
+        return {name: limit.get_stats() for name, limit in self._limits.items()}
+
+
+# Process-wide admission controller
+admission_controller = AdmissionController()
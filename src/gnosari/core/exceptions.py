@@ -30,4 +30,13 @@ class KnowledgeError(GnosariError):
 
 class ProviderError(GnosariError):
     """Raised when there are LLM provider errors."""
-    pass
\ No newline at end of file
+    pass
+
+class AdmissionRejectedError(GnosariError):
+    """Raised when a run or request is not admitted by a concurrency limit."""
+    
+    def __init__(self, limit_name: str, reason: str, retry_after: float = 1.0):
+        super().__init__(f"Rejected by concurrency limit '{limit_name}': {reason}")
+        self.limit_name = limit_name
+        self.reason = reason
+        self.retry_after = retry_after
@@ -3,12 +3,16 @@
 This module contains the core engine components:
 - TeamBuilder: Builds and configures agent teams from YAML configs
 - TeamRunner: Runs and manages team execution with streaming support
+- TeamRuntime: Keeps built teams warm across conversation turns
 """
 
 from .builder import TeamBuilder
 from .runner import TeamRunner
+from .runtime import TeamRuntime, WarmTeam
 
 __all__ = [
     "TeamBuilder",
-    "TeamRunner"
+    "TeamRunner",
+    "TeamRuntime",
+    "WarmTeam"
 ]
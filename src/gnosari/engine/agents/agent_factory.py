@@ -6,7 +6,7 @@ from agents import Agent
 from agents.agent import ModelSettings
 from openai.types.chat import ChatCompletionReasoningEffort
 
-from ...prompts import build_agent_system_prompt
+from ...prompts import build_agent_system_prompt, render_system_prompt, system_prompt_cache
 from ...providers import setup_provider_for_model
 from .tool_resolver import ToolResolver
 from ..mcp.server_registry import MCPServerRegistry
@@ -179,10 +179,26 @@ class AgentFactory:
         team_config: Dict[str, Any],
         agent_config: Dict[str, Any]
     ) -> str:
-        """Build system prompt for agent."""
+        """Build system prompt for agent, reusing the rendered prompt of an unchanged agent."""
         knowledge_descriptions = self._get_knowledge_descriptions()
         agent_tools = agent_config.get('tools', []) if agent_config else []
         
+        cache_key = system_prompt_cache.make_key(
+            name,
+            {
+                "instructions": instructions,
+                "is_orchestrator": is_orchestrator,
+                "agent_config": agent_config,
+                "knowledge_descriptions": knowledge_descriptions,
+                "team_tools": team_config.get('tools') if is_orchestrator and team_config else None
+            },
+            self._get_tool_set(agent_tools)
+        )
+        cached_prompt = system_prompt_cache.get(cache_key)
+        if cached_prompt is not None:
+            self.logger.debug(f"Reusing cached system prompt for agent '{name}'")
+            return cached_prompt
+        
         if is_orchestrator:
             prompt_components = build_agent_system_prompt(
                 name, instructions, agent_tools, 
@@ -194,7 +210,19 @@ class AgentFactory:
                 self.tool_resolver.tool_manager, agent_config, knowledge_descriptions
             )
         
-        return self._format_prompt_components(prompt_components)
+        system_prompt = self._format_prompt_components(prompt_components)
+        system_prompt_cache.put(cache_key, system_prompt)
+        return system_prompt
+    
+    def _get_tool_set(self, agent_tools: List[str]) -> List[Any]:
+        """Get the registered configuration of each agent tool, which its prompt definition is rendered from."""
+        registry = getattr(self.tool_resolver.tool_manager, 'registry', None)
+        if registry is None:
+            return list(agent_tools)
+        return [
+            [tool_name, registry.get(tool_name) is not None, registry.get_config(tool_name)]
+            for tool_name in agent_tools
+        ]
     
     def _get_knowledge_descriptions(self) -> Dict[str, Any]:
         """Get knowledge descriptions from knowledge registry."""
@@ -207,13 +235,9 @@ class AgentFactory:
         
         return {}
     
-    def _format_prompt_components(self, prompt_components: Dict[str, str]) -> str:
+    def _format_prompt_components(self, prompt_components: Dict[str, List[str]]) -> str:
         """Format prompt components into final prompt string."""
-        background = prompt_components["background"]
-        steps = prompt_components["steps"]
-        output_instructions = prompt_components["output_instructions"]
-        
-        return f"{background}\\n\\n{steps}\\n\\n{output_instructions}"
+        return render_system_prompt(prompt_components)
     
     def _resolve_agent_tools(
         self, 
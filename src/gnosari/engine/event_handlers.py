@@ -5,213 +5,125 @@ Event handlers for team streaming operations.
 import logging
 from typing import Dict, Any, AsyncGenerator, Optional
 from openai.types.responses import (
-    ResponseTextDeltaEvent, ResponseTextDoneEvent, ResponseCompletedEvent,
-    ResponseOutputItemAddedEvent, ResponseOutputItemDoneEvent, ResponseOutputMessage,
+    ResponseTextDeltaEvent, ResponseOutputItemDoneEvent,
     ResponseFunctionCallArgumentsDoneEvent, ResponseFunctionWebSearch, ResponseReasoningItem
 )
-from agents import ItemHelpers
+from .stream_events import (
+    StreamEvent, ResponseEvent, ReasoningEvent, ToolCallEvent, ToolResultEvent,
+    AgentUpdatedEvent, MessageOutputEvent, ToolCallArgumentsDoneEvent, RunItemEvent, RawStreamEvent
+)
 
 
 class StreamEventHandler:
-    """Base class for handling stream events from OpenAI Agents SDK."""
+    """Base class for handling stream events from OpenAI Agents SDK.
+    
+    SDK events are translated into structured ``StreamEvent`` objects. Token
+    deltas take a fast path and no nested SDK object is converted to text
+    unless a consumer reads it.
+    """
     
     def __init__(self, current_agent: str):
         self.current_agent = current_agent
         self.logger = logging.getLogger(__name__)
     
-    async def handle_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
+    async def handle_event(self, event) -> AsyncGenerator[StreamEvent, None]:
         """Handle a stream event and yield appropriate responses."""
+        response = self.translate(event)
+        if response is not None:
+            yield response
+    
+    def translate(self, event) -> Optional[StreamEvent]:
+        """Translate an SDK stream event into a structured event.
+        
+        Args:
+            event: Stream event from ``Runner.run_streamed``
+            
+        Returns:
+            StreamEvent, or None if the event produces no output
+        """
+        event_type = getattr(event, 'type', None)
+        
         # Handle different event types based on the example pattern
-        if event.type == "raw_response_event":
-            async for response in self._handle_raw_response_event(event):
-                yield response
-        elif event.type == "agent_updated_stream_event":
-            async for response in self._handle_agent_updated_event(event):
-                yield response
-        elif event.type == "run_item_stream_event":
-            async for response in self._handle_run_item_event(event):
-                yield response
-        elif event.type == "message_output_event":
-            async for response in self._handle_message_output_event(event):
-                yield response
+        if event_type == "raw_response_event":
+            data = getattr(event, 'data', None)
+            # Token deltas are by far the most frequent event
+            if isinstance(data, ResponseTextDeltaEvent):
+                return ResponseEvent(data.delta, self.current_agent, delta=True)
+            return self._translate_raw_response_event(event)
+        elif event_type == "agent_updated_stream_event":
+            return self._translate_agent_updated_event(event)
+        elif event_type == "run_item_stream_event":
+            return self._translate_run_item_event(event)
+        elif event_type == "message_output_event":
+            return MessageOutputEvent(event.item, self.current_agent)
         elif isinstance(event, ResponseFunctionCallArgumentsDoneEvent):
-            async for response in self._handle_function_call_args_done_event(event):
-                yield response
+            return ToolCallArgumentsDoneEvent(event.arguments, event.item_id)
         else:
-            async for response in self._handle_unknown_event(event):
-                yield response
+            return RawStreamEvent(event, self.current_agent)
     
-    async def _handle_raw_response_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle raw response events with text delta data."""
-
-        logging.debug("Received raw response event: %s", str(event))
-        if hasattr(event, 'data') and event.data is not None:
-            if isinstance(event.data, ResponseOutputItemDoneEvent):
-                item = event.data.item
-                
-                # Handle reasoning items specifically
-                if isinstance(item, ResponseReasoningItem):
-                    yield {
-                        "id": item.id,
-                        "type": "reasoning",
-                        "content": getattr(item, 'content', None) or str(item.summary) if item.summary else "",
-                        "agent_name": self.current_agent,
-                        "status": getattr(item, 'status', None),
-                        "item_data": str(item)
-                    }
-                    return
-                
-                # Handle web search items
-                if isinstance(item, ResponseFunctionWebSearch):
-                    yield {
-                        "id": item.id,
-                        "type": "tool_call",
-                        "status": "completed",
-                        "call_id": getattr(item, 'id', f"tool_call_{self.current_agent}"),
-                        "tool_name": 'web_search',
-                        "tool_item": str(item),
-                        "tool_input": {"query": item.action.query},
-                        "agent_name": self.current_agent,
-                        "item_data": str(item),
-                        "arguments": {"query": item.action.query},
-                    }
-                    return
-
-            if isinstance(event.data, ResponseTextDeltaEvent):
-                # Yield response in gnosari_agent format
-                yield {
-                    "id": f"response_{self.current_agent}",
-                    "type": "response",
-                    "content": event.data.delta,
-                    "agent_name": self.current_agent
-                }
+    def _translate_raw_response_event(self, event) -> Optional[StreamEvent]:
+        """Translate raw response events other than text deltas."""
+        self.logger.debug("Received raw response event: %s", event)
+        data = getattr(event, 'data', None)
+        if isinstance(data, ResponseOutputItemDoneEvent):
+            item = data.item
+            
+            # Handle reasoning items specifically
+            if isinstance(item, ResponseReasoningItem):
+                return ReasoningEvent(item, self.current_agent)
+            
+            # Handle web search items
+            if isinstance(item, ResponseFunctionWebSearch):
+                query = {"query": item.action.query}
+                return ToolCallEvent(item.id, 'web_search', query, query, self.current_agent, item, item)
+        return None
     
-    async def _handle_agent_updated_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle agent updated events."""
+    def _translate_agent_updated_event(self, event) -> Optional[StreamEvent]:
+        """Translate agent updated events."""
         if hasattr(event, 'new_agent') and event.new_agent:
             self.logger.info(f"Agent {event.new_agent.name} updated.")
             self.current_agent = event.new_agent.name
-            yield {
-                "type": "agent_updated",
-                "agent_name": event.new_agent.name,
-                "message": f"Agent updated: {event.new_agent.name}"
-            }
+            return AgentUpdatedEvent(event.new_agent.name)
+        return None
     
-    async def _handle_run_item_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle run item events (tool calls, outputs, etc.)."""
-        if hasattr(event, 'item') and event.item:
-            # Handle reasoning items
-            if event.item.type == "reasoning_item" or isinstance(getattr(event.item, 'raw_item', None), ResponseReasoningItem):
-                reasoning_item = getattr(event.item, 'raw_item', event.item)
-                yield {
-                    "id": getattr(reasoning_item, 'id', f"reasoning_{self.current_agent}"),
-                    "type": "reasoning",
-                    "content": getattr(reasoning_item, 'content', None) or str(getattr(reasoning_item, 'summary', [])),
-                    "agent_name": self.current_agent,
-                    "status": getattr(reasoning_item, 'status', None),
-                    "item_data": str(reasoning_item)
-                }
-                return
-                
-            elif event.item.type == "tool_call_item":
-                raw_item = event.item.raw_item
-                if isinstance(raw_item, ResponseFunctionWebSearch):
-                    yield {
-                        "id": getattr(event.item, 'id', f"tool_call_{self.current_agent}"),
-                        "type": "tool_call",
-                        "status": "completed",
-                        "call_id": getattr(event.item, 'id', f"tool_call_{self.current_agent}"),
-                        "tool_name": 'web_search',
-                        "tool_item": str(event.item.raw_item),
-                        "tool_input": getattr(event.item, 'arguments', {}),
-                        "agent_name": self.current_agent,
-                        "item_data": str(event.item),
-                        "arguments": {} # dont know yet how to get the search item
-                    }
-
-                    return
-                yield {
-                    "id": getattr(event.item, 'id', f"tool_call_{self.current_agent}"),
-                    "type": "tool_call",
-                    "status": "completed",
-                    "call_id": getattr(event.item, 'id', f"tool_call_{self.current_agent}"),
-                    "tool_name": getattr(event.item.raw_item, 'name', 'unknown_tool'),
-                    "tool_item": str(event.item.raw_item),
-                    "tool_input": getattr(event.item, 'arguments', {}),
-                    "agent_name": self.current_agent,
-                    "item_data": str(event.item),
-                    "arguments": getattr(event.item.raw_item, 'arguments', {})
-                }
-            elif event.item.type == "tool_call_output_item":
-                # Tool output - yield tool result
-                yield {
-                    "type": "tool_result",
-                    "content": getattr(event.item, 'output', ''),
-                    "agent_name": self.current_agent
-                }
-            elif event.item.type == "message_output_item":
-                # Message output - yield response
-                content = getattr(event.item, 'content', '')
-                if content:
-                    yield {
-                        "type": "response",
-                        "content": content,
-                        "agent_name": self.current_agent
-                    }
-            else:
-                # Other item types - debug output
-                yield {
-                    "type_raw": str(event.item),
-                    "type": str(event.item.type),
-                }
-    
-    async def _handle_message_output_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle message output events."""
-        # For reasoning models, preserve the full item structure to avoid reasoning item errors
-        # For other models, use the text extraction helper
-        try:
-            content = ItemHelpers.text_message_output(event.item)
-        except Exception as e:
-            # If ItemHelpers fails (possibly due to reasoning item dependencies), 
-            # fall back to preserving the full event item
-            self.logger.warning(f"ItemHelpers.text_message_output failed: {e}, preserving full item")
-            content = str(event.item)
+    def _translate_run_item_event(self, event) -> Optional[StreamEvent]:
+        """Translate run item events (tool calls, outputs, etc.)."""
+        item = getattr(event, 'item', None)
+        if not item:
+            return None
         
-        yield {
-            "type": "message_output",
-            "agent_name": self.current_agent,
-            "content": content,
-            "item": str(event.item)
-        }
-    
-    async def _handle_function_call_args_done_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle function call arguments done events."""
-        yield {
-            "type": "tool_call_arguments_done",
-            "arguments": event.arguments,
-            "item_id": event.item_id
-        }
-    
-    async def _handle_unknown_event(self, event) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle unknown or unsupported event types."""
-        # Check if event has data attribute before processing
-        if not hasattr(event, 'data') or event.data is None:
-            # Event without data - just yield basic event info
-            yield {
-                "type": "event_without_data",
-                "event_type": event.type,
-                "agent_name": self.current_agent,
-                "message": "Event received but no data available",
-                "data": str(event)
-            }
+        # Handle reasoning items
+        if item.type == "reasoning_item" or isinstance(getattr(item, 'raw_item', None), ResponseReasoningItem):
+            return ReasoningEvent(getattr(item, 'raw_item', item), self.current_agent)
+        
+        elif item.type == "tool_call_item":
+            raw_item = item.raw_item
+            call_id = getattr(item, 'id', f"tool_call_{self.current_agent}")
+            if isinstance(raw_item, ResponseFunctionWebSearch):
+                # dont know yet how to get the search item arguments
+                return ToolCallEvent(call_id, 'web_search', getattr(item, 'arguments', {}), {},
+                                     self.current_agent, item, raw_item)
+            return ToolCallEvent(
+                call_id,
+                getattr(raw_item, 'name', 'unknown_tool'),
+                getattr(item, 'arguments', {}),
+                getattr(raw_item, 'arguments', {}),
+                self.current_agent,
+                item,
+                raw_item
+            )
+        elif item.type == "tool_call_output_item":
+            # Tool output - yield tool result
+            return ToolResultEvent(getattr(item, 'output', ''), self.current_agent)
+        elif item.type == "message_output_item":
+            # Message output - yield response
+            content = getattr(item, 'content', '')
+            if content:
+                return ResponseEvent(content, self.current_agent)
+            return None
         else:
-            # Unknown event type
-            yield {
-                "type": "unknown",
-                "event_type": event.type,
-                "agent_name": self.current_agent,
-                "data": str(event)
-            }
+            # Other item types - debug output
+            return RunItemEvent(item)
 
 
 class ErrorHandler:
@@ -1,6 +1,8 @@
 """Knowledge base loading functionality."""
 
+import asyncio
 import logging
+import os
 from typing import List, Dict, Any, Optional
 
 from ...knowledge import KnowledgeManager
@@ -8,13 +10,22 @@ from .knowledge_registry import KnowledgeRegistry
 
 
 class KnowledgeLoader:
-    """Handles loading and initialization of knowledge bases."""
+    """Handles loading and initialization of knowledge bases.
+
+    Knowledge bases are ingested concurrently, but the data items of one
+    base are added one at a time since a base's vector store is not safe
+    for concurrent writes. A semaphore bounds how many bases ingest at
+    once (GNOSARI_KNOWLEDGE_LOAD_CONCURRENCY, default 4).
+    """
     
-    def __init__(self, knowledge_registry: KnowledgeRegistry = None, progress_callback=None):
+    def __init__(self, knowledge_registry: KnowledgeRegistry = None, progress_callback=None,
+                 max_concurrency: Optional[int] = None):
         self.knowledge_registry = knowledge_registry or KnowledgeRegistry()
         self.knowledge_manager: Optional[KnowledgeManager] = None
         self.progress_callback = progress_callback
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv("GNOSARI_KNOWLEDGE_LOAD_CONCURRENCY", "4")))
         self.logger = logging.getLogger(__name__)
+        self._ingest_semaphore: Optional[asyncio.Semaphore] = None
     
     def ensure_knowledge_manager(self):
         """Ensure knowledge manager is initialized."""
@@ -24,6 +35,13 @@ class KnowledgeLoader:
             except ImportError as e:
                 self.logger.warning(f"Knowledge manager not available: {e}")
     
+    def _report_progress(self, message: str) -> None:
+        """Send a progress message to the progress callback, or the log."""
+        if self.progress_callback:
+            self.progress_callback(message)
+        else:
+            self.logger.info(message)
+    
     async def load_knowledge_bases(self, knowledge_config: List[Dict[str, Any]]) -> None:
         """
         Load knowledge bases from configuration.
@@ -36,39 +54,43 @@ class KnowledgeLoader:
             self.logger.warning("Knowledge manager not available, skipping knowledge base loading")
             return
         
-        # Show initialization indicator if there are knowledge bases to load
-        if knowledge_config:
-            message = "Initializing knowledge bases..."
-            if self.progress_callback:
-                self.progress_callback(message)
-            else:
-                print(message, flush=True)
+        if not knowledge_config:
+            return
         
+        # Reject invalid configurations before any ingestion starts
         for kb_config in knowledge_config:
+            self._validate_knowledge_config(kb_config)
+        
+        self._report_progress("Initializing knowledge bases...")
+        self._ingest_semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        total = len(knowledge_config)
+        completed = 0
+        
+        async def load(kb_config: Dict[str, Any]) -> None:
+            nonlocal completed
             await self._load_single_knowledge_base(kb_config)
+            completed += 1
+            if total > 1:
+                self._report_progress(f"Loaded knowledge source {kb_config.get('name')} ({completed}/{total})")
+        
+        await asyncio.gather(*(load(kb_config) for kb_config in knowledge_config))
+    
+    def _validate_knowledge_config(self, kb_config: Dict[str, Any]) -> None:
+        """Check that a knowledge base configuration has its required fields."""
+        for field in ('type', 'id', 'name'):
+            if not kb_config.get(field):
+                error_msg = f"Invalid knowledge base configuration - missing required '{field}': {kb_config}"
+                self.logger.error(error_msg)
+                raise ValueError(error_msg)
     
     async def _load_single_knowledge_base(self, kb_config: Dict[str, Any]) -> None:
         """Load a single knowledge base from configuration."""
+        self._validate_knowledge_config(kb_config)
         name = kb_config.get('name')
         kb_type = kb_config.get('type')
         kb_id = kb_config.get('id')
         
-        # Validate required fields
-        if not kb_type:
-            error_msg = f"Invalid knowledge base configuration - missing required 'type': {kb_config}"
-            self.logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        if not kb_id:
-            error_msg = f"Invalid knowledge base configuration - missing required 'id': {kb_config}"
-            self.logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        if not name:
-            error_msg = f"Invalid knowledge base configuration - missing required 'name': {kb_config}"
-            self.logger.error(error_msg)
-            raise ValueError(error_msg)
-        
         # Store knowledge description if provided
         description = kb_config.get('description')
         if description:
@@ -87,11 +109,7 @@ class KnowledgeLoader:
                 return
             
             # Show loading indicator
-            message = f"Loading Knowledge Source {name}..."
-            if self.progress_callback:
-                self.progress_callback(message)
-            else:
-                print(message, flush=True)
+            self._report_progress(f"Loading Knowledge Source {name}...")
             self.logger.info(f"Loading Knowledge Source {name} (ID: {kb_id})...")
             
             # Create knowledge base using ID as the primary identifier
@@ -117,16 +135,28 @@ class KnowledgeLoader:
             self.logger.error(f"Failed to load knowledge base '{name}' (ID: {kb_id}): {e}")
     
     async def _add_data_to_knowledge_base(self, kb_key: str, data: Any) -> None:
-        """Add data to a knowledge base."""
+        """Add data to a knowledge base, ingesting its items one at a time."""
         # Always treat data as a list for consistency
         if isinstance(data, list):
             data_list = data
         else:
             data_list = [data]
         
-        # Add each data item to the knowledge base
-        for item in data_list:
-            await self.knowledge_manager.add_data_to_knowledge_base(kb_key, item)
+        semaphore = self._ingest_semaphore or asyncio.Semaphore(self.max_concurrency)
+        
+        errors = []
+        async with semaphore:
+            for item in data_list:
+                try:
+                    await self.knowledge_manager.add_data_to_knowledge_base(kb_key, item)
+                except Exception as e:
+                    self.logger.error(f"Failed to add data to knowledge base '{kb_key}': {e}")
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+        
+        # Drop content from data items removed from the configuration
+        await self.knowledge_manager.prune_knowledge_base(kb_key, [item for item in data_list if isinstance(item, str)])
     
     def add_knowledge_tools(self, agent_tools: List[str], knowledge_names: List[str]) -> List[str]:
         """
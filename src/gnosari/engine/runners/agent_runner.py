@@ -27,6 +27,14 @@ class AgentRunner(BaseRunner):
         Returns:
             Dict with agent outputs
         """
+        async with self._admit(agent.name):
+            return await self._run_agent_until_done_async(agent, message, session_id, session_context, max_turns)
+    
+    async def _run_agent_until_done_async(self, agent, message: str, 
+                                         session_id: Optional[str] = None, 
+                                         session_context: Optional[Dict[str, Any]] = None, 
+                                         max_turns: Optional[int] = None) -> Dict[str, Any]:
+        """Run the agent once the run has been admitted."""
         mcp_manager = MCPServerManager()
         await mcp_manager.connect_servers([agent])
 
@@ -69,7 +77,7 @@ class AgentRunner(BaseRunner):
                 "is_done": True
             }
         finally:
-            await self.cleanup_manager.cleanup_all(session, mcp_manager, [agent])
+            await self._cleanup_run(session, mcp_manager, [agent])
     
     async def run_single_agent_stream(self, agent_name: str, message: str, 
                                      debug: bool = False, 
@@ -89,6 +97,18 @@ class AgentRunner(BaseRunner):
         Yields:
             Dict: Stream outputs (response chunks, tool calls, etc.)
         """
+        async for response in self._admitted_stream(
+            agent_name,
+            lambda: self._run_single_agent_stream(agent_name, message, debug, session_id, session_context, max_turns)
+        ):
+            yield response
+    
+    async def _run_single_agent_stream(self, agent_name: str, message: str, 
+                                      debug: bool = False, 
+                                      session_id: Optional[str] = None, 
+                                      session_context: Optional[Dict[str, Any]] = None, 
+                                      max_turns: Optional[int] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream the agent run once it has been admitted."""
         # Get the target agent
         target_agent = self.team.get_agent(agent_name)
         if not target_agent:
@@ -146,12 +166,8 @@ class AgentRunner(BaseRunner):
             
             self.logger.info(f"Starting to process streaming events for agent: {agent_name}")
             
-            async for event in result.stream_events():
-                self.logger.debug(f"Received event: {event.type}")
-                
-                # Use event handler to process events
-                async for response in event_handler.handle_event(event):
-                    yield response
+            async for response in self._process_stream(result, event_handler):
+                yield response
 
             # Yield final completion
             yield {
@@ -169,4 +185,4 @@ class AgentRunner(BaseRunner):
             yield error_response
             raise e
         finally:
-            await self.cleanup_manager.cleanup_all(session, mcp_manager, [target_agent])
\ No newline at end of file
+            await self._cleanup_run(session, mcp_manager, [target_agent])
\ No newline at end of file
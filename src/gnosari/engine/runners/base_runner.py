@@ -3,15 +3,27 @@ Base runner with common functionality
 """
 
 import logging
-from typing import Optional, Dict, Any
+import os
+from contextlib import aclosing, asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List
 from agents import RunConfig
+from ...core.admission import admission_controller
+from ...core.exceptions import AdmissionRejectedError
 from ...core.team import Team
 from ...schemas import SessionContext
+from ..event_handlers import StreamEventHandler, ErrorHandler, MCPServerManager
+from ..stream_events import StreamEvent
 from .session_manager import SessionManager
 from .cleanup_manager import CleanupManager
+from .stream_buffer import StreamBuffer, POLICIES
+from .delta_coalescer import coalesce_deltas
 
 logger = logging.getLogger(__name__)
 
+# Number of admitted runs in the current context; delegations run nested in their parent's run
+_run_depth: ContextVar[int] = ContextVar("gnosari_run_depth", default=0)
+
 
 class BaseRunner:
     """Base class for all runners with common functionality."""
@@ -21,6 +33,128 @@ class BaseRunner:
         self.logger = logging.getLogger(__name__)
         self.session_manager = SessionManager()
         self.cleanup_manager = CleanupManager()
+        # Buffering between the model stream and the consumer (0 disables it)
+        self.stream_buffer_size = int(os.getenv("GNOSARI_STREAM_BUFFER_SIZE", "0"))
+        self.stream_buffer_policy = os.getenv("GNOSARI_STREAM_BUFFER_POLICY", "block").lower()
+        self.last_stream_stats: Optional[Dict[str, Any]] = None
+        # Coalescing of consecutive token deltas (0 ms disables it)
+        self.coalesce_delay_ms = float(os.getenv("GNOSARI_STREAM_COALESCE_MS", "0"))
+        self.coalesce_max_chars = int(os.getenv("GNOSARI_STREAM_COALESCE_CHARS", "512"))
+        # Keep sessions and MCP connections open across runs
+        self.keep_alive = False
+    
+    def configure_stream_buffer(self, max_size: int, policy: str = "block"):
+        """Configure the bounded buffer used by streaming runs.
+        
+        Args:
+            max_size: Maximum number of buffered events (0 disables buffering)
+            policy: Behaviour when the buffer is full: block, coalesce or drop
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown stream buffer policy '{policy}'. Valid policies: {', '.join(POLICIES)}")
+        self.stream_buffer_size = max_size
+        self.stream_buffer_policy = policy
+    
+    def configure_delta_coalescing(self, max_delay_ms: float, max_chars: int = 512):
+        """Configure merging of consecutive token deltas in streaming runs.
+        
+        Args:
+            max_delay_ms: Maximum age of a merged chunk in milliseconds (0 disables coalescing)
+            max_chars: Maximum size of a merged chunk in characters
+        """
+        self.coalesce_delay_ms = max_delay_ms
+        self.coalesce_max_chars = max_chars
+    
+    def set_keep_alive(self, keep_alive: bool = True):
+        """Keep sessions and MCP server connections open between runs.
+        
+        Resources are then released by ``close()`` instead of after each run.
+        
+        Args:
+            keep_alive: Whether resources outlive a run
+        """
+        self.keep_alive = keep_alive
+        self.session_manager.enable_session_reuse(keep_alive)
+    
+    async def close(self):
+        """Release sessions and MCP server connections kept open between runs."""
+        await self.session_manager.close_sessions()
+        agents = [self.team.orchestrator] + list(self.team.workers.values())
+        await self.cleanup_manager.cleanup_mcp_servers(MCPServerManager(), agents)
+    
+    async def close_idle_sessions(self, max_idle: float) -> int:
+        """Close sessions kept open between runs that were unused for a while.
+        
+        Args:
+            max_idle: Seconds without use after which a session is closed
+            
+        Returns:
+            Number of closed sessions
+        """
+        return await self.session_manager.close_sessions(max_idle)
+    
+    async def _cleanup_run(self, session, mcp_manager: MCPServerManager, agents: List) -> None:
+        """Release the resources of a finished run, keeping them open in keep-alive mode.
+        
+        In keep-alive mode interactive bash sessions are left alone too: the
+        process-wide registry holds the sessions of every conversation served
+        by the runner, so cleaning it up after one run would kill the others'.
+        They expire after their idle timeout or are closed at shutdown. Nested
+        runs (delegations) never clean up the registry either; that is left to
+        the outermost run, which knows whether it is kept alive.
+        
+        Args:
+            session: Session used by the run
+            mcp_manager: MCP server manager of the run
+            agents: Agents whose MCP servers were connected
+        """
+        if self.keep_alive:
+            return
+        nested = _run_depth.get() > 1
+        await self.cleanup_manager.cleanup_all(session, mcp_manager, agents, interactive_bash=not nested)
+    
+    @asynccontextmanager
+    async def _admit(self, agent_name: str) -> AsyncIterator[None]:
+        """Admit a run starting at an agent under the team and agent concurrency limits.
+        
+        Args:
+            agent_name: Agent the run starts with
+            
+        Yields:
+            While the run holds its slots
+        """
+        async with admission_controller.admit_run(self.team.name, agent_name, self.team.original_config):
+            token = _run_depth.set(_run_depth.get() + 1)
+            try:
+                yield
+            finally:
+                _run_depth.reset(token)
+    
+    async def _admitted_stream(self, agent_name: str,
+                               start_stream: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        """Stream a run once it has been admitted.
+        
+        A rejected run yields an error event before raising, like a failed run.
+        
+        Args:
+            agent_name: Agent the run starts with
+            start_stream: Function starting the run's stream
+            
+        Yields:
+            Stream outputs of the run
+        """
+        admitted = False
+        try:
+            async with self._admit(agent_name):
+                admitted = True
+                async with aclosing(start_stream()) as events:
+                    async for event in events:
+                        yield event
+        except AdmissionRejectedError as e:
+            if admitted:
+                raise
+            yield ErrorHandler(agent_name).handle_error(e)
+            raise
     
     def set_custom_session_provider(self, provider_factory):
         """Set a custom session provider factory function.
@@ -30,6 +164,67 @@ class BaseRunner:
         """
         self.session_manager.set_custom_session_provider(provider_factory)
     
+    async def _translate_stream(self, result, event_handler: StreamEventHandler) -> AsyncIterator[StreamEvent]:
+        """Translate the SDK events of a streamed run.
+        
+        Args:
+            result: Streamed run result
+            event_handler: Handler translating SDK events
+            
+        Yields:
+            Structured stream events
+        """
+        async for event in result.stream_events():
+            self.logger.debug("Received event: %s", event.type)
+            response = event_handler.translate(event)
+            if response is not None:
+                yield response
+    
+    def _process_stream(self, result, event_handler: StreamEventHandler) -> AsyncIterator[Any]:
+        """Build the event pipeline of a streamed run: translate, coalesce, buffer.
+        
+        Args:
+            result: Streamed run result
+            event_handler: Handler translating SDK events
+            
+        Returns:
+            Stream of events for the consumer
+        """
+        events = self._translate_stream(result, event_handler)
+        if self.coalesce_delay_ms > 0:
+            events = coalesce_deltas(events, self.coalesce_delay_ms / 1000, self.coalesce_max_chars)
+        return self._buffer_stream(events)
+    
+    def _buffer_stream(self, events: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Relay a stream through a bounded buffer when buffering is enabled.
+        
+        Args:
+            events: Source event stream
+            
+        Returns:
+            The buffered stream, or the source stream if buffering is disabled
+        """
+        if self.stream_buffer_size <= 0:
+            return events
+        
+        buffer = StreamBuffer(self.stream_buffer_size, self.stream_buffer_policy)
+        self.last_stream_stats = buffer.get_stats()
+        
+        async def relay():
+            try:
+                async for event in buffer.stream(events):
+                    yield event
+            finally:
+                self.last_stream_stats = buffer.get_stats()
+                stats = self.last_stream_stats
+                if stats["coalesced"] or stats["dropped"]:
+                    self.logger.info(
+                        f"📦 Stream buffer under pressure: max depth {stats['max_depth']}/{stats['max_size']}, "
+                        f"{stats['coalesced']} deltas coalesced, {stats['dropped']} events dropped"
+                    )
+        
+        return relay()
+    
     def _create_run_config(self, workflow_name: Optional[str] = None) -> RunConfig:
         """Create a run configuration.
         
@@ -53,16 +53,19 @@ class CleanupManager:
     
     async def cleanup_all(self, session: Optional[SessionABC] = None, 
                          mcp_manager: Optional[MCPServerManager] = None, 
-                         agents: Optional[List] = None) -> None:
+                         agents: Optional[List] = None,
+                         interactive_bash: bool = True) -> None:
         """Perform comprehensive cleanup of all resources.
         
         Args:
             session: Session to cleanup
             mcp_manager: MCP server manager
             agents: Agents whose MCP servers need cleanup
+            interactive_bash: Also clean up the process-wide interactive bash sessions
         """
         # Clean up interactive bash sessions first
-        await self.cleanup_interactive_bash_sessions()
+        if interactive_bash:
+            await self.cleanup_interactive_bash_sessions()
         
         # Clean up session resources
         if session:
@@ -26,6 +26,34 @@ class CompositeTeamRunner:
         self.agent_runner.set_custom_session_provider(provider_factory)
         self.voice_runner.set_custom_session_provider(provider_factory)
     
+    def set_keep_alive(self, keep_alive: bool = True):
+        """Keep sessions and MCP server connections open between runs for all runners."""
+        self.team_runner.set_keep_alive(keep_alive)
+        self.agent_runner.set_keep_alive(keep_alive)
+        self.voice_runner.set_keep_alive(keep_alive)
+    
+    async def close(self):
+        """Release resources kept open between runs."""
+        for runner in (self.team_runner, self.agent_runner, self.voice_runner):
+            await runner.close()
+    
+    async def close_idle_sessions(self, max_idle: float) -> int:
+        """Close sessions of all runners unused for ``max_idle`` seconds."""
+        closed = 0
+        for runner in (self.team_runner, self.agent_runner, self.voice_runner):
+            closed += await runner.close_idle_sessions(max_idle)
+        return closed
+    
+    def configure_stream_buffer(self, max_size: int, policy: str = "block"):
+        """Configure the bounded stream buffer for the team and agent runners."""
+        self.team_runner.configure_stream_buffer(max_size, policy)
+        self.agent_runner.configure_stream_buffer(max_size, policy)
+    
+    def configure_delta_coalescing(self, max_delay_ms: float, max_chars: int = 512):
+        """Configure token delta coalescing for the team and agent runners."""
+        self.team_runner.configure_delta_coalescing(max_delay_ms, max_chars)
+        self.agent_runner.configure_delta_coalescing(max_delay_ms, max_chars)
+    
     # Team execution methods
     async def run_team_async(self, message: str, debug: bool = False, 
                             session_id: Optional[str] = None, 
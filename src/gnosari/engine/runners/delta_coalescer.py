@@ -0,0 +1,97 @@
+"""
+Coalescing of consecutive token deltas.
+
+Merges consecutive text deltas of the same agent into one delta event,
+flushed when the chunk is ``max_delay`` seconds old, reaches ``max_chars``
+characters, or another event (or agent) arrives. Consumers that pay per
+event (redraws, network sends) trade a bounded amount of latency for far
+fewer events.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, List, Optional
+
+from ..stream_events import ResponseEvent
+
+logger = logging.getLogger(__name__)
+
+
+def _is_text_delta(event: Any) -> bool:
+    return isinstance(event, ResponseEvent) and event.is_delta and isinstance(event.content, str)
+
+
+async def coalesce_deltas(events: AsyncIterator[Any], max_delay: float = 0.03,
+                          max_chars: int = 512) -> AsyncIterator[Any]:
+    """Merge consecutive text deltas of the same agent.
+
+    Args:
+        events: Source event stream
+        max_delay: Maximum age in seconds of a chunk before it is flushed
+        max_chars: Maximum chunk size in characters
+
+    Yields:
+        Source events, with runs of text deltas merged into chunks
+    """
+    loop = asyncio.get_running_loop()
+    iterator = events.__aiter__()
+    parts: List[str] = []
+    size = 0
+    agent_name: Optional[str] = None
+    deadline = 0.0
+    next_event: Optional[asyncio.Future] = None
+
+    def flush() -> ResponseEvent:
+        nonlocal size
+        chunk = ResponseEvent("".join(parts), agent_name, delta=True)
+        parts.clear()
+        size = 0
+        return chunk
+
+    try:
+        while True:
+            try:
+                if not parts:
+                    # Nothing pending: no deadline to watch
+                    if next_event is not None:
+                        event, next_event = await next_event, None
+                    else:
+                        event = await iterator.__anext__()
+                else:
+                    if next_event is None:
+                        next_event = asyncio.ensure_future(iterator.__anext__())
+                    done, _ = await asyncio.wait({next_event}, timeout=max(0.0, deadline - loop.time()))
+                    if not done:
+                        yield flush()
+                        continue
+                    event, next_event = next_event.result(), None
+            except StopAsyncIteration:
+                break
+            except Exception:
+                next_event = None
+                if parts:
+                    yield flush()
+                raise
+
+            if _is_text_delta(event):
+                if parts and event.agent_name != agent_name:
+                    yield flush()
+                if not parts:
+                    agent_name = event.agent_name
+                    deadline = loop.time() + max_delay
+                parts.append(event.content)
+                size += len(event.content)
+                if size >= max_chars:
+                    yield flush()
+                continue
+
+            if parts:
+                yield flush()
+            yield event
+
+        if parts:
+            yield flush()
+    finally:
+        if next_event is not None and not next_event.done():
+            next_event.cancel()
+            await asyncio.gather(next_event, return_exceptions=True)
@@ -3,6 +3,7 @@ Session lifecycle management for runners
 """
 
 import logging
+import time
 from typing import Optional, Dict, Any
 from agents.memory.session import SessionABC
 
@@ -15,6 +16,17 @@ class SessionManager:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._custom_session_provider = None
+        # Sessions kept open across runs when reuse is enabled: session_id -> (session, last_used)
+        self._reuse_sessions = False
+        self._sessions: Dict[str, Any] = {}
+    
+    def enable_session_reuse(self, enabled: bool = True):
+        """Keep sessions open across runs instead of creating one per run.
+        
+        Args:
+            enabled: Whether sessions are reused
+        """
+        self._reuse_sessions = enabled
     
     def set_custom_session_provider(self, provider_factory):
         """Set a custom session provider factory function.
@@ -38,6 +50,18 @@ class SessionManager:
             self.logger.info("No session_id provided - running without persistent memory")
             return None
         
+        if self._reuse_sessions and session_id in self._sessions:
+            session, _ = self._sessions[session_id]
+            self._sessions[session_id] = (session, time.monotonic())
+            return session
+        
+        session = self._create_session(session_id, session_context)
+        if self._reuse_sessions and session is not None:
+            self._sessions[session_id] = (session, time.monotonic())
+        return session
+    
+    def _create_session(self, session_id: str, session_context: Optional[Dict[str, Any]] = None) -> Optional[SessionABC]:
+        """Create a new session from the custom provider or the environment configuration."""
         # Use custom session provider if set
         if self._custom_session_provider:
             try:
@@ -68,4 +92,23 @@ class SessionManager:
                 await session.cleanup()
                 self.logger.debug(f"Cleaned up session")
             except Exception as e:
-                self.logger.error(f"Error cleaning up session: {e}")
\ No newline at end of file
+                self.logger.error(f"Error cleaning up session: {e}")
+    
+    async def close_sessions(self, max_idle: Optional[float] = None) -> int:
+        """Clean up sessions kept open for reuse.
+        
+        Args:
+            max_idle: Only close sessions unused for this many seconds (None closes all)
+            
+        Returns:
+            Number of sessions closed
+        """
+        now = time.monotonic()
+        expired = [
+            session_id for session_id, (_, last_used) in self._sessions.items()
+            if max_idle is None or now - last_used >= max_idle
+        ]
+        for session_id in expired:
+            session, _ = self._sessions.pop(session_id)
+            await self.cleanup_session(session)
+        return len(expired)
@@ -0,0 +1,179 @@
+"""
+Bounded buffering between the model stream and a stream consumer.
+
+A producer task drains the SDK event stream into a bounded buffer while the
+consumer reads from it at its own pace. When the buffer is full the policy
+decides what happens:
+
+- ``block``: the producer waits for the consumer (nothing is lost)
+- ``coalesce``: consecutive token deltas of the same agent are merged into
+  the newest buffered delta; other events wait for space
+- ``drop``: like ``coalesce``, and low-priority events (debug and unknown
+  events) are dropped to make room
+
+With ``coalesce`` and ``drop`` memory per stream stays bounded however slow
+the consumer is.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from ..stream_events import ResponseEvent
+
+logger = logging.getLogger(__name__)
+
+BLOCK = "block"
+COALESCE = "coalesce"
+DROP = "drop"
+POLICIES = (BLOCK, COALESCE, DROP)
+
+# Events that carry no information a client needs to render the conversation
+LOW_PRIORITY_TYPES = frozenset({"unknown", "event_without_data", "tool_call_arguments_done"})
+
+_END = object()
+
+
+def is_low_priority(event: Any) -> bool:
+    """Check whether an event may be dropped under the ``drop`` policy."""
+    return isinstance(event, dict) and event.get("type") in LOW_PRIORITY_TYPES
+
+
+class StreamBuffer:
+    """Bounded event buffer with a backpressure policy and depth metrics."""
+
+    def __init__(self, max_size: int = 256, policy: str = BLOCK):
+        """Initialize the stream buffer.
+
+        Args:
+            max_size: Maximum number of buffered events
+            policy: What to do when the buffer is full: block, coalesce or drop
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown stream buffer policy '{policy}'. Valid policies: {', '.join(POLICIES)}")
+        self.max_size = max(1, max_size)
+        self.policy = policy
+        self._events: Deque[Any] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._error: Optional[BaseException] = None
+        self._stats = {
+            "received": 0,
+            "delivered": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "max_depth": 0,
+            "producer_wait_seconds": 0.0
+        }
+
+    @property
+    def depth(self) -> int:
+        """Number of events currently buffered."""
+        return len(self._events)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics.
+
+        Returns:
+            Dict with event counts, current and maximum depth and producer wait time
+        """
+        return {"policy": self.policy, "max_size": self.max_size, "depth": self.depth, **self._stats}
+
+    def _append(self, event: Any) -> None:
+        self._events.append(event)
+        self._stats["max_depth"] = max(self._stats["max_depth"], len(self._events))
+        self._readable.set()
+        if len(self._events) >= self.max_size:
+            self._writable.clear()
+
+    def _try_make_room(self, event: Any) -> bool:
+        """Apply the policy to a full buffer. Returns True if the event was absorbed."""
+        if self.policy == BLOCK:
+            return False
+
+        # Merge token deltas into the newest buffered delta of the same agent
+        if isinstance(event, ResponseEvent) and event.is_delta and self._events:
+            tail = self._events[-1]
+            if isinstance(tail, ResponseEvent) and tail.is_delta and tail.agent_name == event.agent_name:
+                self._events[-1] = ResponseEvent(tail.content + event.content, event.agent_name, delta=True)
+                self._stats["coalesced"] += 1
+                return True
+
+        if self.policy == DROP:
+            if is_low_priority(event):
+                self._stats["dropped"] += 1
+                return True
+            for index, queued in enumerate(self._events):
+                if is_low_priority(queued):
+                    del self._events[index]
+                    self._stats["dropped"] += 1
+                    self._append(event)
+                    return True
+        return False
+
+    async def put(self, event: Any) -> None:
+        """Add an event, applying the policy when the buffer is full.
+
+        Args:
+            event: Stream event
+        """
+        self._stats["received"] += 1
+        while len(self._events) >= self.max_size:
+            if self._try_make_room(event):
+                return
+            started = time.monotonic()
+            await self._writable.wait()
+            self._stats["producer_wait_seconds"] += time.monotonic() - started
+        self._append(event)
+
+    async def get(self) -> Any:
+        """Take the oldest event, waiting until one is available."""
+        while not self._events:
+            self._readable.clear()
+            await self._readable.wait()
+        event = self._events.popleft()
+        if len(self._events) < self.max_size:
+            self._writable.set()
+        return event
+
+    async def _produce(self, events: AsyncIterator[Any]) -> None:
+        try:
+            async for event in events:
+                await self.put(event)
+        except Exception as e:
+            self._error = e
+        finally:
+            # The end marker may exceed max_size by one so it is never lost
+            self._events.append(_END)
+            self._readable.set()
+
+    async def stream(self, events: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Relay events through the buffer.
+
+        The source is consumed by a background task; errors it raises are
+        re-raised to the consumer after the events buffered before them.
+
+        Args:
+            events: Source event stream
+
+        Yields:
+            Events in order, subject to the buffer policy
+        """
+        producer = asyncio.create_task(self._produce(events))
+        try:
+            while True:
+                event = await self.get()
+                if event is _END:
+                    break
+                self._stats["delivered"] += 1
+                yield event
+            if self._error is not None:
+                raise self._error
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            logger.debug(f"Stream buffer finished: {self.get_stats()}")
@@ -28,6 +28,14 @@ class TeamRunner(BaseRunner):
         Returns:
             Dict with outputs and completion status
         """
+        async with self._admit(self.team.orchestrator.name):
+            return await self._run_team_async(message, debug, session_id, session_context, max_turns)
+    
+    async def _run_team_async(self, message: str, debug: bool = False, 
+                             session_id: Optional[str] = None, 
+                             session_context: Optional[Dict[str, Any]] = None, 
+                             max_turns: Optional[int] = None) -> Dict[str, Any]:
+        """Run the team once the run has been admitted."""
         if debug:
             self.logger.info(f"Contacting {self.team.orchestrator.name}")
         
@@ -77,7 +85,7 @@ class TeamRunner(BaseRunner):
                 "is_done": True
             }
         finally:
-            await self.cleanup_manager.cleanup_all(session, mcp_manager, all_agents)
+            await self._cleanup_run(session, mcp_manager, all_agents)
     
     def run_team(self, message: str, debug: bool = False, 
                 session_id: Optional[str] = None, 
@@ -101,6 +109,17 @@ class TeamRunner(BaseRunner):
         Yields:
             Dict: Stream outputs (response chunks, tool calls, handoffs, etc.)
         """
+        async for response in self._admitted_stream(
+            self.team.orchestrator.name,
+            lambda: self._run_team_stream(message, debug, session_id, session_context, max_turns)
+        ):
+            yield response
+    
+    async def _run_team_stream(self, message: str, debug: bool = False, 
+                              session_id: Optional[str] = None, 
+                              session_context: Optional[Dict[str, Any]] = None, 
+                              max_turns: Optional[int] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream the team run once it has been admitted."""
         self.logger.info(f"Contacting {self.team.orchestrator.name}")
         
         # Initialize handlers
@@ -149,16 +168,11 @@ class TeamRunner(BaseRunner):
             
             self.logger.info("Starting to process streaming events...")
             
-            async for event in result.stream_events():
-                self.logger.debug(f"Received event: {event.type}. Item: {event}")
-                
-                # Use event handler to process events
-                async for response in event_handler.handle_event(event):
-                    # Update current agent if changed
-                    if response.get('type') == 'agent_updated':
-                        current_agent = response.get('agent_name', current_agent)
-                        event_handler.current_agent = current_agent
-                    yield response
+            async for response in self._process_stream(result, event_handler):
+                yield response
+            
+            # The handler follows handoffs while translating events
+            current_agent = event_handler.current_agent
 
             # Yield final completion
             yield {
@@ -175,4 +189,4 @@ class TeamRunner(BaseRunner):
             yield error_response
             raise e
         finally:
-            await self.cleanup_manager.cleanup_all(session, mcp_manager, all_agents)
\ No newline at end of file
+            await self._cleanup_run(session, mcp_manager, all_agents)
\ No newline at end of file
@@ -201,7 +201,7 @@ class VoiceRunner(BaseRunner):
             }
             raise e
         finally:
-            await self.cleanup_manager.cleanup_all(session, mcp_manager, all_agents)
+            await self._cleanup_run(session, mcp_manager, all_agents)
     
     async def run_single_agent_voice_stream(self, agent_name: str, audio_buffer: np.ndarray, 
                                            debug: bool = False, 
@@ -268,4 +268,4 @@ class VoiceRunner(BaseRunner):
             }
             raise e
         finally:
-            await self.cleanup_manager.cleanup_all(session, mcp_manager, [target_agent])
\ No newline at end of file
+            await self._cleanup_run(session, mcp_manager, [target_agent])
\ No newline at end of file
@@ -0,0 +1,329 @@
+"""
+Warm team runtime.
+
+Keeps built teams resident between turns of a conversation, so follow-up
+messages skip team building, MCP server connection and session setup. By
+default each resident team belongs to one (configuration, session) pair;
+with ``session_scoped=False`` one team per configuration serves every
+session (as in ``gnosari serve``). Teams idle for longer than
+``idle_timeout`` are evicted, and at most ``max_teams`` stay resident
+(least recently used idle teams are evicted first).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, Optional
+
+from ..core.cache import ContentHasher
+from ..core.team import Team
+from .builder import TeamBuilder
+from .event_handlers import MCPServerManager
+from .runners import CompositeTeamRunner
+
+logger = logging.getLogger(__name__)
+
+
+class WarmTeam:
+    """A built team kept resident between turns.
+
+    MCP server connections are bound to the task that opened them (their
+    anyio cancel scopes must be exited by the same task), so each team has
+    an owner task that builds it, connects its MCP servers and, once the
+    team is closed, releases them again. Turns run in their own tasks and
+    find the servers already connected.
+    """
+
+    def __init__(self, key: str, builder: TeamBuilder):
+        self.key = key
+        self.builder = builder
+        self.team: Optional[Team] = None
+        self.runner: Optional[CompositeTeamRunner] = None
+        self.last_used = time.monotonic()
+        self.active_turns = 0
+        self._owner: Optional[asyncio.Task] = None
+        self._close_requested = asyncio.Event()
+
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the team was last used."""
+        return time.monotonic() - self.last_used
+
+    async def open(self, config_path: str, create_runner: Callable[[Team], CompositeTeamRunner]) -> None:
+        """Build the team and connect its MCP servers in the team's owner task.
+
+        Args:
+            config_path: Path to the team configuration
+            create_runner: Function creating the runner of the built team
+        """
+        ready = asyncio.get_running_loop().create_future()
+        self._owner = asyncio.create_task(self._own(config_path, create_runner, ready))
+        await ready
+
+    async def _own(self, config_path: str, create_runner: Callable[[Team], CompositeTeamRunner],
+                   ready: asyncio.Future) -> None:
+        try:
+            self.team = await self.builder.build_team(config_path)
+            self.runner = create_runner(self.team)
+            await MCPServerManager().connect_servers([self.team.orchestrator] + list(self.team.workers.values()))
+            ready.set_result(None)
+        except Exception as e:
+            ready.set_exception(e)
+            try:
+                await self._release()
+            except Exception as cleanup_error:
+                logger.warning(f"Error cleaning up team after failed build: {cleanup_error}")
+            return
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+        await self._close_requested.wait()
+        await self._release()
+
+    async def _release(self) -> None:
+        try:
+            if self.runner is not None:
+                await self.runner.close()
+        finally:
+            await self.builder.cleanup_mcp_servers()
+
+    async def close(self) -> None:
+        """Release the team's sessions and MCP server connections."""
+        self._close_requested.set()
+        if self._owner is not None:
+            await self._owner
+
+
+class TeamRuntime:
+    """Pool of warm teams reused across conversation turns."""
+
+    def __init__(self, max_teams: Optional[int] = None, idle_timeout: Optional[float] = None,
+                 api_key: Optional[str] = None, model: str = "gpt-4o", temperature: float = 1.0,
+                 session_scoped: bool = True):
+        """Initialize the runtime.
+
+        Args:
+            max_teams: Maximum number of resident teams (default GNOSARI_RUNTIME_MAX_TEAMS or 16)
+            idle_timeout: Seconds after which an unused team is evicted
+                (default GNOSARI_RUNTIME_IDLE_TIMEOUT or 900)
+            api_key: OpenAI API key passed to the team builder
+            model: Default model for agents
+            temperature: Default temperature for agents
+            session_scoped: Build one team per session instead of sharing one team per configuration
+        """
+        self.max_teams = max_teams or int(os.getenv("GNOSARI_RUNTIME_MAX_TEAMS", "16"))
+        self.idle_timeout = idle_timeout or float(os.getenv("GNOSARI_RUNTIME_IDLE_TIMEOUT", "900"))
+        self.api_key = api_key
+        self.model = model
+        self.temperature = temperature
+        self.session_scoped = session_scoped
+        self._teams: "OrderedDict[str, WarmTeam]" = OrderedDict()
+        self._building: Dict[str, asyncio.Future] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self._hasher = ContentHasher()
+        self._stats = {"builds": 0, "hits": 0, "evictions": 0}
+
+    def team_key(self, config_path: str, session_id: Optional[str] = None) -> str:
+        """Compute the key of the resident team for a configuration and session.
+
+        The key covers the configuration file content, so editing the file
+        builds a fresh team on the next turn. The session only counts for
+        session-scoped runtimes.
+
+        Args:
+            config_path: Path to the team configuration
+            session_id: Conversation session ID
+
+        Returns:
+            Team key
+        """
+        with open(config_path, 'rb') as config_file:
+            content_hash = self._hasher.compute_hash(config_file.read())
+        return self._hasher.compute_hash({
+            "content": content_hash,
+            "session_id": session_id if self.session_scoped else None,
+            "model": self.model,
+            "temperature": self.temperature
+        })
+
+    def _create_builder(self, session_id: Optional[str]) -> TeamBuilder:
+        return TeamBuilder(api_key=self.api_key, model=self.model,
+                           temperature=self.temperature, session_id=session_id)
+
+    def _create_runner(self, team: Team) -> CompositeTeamRunner:
+        runner = CompositeTeamRunner(team)
+        runner.set_keep_alive(True)
+        return runner
+
+    async def get_team(self, config_path: str, session_id: Optional[str] = None) -> WarmTeam:
+        """Get the resident team for a configuration and session, building it if needed.
+
+        Concurrent requests for the same team share one build.
+
+        Args:
+            config_path: Path to the team configuration
+            session_id: Conversation session ID
+
+        Returns:
+            WarmTeam instance
+        """
+        key = self.team_key(config_path, session_id)
+        warm = self._teams.get(key)
+        if warm is not None:
+            self._teams.move_to_end(key)
+            warm.last_used = time.monotonic()
+            self._stats["hits"] += 1
+            return warm
+
+        build = self._building.get(key)
+        if build is None:
+            build = asyncio.ensure_future(self._build(key, config_path, session_id))
+            self._building[key] = build
+            build.add_done_callback(lambda _: self._building.pop(key, None))
+        return await asyncio.shield(build)
+
+    async def _build(self, key: str, config_path: str, session_id: Optional[str]) -> WarmTeam:
+        started = time.monotonic()
+        warm = WarmTeam(key, self._create_builder(session_id if self.session_scoped else None))
+        await warm.open(config_path, self._create_runner)
+        self._teams[key] = warm
+        self._stats["builds"] += 1
+        logger.info(f"🔥 Team '{warm.team.name}' resident after {time.monotonic() - started:.2f}s "
+                    f"({len(self._teams)}/{self.max_teams} teams)")
+
+        await self._enforce_limit(keep=key)
+        self._ensure_sweeper()
+        return warm
+
+    @asynccontextmanager
+    async def turn(self, config_path: str, session_id: Optional[str] = None) -> AsyncIterator[WarmTeam]:
+        """Hold a resident team for the duration of a turn.
+
+        A team is never evicted while a turn is using it.
+
+        Args:
+            config_path: Path to the team configuration
+            session_id: Conversation session ID
+
+        Yields:
+            WarmTeam instance
+        """
+        warm = await self.get_team(config_path, session_id)
+        while warm.key not in self._teams:
+            # Evicted to make room for another team before this turn started
+            warm = await self.get_team(config_path, session_id)
+        warm.active_turns += 1
+        try:
+            yield warm
+        finally:
+            warm.active_turns -= 1
+            warm.last_used = time.monotonic()
+
+    async def run_team_stream(self, config_path: str, message: str, session_id: Optional[str] = None,
+                              session_context: Optional[Dict[str, Any]] = None,
+                              max_turns: Optional[int] = None,
+                              debug: bool = False) -> AsyncGenerator[Dict[str, Any], None]:
+        """Run a turn on the resident team with streaming outputs.
+
+        Args:
+            config_path: Path to the team configuration
+            message: User message
+            session_id: Conversation session ID
+            session_context: Session context data
+            max_turns: Maximum number of turns
+            debug: Whether to show debug info
+
+        Yields:
+            Stream outputs of the team runner
+        """
+        async with self.turn(config_path, session_id) as warm:
+            async for event in warm.runner.run_team_stream(message, debug, session_id, session_context, max_turns):
+                yield event
+
+    async def run_team_async(self, config_path: str, message: str, session_id: Optional[str] = None,
+                             session_context: Optional[Dict[str, Any]] = None,
+                             max_turns: Optional[int] = None, debug: bool = False) -> Dict[str, Any]:
+        """Run a turn on the resident team.
+
+        Args:
+            config_path: Path to the team configuration
+            message: User message
+            session_id: Conversation session ID
+            session_context: Session context data
+            max_turns: Maximum number of turns
+            debug: Whether to show debug info
+
+        Returns:
+            Team runner result
+        """
+        async with self.turn(config_path, session_id) as warm:
+            return await warm.runner.run_team_async(message, debug, session_id, session_context, max_turns)
+
+    async def _evict(self, warm: WarmTeam) -> None:
+        self._teams.pop(warm.key, None)
+        self._stats["evictions"] += 1
+        logger.info(f"🧊 Evicting team '{warm.team.name}' after {warm.idle_seconds:.0f}s idle")
+        try:
+            await warm.close()
+        except Exception as e:
+            logger.warning(f"Error closing evicted team '{warm.team.name}': {e}")
+
+    async def _enforce_limit(self, keep: str) -> None:
+        while len(self._teams) > self.max_teams:
+            # Least recently used first; teams in a turn and the new team are never evicted
+            victim = next((warm for warm in self._teams.values()
+                           if warm.active_turns == 0 and warm.key != keep), None)
+            if victim is None:
+                logger.warning(f"All {len(self._teams)} resident teams are busy; exceeding max_teams={self.max_teams}")
+                return
+            await self._evict(victim)
+
+    async def evict_idle(self) -> int:
+        """Evict teams unused for longer than the idle timeout.
+
+        Sessions of resident teams that were idle for as long are closed too.
+
+        Returns:
+            Number of evicted teams
+        """
+        idle = [warm for warm in self._teams.values()
+                if warm.active_turns == 0 and warm.idle_seconds >= self.idle_timeout]
+        for warm in idle:
+            await self._evict(warm)
+        for warm in list(self._teams.values()):
+            await warm.runner.close_idle_sessions(self.idle_timeout)
+        return len(idle)
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def _sweep(self) -> None:
+        interval = min(self.idle_timeout / 2, 60.0)
+        while self._teams:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Error evicting idle teams: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get runtime statistics.
+
+        Returns:
+            Dict with resident team count, builds, reuse hits and evictions
+        """
+        return {"resident": len(self._teams), "max_teams": self.max_teams, **self._stats}
+
+    async def close(self) -> None:
+        """Evict all resident teams and stop the idle sweeper."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
+        for warm in list(self._teams.values()):
+            await self._evict(warm)
@@ -0,0 +1,358 @@
+"""
+Structured stream events.
+
+Events yielded by the streaming runners. Each event type is a slotted class
+holding its values (or the SDK objects they come from) as attributes, so
+producing an event costs a few attribute assignments. Text such as
+``str(item)`` of nested SDK objects is only computed when a consumer reads
+that key or serializes the event.
+
+Events subclass ``dict`` so existing consumers keep working unchanged:
+``event["content"]``, ``event.get("type")``, ``dict(event)`` and
+``json.dumps(event)`` all see the full set of keys.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StreamEvent(dict):
+    """Base class for structured stream events.
+
+    Only ``type`` lives in the dict storage up front. The other keys are
+    read from attributes on access and copied into the storage the first
+    time the event is used as a whole mapping (iteration, serialization,
+    mutation).
+    """
+
+    __slots__ = ('_materialized',)
+
+    # Keys served from attributes, in output order
+    fields: Tuple[str, ...] = ()
+    # Keys left out of the mapping when their value is None
+    optional_fields: frozenset = frozenset()
+
+    def __init__(self, event_type: str):
+        dict.__init__(self, type=event_type)
+        self._materialized = False
+
+    def _has_field(self, key: str) -> bool:
+        return key in self.fields and not (key in self.optional_fields and getattr(self, key) is None)
+
+    def _materialize(self) -> None:
+        if not self._materialized:
+            self._materialized = True
+            for key in self.fields:
+                if self._has_field(key):
+                    dict.__setitem__(self, key, getattr(self, key))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the event as a plain dictionary."""
+        self._materialize()
+        return dict(dict.items(self))
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize the event to JSON.
+
+        Args:
+            **kwargs: Extra arguments for ``json.dumps``
+
+        Returns:
+            JSON string
+        """
+        kwargs.setdefault('default', str)
+        return json.dumps(self.to_dict(), **kwargs)
+
+    # Reads that don't need the whole mapping
+    def __getitem__(self, key: str) -> Any:
+        if self._materialized or key == 'type':
+            return dict.__getitem__(self, key)
+        if self._has_field(key):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        if self._materialized or key == 'type':
+            return dict.__contains__(self, key)
+        return isinstance(key, str) and self._has_field(key)
+
+    # Whole-mapping views
+    def __iter__(self) -> Iterator[str]:
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._materialize()
+        return dict.__len__(self)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StreamEvent):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __or__(self, other):
+        return self.to_dict() | other
+
+    def __ror__(self, other):
+        return other | self.to_dict()
+
+    def __reduce__(self):
+        return dict, (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    # Mutation works on the materialized mapping
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def __ior__(self, other):
+        self._materialize()
+        dict.update(self, other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        self._materialize()
+        dict.update(self, *args, **kwargs)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key: str, *default):
+        self._materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._materialize()
+        dict.clear(self)
+
+
+class ResponseEvent(StreamEvent):
+    """Response text from an agent: a token delta or a whole message."""
+
+    __slots__ = ('content', 'agent_name', '_delta')
+    fields = ('id', 'content', 'agent_name')
+    optional_fields = frozenset({'id'})
+
+    def __init__(self, content: Any, agent_name: str, delta: bool = False):
+        StreamEvent.__init__(self, 'response')
+        self.content = content
+        self.agent_name = agent_name
+        self._delta = delta
+
+    @property
+    def id(self) -> Optional[str]:
+        return f"response_{self.agent_name}" if self._delta else None
+
+    @property
+    def is_delta(self) -> bool:
+        return self._delta
+
+
+class ReasoningEvent(StreamEvent):
+    """Reasoning item produced by a reasoning model."""
+
+    __slots__ = ('item', 'agent_name')
+    fields = ('id', 'content', 'agent_name', 'status', 'item_data')
+
+    def __init__(self, item: Any, agent_name: str):
+        StreamEvent.__init__(self, 'reasoning')
+        self.item = item
+        self.agent_name = agent_name
+
+    @property
+    def id(self) -> str:
+        return getattr(self.item, 'id', None) or f"reasoning_{self.agent_name}"
+
+    @property
+    def content(self) -> str:
+        summary = getattr(self.item, 'summary', None)
+        return getattr(self.item, 'content', None) or (str(summary) if summary else "")
+
+    @property
+    def status(self) -> Optional[str]:
+        return getattr(self.item, 'status', None)
+
+    @property
+    def item_data(self) -> str:
+        return str(self.item)
+
+
+class ToolCallEvent(StreamEvent):
+    """Tool call made by an agent."""
+
+    __slots__ = ('id', 'tool_name', 'tool_input', 'arguments', 'agent_name', 'item', 'raw_item')
+    fields = ('id', 'status', 'call_id', 'tool_name', 'tool_item', 'tool_input', 'agent_name', 'item_data', 'arguments')
+
+    def __init__(self, id: str, tool_name: str, tool_input: Any, arguments: Any,
+                 agent_name: str, item: Any, raw_item: Any):
+        StreamEvent.__init__(self, 'tool_call')
+        self.id = id
+        self.tool_name = tool_name
+        self.tool_input = tool_input
+        self.arguments = arguments
+        self.agent_name = agent_name
+        self.item = item
+        self.raw_item = raw_item
+
+    @property
+    def status(self) -> str:
+        return "completed"
+
+    @property
+    def call_id(self) -> str:
+        return self.id
+
+    @property
+    def tool_item(self) -> str:
+        return str(self.raw_item)
+
+    @property
+    def item_data(self) -> str:
+        return str(self.item)
+
+
+class ToolResultEvent(StreamEvent):
+    """Output of a tool call."""
+
+    __slots__ = ('content', 'agent_name')
+    fields = ('content', 'agent_name')
+
+    def __init__(self, content: Any, agent_name: str):
+        StreamEvent.__init__(self, 'tool_result')
+        self.content = content
+        self.agent_name = agent_name
+
+
+class AgentUpdatedEvent(StreamEvent):
+    """The active agent changed (e.g. after a handoff)."""
+
+    __slots__ = ('agent_name',)
+    fields = ('agent_name', 'message')
+
+    def __init__(self, agent_name: str):
+        StreamEvent.__init__(self, 'agent_updated')
+        self.agent_name = agent_name
+
+    @property
+    def message(self) -> str:
+        return f"Agent updated: {self.agent_name}"
+
+
+class MessageOutputEvent(StreamEvent):
+    """Complete message output of an agent."""
+
+    __slots__ = ('raw_item', 'agent_name')
+    fields = ('agent_name', 'content', 'item')
+
+    def __init__(self, raw_item: Any, agent_name: str):
+        StreamEvent.__init__(self, 'message_output')
+        self.raw_item = raw_item
+        self.agent_name = agent_name
+
+    @property
+    def content(self) -> str:
+        from agents import ItemHelpers
+
+        try:
+            return ItemHelpers.text_message_output(self.raw_item)
+        except Exception as e:
+            # Reasoning item dependencies can break text extraction - preserve the full item
+            logger.warning(f"ItemHelpers.text_message_output failed: {e}, preserving full item")
+            return str(self.raw_item)
+
+    @property
+    def item(self) -> str:
+        return str(self.raw_item)
+
+
+class ToolCallArgumentsDoneEvent(StreamEvent):
+    """Arguments of a function call finished streaming."""
+
+    __slots__ = ('arguments', 'item_id')
+    fields = ('arguments', 'item_id')
+
+    def __init__(self, arguments: Any, item_id: str):
+        StreamEvent.__init__(self, 'tool_call_arguments_done')
+        self.arguments = arguments
+        self.item_id = item_id
+
+
+class RunItemEvent(StreamEvent):
+    """Run item of a type without a dedicated event."""
+
+    __slots__ = ('item',)
+    fields = ('type_raw',)
+
+    def __init__(self, item: Any):
+        StreamEvent.__init__(self, str(item.type))
+        self.item = item
+
+    @property
+    def type_raw(self) -> str:
+        return str(self.item)
+
+
+class RawStreamEvent(StreamEvent):
+    """SDK stream event without a dedicated event type."""
+
+    __slots__ = ('event', 'agent_name', 'message')
+    fields = ('event_type', 'agent_name', 'message', 'data')
+    optional_fields = frozenset({'message'})
+
+    def __init__(self, event: Any, agent_name: str):
+        has_data = getattr(event, 'data', None) is not None
+        StreamEvent.__init__(self, 'unknown' if has_data else 'event_without_data')
+        self.event = event
+        self.agent_name = agent_name
+        self.message = None if has_data else "Event received but no data available"
+
+    @property
+    def event_type(self) -> str:
+        return getattr(self.event, 'type', None)
+
+    @property
+    def data(self) -> str:
+        return str(self.event)
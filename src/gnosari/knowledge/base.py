@@ -70,13 +70,21 @@ class BaseKnowledgeBase(ABC):
         pass
     
     @abstractmethod
-    async def query(self, query: str, max_results: int = 5) -> List[KnowledgeResult]:
+    async def query(
+        self,
+        query: str,
+        max_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
+    ) -> List[KnowledgeResult]:
         """
         Query the knowledge base.
         
         Args:
             query: Query string
             max_results: Maximum number of results to return
+            filters: Optional metadata filter applied by the underlying store
+            min_score: Optional minimum score of returned results
             
         Returns:
             List of knowledge results
@@ -96,6 +104,18 @@ class BaseKnowledgeBase(ABC):
         """
         pass
     
+    async def prune_sources(self, data: List[str]) -> int:
+        """
+        Remove content ingested from data items that are no longer configured.
+        
+        Args:
+            data: Data items currently configured for the knowledge base
+            
+        Returns:
+            Number of sources removed
+        """
+        return 0
+    
     async def cleanup(self) -> None:
         """Clean up resources used by the knowledge base."""
         pass
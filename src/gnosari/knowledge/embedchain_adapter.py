@@ -2,13 +2,20 @@
 Embedchain adapter for integrating Embedchain knowledge bases with Gnosari.
 """
 
+import asyncio
+import inspect
 import logging
+import os
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .base import BaseKnowledgeBase, KnowledgeResult, KnowledgeProvider
-from ..core.cache import CacheManager, CacheStatus
+from ..core.cache import CacheEntry, CacheManager
+from ..core.cache.hashers import ContentHasher
 from ..core.exceptions import KnowledgeError
 
+DEFAULT_DIRECTORY_EXTENSIONS = ['.txt', '.md', '.py', '.yaml', '.yml', '.json']
+
 
 class EmbedchainKnowledgeBase(BaseKnowledgeBase):
     """
@@ -30,6 +37,11 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
         self.knowledge_id = knowledge_id or name
         self.embedchain_app = None
         self.cache = cache
+        self._hasher = ContentHasher()
+        self._search_accepts_limits: Optional[bool] = None
+        # Embedchain apps are not safe for concurrent writes: ingestion and
+        # deletion on one knowledge base run one at a time
+        self._write_lock = asyncio.Lock()
         self.logger = logging.getLogger(__name__)
     
     async def initialize(self) -> None:
@@ -38,38 +50,8 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
             return
         
         try:
-            from embedchain import App
-            
-            # Create Embedchain app with configuration using knowledge_id as collection name
-            embedchain_config = self.config.get('embedchain', {}).copy()
-            
-            # For Embedchain, we need to use the correct configuration structure
-            # Check if there's existing embedchain config, otherwise create minimal one
-            if embedchain_config:
-                # If embedchain config exists, ensure it has unique collection name
-                if 'vectordb' not in embedchain_config:
-                    embedchain_config['vectordb'] = {}
-                if 'config' not in embedchain_config['vectordb']:
-                    embedchain_config['vectordb']['config'] = {}
-                embedchain_config['vectordb']['config']['collection_name'] = f"gnosari_{self.knowledge_id}"
-                self.embedchain_app = App.from_config(config=embedchain_config)
-            else:
-                # Create with minimal config - use default Embedchain App with custom collection name later
-                self.embedchain_app = App()
-                # Try to set collection name if the DB supports it
-                try:
-                    if hasattr(self.embedchain_app, 'db') and hasattr(self.embedchain_app.db, 'set_collection_name'):
-                        self.embedchain_app.db.set_collection_name(f"gnosari_{self.knowledge_id}")
-                    elif hasattr(self.embedchain_app, 'db') and hasattr(self.embedchain_app.db, 'collection_name'):
-                        # Some versions might have a direct attribute
-                        self.embedchain_app.db.collection_name = f"gnosari_{self.knowledge_id}"
-                    else:
-                        # Fallback: try to access internal collection
-                        if hasattr(self.embedchain_app.db, '_collection'):
-                            self.embedchain_app.db._collection = None  # Reset to force recreation with new name
-                        self.logger.warning(f"Could not set custom collection name for {self.knowledge_id}, using default")
-                except Exception as e:
-                    self.logger.warning(f"Could not set custom collection name for {self.knowledge_id}: {e}")
+            # App construction loads models and opens the vector store - keep it off the event loop
+            self.embedchain_app = await asyncio.to_thread(self._create_app)
             
             self._initialized = True
             self.logger.info(f"Initialized Embedchain knowledge base '{self.name}' with collection 'gnosari_{self.knowledge_id}'")
@@ -79,10 +61,142 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
         except Exception as e:
             raise KnowledgeError(f"Failed to initialize Embedchain knowledge base '{self.name}': {e}")
     
+    def _create_app(self):
+        """Create the Embedchain app using knowledge_id as collection name."""
+        from embedchain import App
+        
+        # Create Embedchain app with configuration using knowledge_id as collection name
+        embedchain_config = self.config.get('embedchain', {}).copy()
+        
+        # For Embedchain, we need to use the correct configuration structure
+        # Check if there's existing embedchain config, otherwise create minimal one
+        if embedchain_config:
+            # If embedchain config exists, ensure it has unique collection name
+            if 'vectordb' not in embedchain_config:
+                embedchain_config['vectordb'] = {}
+            if 'config' not in embedchain_config['vectordb']:
+                embedchain_config['vectordb']['config'] = {}
+            embedchain_config['vectordb']['config']['collection_name'] = f"gnosari_{self.knowledge_id}"
+            app = App.from_config(config=embedchain_config)
+        else:
+            # Create with minimal config - use default Embedchain App with custom collection name later
+            app = App()
+            # Try to set collection name if the DB supports it
+            try:
+                if hasattr(app, 'db') and hasattr(app.db, 'set_collection_name'):
+                    app.db.set_collection_name(f"gnosari_{self.knowledge_id}")
+                elif hasattr(app, 'db') and hasattr(app.db, 'collection_name'):
+                    # Some versions might have a direct attribute
+                    app.db.collection_name = f"gnosari_{self.knowledge_id}"
+                else:
+                    # Fallback: try to access internal collection
+                    if hasattr(app.db, '_collection'):
+                        app.db._collection = None  # Reset to force recreation with new name
+                    self.logger.warning(f"Could not set custom collection name for {self.knowledge_id}, using default")
+            except Exception as e:
+                self.logger.warning(f"Could not set custom collection name for {self.knowledge_id}: {e}")
+        return app
+    
+    def _get_cache_entry(self) -> Optional[CacheEntry]:
+        """Get the cache entry tracking this knowledge base's sources.
+
+        A new entry is created when there is none or the knowledge base
+        configuration changed, in which case every source is re-ingested.
+        """
+        if not self.cache:
+            return None
+        
+        entry = self.cache.get_entry(self.knowledge_id)
+        config_hash = self.cache.config.hash_strategy.compute_hash(self.config)
+        if entry is None or entry.content_hash != config_hash or 'sources' not in entry.metadata:
+            entry = self.cache.mark_loading(
+                cache_key=self.knowledge_id,
+                item_type="knowledge_base",
+                data=self.config,
+                metadata={'name': self.name, 'sources': {}}
+            )
+        return entry
+    
+    async def _load_cache_entry(self) -> Optional[CacheEntry]:
+        """Get the cache entry, first removing content ingested under a previous configuration.
+
+        A changed configuration (chunking, embedder, ...) starts a new entry
+        without the old source records, so the vectors those records point
+        to are deleted before they are dropped. Otherwise they would stay in
+        the collection where neither re-ingestion nor pruning can find them.
+        Must be called with the write lock held.
+        """
+        if not self.cache:
+            return None
+        
+        entry = self.cache.get_entry(self.knowledge_id)
+        config_hash = self.cache.config.hash_strategy.compute_hash(self.config)
+        if entry is not None and entry.content_hash != config_hash:
+            stale = entry.metadata.get('sources') or {}
+            if stale:
+                self.logger.info(f"Configuration of knowledge base {self.name} changed, removing {len(stale)} previously ingested sources")
+            try:
+                for key, record in list(stale.items()):
+                    await self._remove_source_vectors(key, record)
+                    del stale[key]
+            except Exception as e:
+                raise KnowledgeError(f"Failed to remove content of knowledge base '{self.name}' ingested under its previous configuration: {e}")
+        return self._get_cache_entry()
+    
+    def _expand_sources(self, data: str) -> List[str]:
+        """Expand a data item into the sources ingested separately.
+
+        Directories of a ``directory`` knowledge base expand to their files
+        (honouring ``loader_config`` recursion and extensions) so a changed
+        file only re-embeds that file. Anything else is a single source.
+        """
+        if self.config.get('type', '').lower() != 'directory' or not os.path.isdir(data):
+            return [data]
+        
+        loader_config = self.config.get('loader_config', {})
+        recursive = loader_config.get('recursive', True)
+        extensions = loader_config.get('extensions', DEFAULT_DIRECTORY_EXTENSIONS)
+        
+        directory = Path(data)
+        paths = directory.rglob('*') if recursive else directory.glob('*')
+        return sorted(
+            str(path) for path in paths
+            if path.is_file() and (not extensions or path.suffix in extensions)
+        )
+    
+    def _fingerprint(self, source: str) -> str:
+        """Compute the change-detection fingerprint of a source.
+
+        Local files are fingerprinted by path, mtime and size, or by content
+        when the knowledge base sets ``fingerprint: content``. Other sources
+        (URLs, inline text) are fingerprinted by their value.
+        """
+        if os.path.isfile(source):
+            if self.config.get('fingerprint') == 'content':
+                with open(source, 'rb') as f:
+                    return self._hasher.compute_hash(f.read())
+            stat = os.stat(source)
+            return self._hasher.compute_hash({'path': source, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size})
+        return self._hasher.compute_hash(source)
+    
+    async def _remove_source_vectors(self, key: str, record: Dict[str, Any]) -> None:
+        """Remove the vectors Embedchain stored for one ingested source."""
+        source_hash = record.get('hash')
+        if not source_hash:
+            await asyncio.to_thread(self._delete_untracked_source, key)
+        elif hasattr(self.embedchain_app, 'delete'):
+            await asyncio.to_thread(self.embedchain_app.delete, source_hash)
+        else:
+            await asyncio.to_thread(self.embedchain_app.db.delete, where={'hash': source_hash})
+    
     async def add_data(self, data: str, source: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """
         Add data to the Embedchain knowledge base.
         
+        Only sources that are new or whose fingerprint changed since they
+        were last ingested are embedded. For directories, files that were
+        removed have their vectors deleted.
+        
         Args:
             data: Data content or URL to add
             source: Source identifier
@@ -91,76 +205,94 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
         if not self._initialized:
             await self.initialize()
         
-        try:
-            # Check cache if we should skip loading this data
-            if self.cache and self.cache.is_cached(self.knowledge_id, self.config):
-                self.logger.info(f"Knowledge base '{self.name}' (ID: {self.knowledge_id}) is already loaded according to cache")
-                return
+        async with self._write_lock:
+            entry = await self._load_cache_entry()
+            sources: Dict[str, Dict[str, Any]] = entry.metadata['sources'] if entry else {}
             
-            # Mark as loading in cache
-            if self.cache:
-                data_sources = self.config.get('data', []) if isinstance(self.config.get('data'), list) else [data]
-                self.cache.mark_loading(
-                    cache_key=self.knowledge_id,
-                    item_type="knowledge_base",
-                    data=self.config,
-                    data_sources=data_sources,
-                    metadata={'name': self.name, 'data_source': data, 'source': source}
-                )
-            
-            # Check if knowledge base already has data (additional safety check)
             try:
-                if hasattr(self.embedchain_app, 'db') and hasattr(self.embedchain_app.db, 'count') and self.embedchain_app.db.count() > 0:
-                    self.logger.info(f"Knowledge base '{self.name}' already has data in collection 'gnosari_{self.knowledge_id}'. Skipping addition of: {data}")
-                    if self.cache:
-                        self.cache.mark_loaded(self.knowledge_id, {'skipped_reason': 'data_already_exists'})
-                    return
-            except Exception as check_error:
-                # If check fails, proceed with adding (fallback)
-                self.logger.debug(f"Could not check existing data: {check_error}")
+                current = self._expand_sources(data)
+                added = 0
+                for item in current:
+                    fingerprint = self._fingerprint(item)
+                    record = sources.get(item)
+                    if record and record.get('fingerprint') == fingerprint:
+                        continue
+                
+                    self.logger.info(f'Adding data to knowledge base {self.name} (collection: gnosari_{self.knowledge_id}): {item}')
+                    # Let Embedchain auto-detect the data type. It replaces the chunks
+                    # of a source whose content changed and returns the source hash.
+                    source_hash = await asyncio.to_thread(self.embedchain_app.add, item)
+                    sources[item] = {'fingerprint': fingerprint, 'hash': source_hash, 'origin': data}
+                    added += 1
             
-            self.logger.info(f'Adding data to knowledge base {self.name} (collection: gnosari_{self.knowledge_id}): {data}')
+                # Files that disappeared from a directory since the last load
+                current_set = set(current)
+                removed = [key for key, record in sources.items() if record.get('origin') == data and key not in current_set]
+                for key in removed:
+                    self.logger.info(f"Removing deleted source from knowledge base {self.name}: {key}")
+                    await self._remove_source_vectors(key, sources.pop(key))
             
-            # Check if this is a directory type and needs special loader
-            kb_type = self.config.get('type', '').lower()
-            if kb_type == 'directory':
-                # Import directory loader
-                from embedchain.loaders.directory_loader import DirectoryLoader
-                
-                # Get directory-specific configuration
-                loader_config = self.config.get('loader_config', {})
-                # Set defaults for directory loading
-                if 'recursive' not in loader_config:
-                    loader_config['recursive'] = True
-                if 'extensions' not in loader_config:
-                    loader_config['extensions'] = ['.txt', '.md', '.py', '.yaml', '.yml', '.json']
-                
-                loader = DirectoryLoader(config=loader_config)
-                self.embedchain_app.add(data, loader=loader)
-            else:
-                # Use the old approach: just call add() without data_type
-                # Let Embedchain auto-detect the data type
-                self.embedchain_app.add(data)
+                if added or removed:
+                    self.logger.debug(f"Updated knowledge base '{self.name}' from {source}: {added} added or changed, {len(removed)} removed")
+                else:
+                    self.logger.info(f"Knowledge base '{self.name}' (ID: {self.knowledge_id}) is up to date for: {data}")
             
-            # Mark as successfully loaded in cache
-            if self.cache:
-                self.cache.mark_loaded(self.knowledge_id, {'data_source': data, 'source': source})
+            except Exception as e:
+                raise KnowledgeError(f"Failed to add data to knowledge base '{self.name}': {e}")
+            finally:
+                # Record progress even on failure so completed sources are not re-embedded
+                if entry:
+                    entry.data_sources = sorted(sources)
+                    self.cache.mark_loaded(self.knowledge_id)
+    
+    async def prune_sources(self, data: List[str]) -> int:
+        """
+        Remove sources that were ingested from data items no longer configured.
+        
+        Args:
+            data: Data items currently configured for the knowledge base
             
-            self.logger.debug(f"Added data to Embedchain knowledge base '{self.name}' (collection: gnosari_{self.knowledge_id}): {source}")
+        Returns:
+            Number of sources removed
+        """
+        if not self.cache:
+            return 0
+        if not self._initialized:
+            await self.initialize()
+        
+        async with self._write_lock:
+            entry = await self._load_cache_entry()
+            sources = entry.metadata['sources']
+            configured = set(data)
+            stale = [key for key, record in sources.items() if record.get('origin') not in configured]
+            for key in stale:
+                self.logger.info(f"Removing unconfigured source from knowledge base {self.name}: {key}")
+                await self._remove_source_vectors(key, sources.pop(key))
             
-        except Exception as e:
-            # Mark as failed in cache
-            if self.cache:
-                self.cache.mark_failed(self.knowledge_id, str(e))
-            raise KnowledgeError(f"Failed to add data to knowledge base '{self.name}': {e}")
+            if stale:
+                entry.data_sources = sorted(sources)
+                self.cache.mark_loaded(self.knowledge_id)
+        return len(stale)
     
-    async def query(self, query: str, max_results: int = 5) -> List[KnowledgeResult]:
+    async def query(
+        self,
+        query: str,
+        max_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
+    ) -> List[KnowledgeResult]:
         """
         Query the Embedchain knowledge base.
         
+        ``max_results`` and ``filters`` are passed to the vector search so
+        the store only returns what was asked for. Scores are similarities
+        in (0, 1] derived from the vector distance.
+        
         Args:
             query: Query string
             max_results: Maximum number of results
+            filters: Optional chunk metadata filter (Chroma ``where`` clause)
+            min_score: Optional minimum score (defaults to the ``min_score`` config)
             
         Returns:
             List of knowledge results
@@ -168,9 +300,12 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
         if not self._initialized:
             await self.initialize()
         
+        if min_score is None:
+            min_score = self.config.get('min_score')
+        
         try:
-            # Query Embedchain
-            response = self.embedchain_app.search(query)
+            # Query Embedchain off the event loop so several bases can be searched concurrently
+            response = await asyncio.to_thread(self._search, query, max_results, filters)
 
             self.logger.debug(f"Embedchain search response type: {type(response)}")
             self.logger.debug(f"Embedchain knowledge base '{self.name}' response: {response}")
@@ -190,7 +325,7 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
                 ]
             elif isinstance(response, list):
                 # List of results
-                for i, item in enumerate(response):
+                for i, item in enumerate(response[:max_results]):
                     if isinstance(item, str):
                         # List of strings
                         results.append(
@@ -203,10 +338,22 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
                         )
                     elif isinstance(item, dict):
                         # List of dictionaries (more structured results)
-                        content = item.get('content', str(item))
-                        source = item.get('source', f"{self.name}#{i}")
-                        score = item.get('score', 1.0)
-                        metadata = item.get('metadata', {})
+                        metadata = dict(item.get('metadata') or {})
+                        if 'context' in item:
+                            # Embedchain search format: chunk text plus metadata carrying the vector distance
+                            content = item['context']
+                            distance = metadata.pop('score', None)
+                            score = 1.0 / (1.0 + distance) if distance is not None else 1.0
+                            if distance is not None:
+                                metadata['distance'] = distance
+                            source = metadata.get('url', f"{self.name}#{i}")
+                        else:
+                            content = item.get('content', str(item))
+                            source = item.get('source', f"{self.name}#{i}")
+                            score = item.get('score', 1.0)
+                        
+                        if min_score is not None and score < min_score:
+                            continue
                         metadata.update({'query': query, 'index': i})
                         
                         results.append(
@@ -243,19 +390,85 @@ class EmbedchainKnowledgeBase(BaseKnowledgeBase):
         except Exception as e:
             raise KnowledgeError(f"Failed to query knowledge base '{self.name}': {e}")
     
+    def _search(self, query: str, max_results: int, filters: Optional[Dict[str, Any]]) -> Any:
+        """Run the Embedchain search, limiting and filtering in the vector store."""
+        search = self.embedchain_app.search
+        if self._search_accepts_limits is None:
+            try:
+                parameters = inspect.signature(search).parameters
+                self._search_accepts_limits = 'num_documents' in parameters and 'where' in parameters
+            except (TypeError, ValueError):
+                self._search_accepts_limits = False
+        
+        if self._search_accepts_limits:
+            return search(query, num_documents=max_results, where=filters or None)
+        
+        if filters:
+            self.logger.warning(f"Embedchain search does not support filters, ignoring filters for '{self.name}'")
+        return search(query)
+    
     async def delete_data(self, source: str) -> bool:
         """
         Delete data from the Embedchain knowledge base.
         
+        The source can be an ingested source (file path, URL or text), a data
+        item such as a directory (all of its files are deleted), or an
+        Embedchain source hash. Matching vectors are removed from the
+        collection and the source is dropped from the cache entry.
+        
         Args:
             source: Source identifier
             
         Returns:
             True if data was deleted
         """
-        # Embedchain doesn't have a direct delete method in the basic interface
-        # This would need to be implemented based on the specific Embedchain version
-        self.logger.warning(f"Delete operation not implemented for Embedchain knowledge base '{self.name}'")
+        if not self._initialized:
+            await self.initialize()
+        
+        try:
+            async with self._write_lock:
+                entry = await self._load_cache_entry()
+                sources = entry.metadata['sources'] if entry else {}
+                keys = [
+                    key for key, record in sources.items()
+                    if source in (key, record.get('origin'), record.get('hash'))
+                ]
+                
+                if keys:
+                    for key in keys:
+                        await self._remove_source_vectors(key, sources.pop(key))
+                    entry.data_sources = sorted(sources)
+                    self.cache.mark_loaded(self.knowledge_id)
+                    deleted = True
+                else:
+                    # Content ingested before sources were tracked - match on chunk metadata
+                    deleted = await asyncio.to_thread(self._delete_untracked_source, source)
+            
+            if deleted:
+                self.logger.info(f"Deleted '{source}' from knowledge base '{self.name}' (collection: gnosari_{self.knowledge_id})")
+            else:
+                self.logger.info(f"No data for '{source}' in knowledge base '{self.name}'")
+            return deleted
+            
+        except Exception as e:
+            raise KnowledgeError(f"Failed to delete data from knowledge base '{self.name}': {e}")
+    
+    def _delete_untracked_source(self, source: str) -> bool:
+        """Delete chunks whose ``url`` or ``hash`` metadata matches the source."""
+        db = self.embedchain_app.db
+        for field in ('url', 'hash'):
+            result = db.get(where={field: source})
+            if not result.get('ids'):
+                continue
+            
+            source_hashes = {meta.get('hash') for meta in result.get('metadatas') or [] if meta and meta.get('hash')}
+            if source_hashes and hasattr(self.embedchain_app, 'delete'):
+                # App.delete also removes the source from Embedchain's own data source table
+                for source_hash in source_hashes:
+                    self.embedchain_app.delete(source_hash)
+            else:
+                db.delete(where={field: source})
+            return True
         return False
     
     async def cleanup(self) -> None:
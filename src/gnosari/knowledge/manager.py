@@ -2,7 +2,9 @@
 Knowledge manager for coordinating multiple knowledge bases.
 """
 
+import asyncio
 import logging
+import os
 from typing import Any, Dict, List, Optional
 
 from .base import BaseKnowledgeBase, KnowledgeQuery, KnowledgeResult, KnowledgeProvider
@@ -20,20 +22,22 @@ class KnowledgeManager:
     interface for querying and managing knowledge across the system.
     """
     
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(self, cache_dir: Optional[str] = None, query_timeout: Optional[float] = None):
         """
         Initialize the knowledge manager.
         
         Args:
             cache_dir: Optional directory for cache files
+            query_timeout: Per-knowledge-base timeout in seconds when querying
+                several bases (defaults to GNOSARI_KNOWLEDGE_QUERY_TIMEOUT or 10)
         """
         self.knowledge_bases: Dict[str, BaseKnowledgeBase] = {}
         self.providers: Dict[str, KnowledgeProvider] = {}
+        self.query_timeout = query_timeout if query_timeout is not None else float(os.getenv("GNOSARI_KNOWLEDGE_QUERY_TIMEOUT", "10"))
         self.logger = logging.getLogger(__name__)
         
         # Initialize generic cache system for knowledge bases
         if cache_dir is None:
-            import os
             cache_dir = os.path.join(os.getcwd(), '.cache', 'knowledge')
         
         cache_config = CacheConfig(
@@ -165,11 +169,67 @@ class KnowledgeManager:
         except Exception as e:
             raise KnowledgeError(f"Failed to add data to knowledge base '{kb_name}': {e}")
     
+    async def delete_data_from_knowledge_base(self, kb_name: str, source: str) -> bool:
+        """
+        Delete data from a knowledge base.
+        
+        Args:
+            kb_name: Knowledge base name
+            source: Source identifier of the data to delete
+            
+        Returns:
+            True if data was deleted
+            
+        Raises:
+            KnowledgeError: If knowledge base not found or deletion fails
+        """
+        kb = self.get_knowledge_base(kb_name)
+        if not kb:
+            raise KnowledgeError(f"Knowledge base '{kb_name}' not found")
+        
+        if not kb.is_initialized():
+            await kb.initialize()
+        
+        try:
+            deleted = await kb.delete_data(source)
+            self.logger.debug(f"Deleted '{source}' from knowledge base '{kb_name}': {deleted}")
+            return deleted
+        except Exception as e:
+            raise KnowledgeError(f"Failed to delete data from knowledge base '{kb_name}': {e}")
+    
+    async def prune_knowledge_base(self, kb_name: str, data: List[str]) -> int:
+        """
+        Remove content a knowledge base ingested from data items no longer configured.
+        
+        Args:
+            kb_name: Knowledge base name
+            data: Data items currently configured for the knowledge base
+            
+        Returns:
+            Number of sources removed
+            
+        Raises:
+            KnowledgeError: If knowledge base not found or removal fails
+        """
+        kb = self.get_knowledge_base(kb_name)
+        if not kb:
+            raise KnowledgeError(f"Knowledge base '{kb_name}' not found")
+        
+        try:
+            removed = await kb.prune_sources(data)
+            if removed:
+                self.logger.info(f"Removed {removed} unconfigured sources from knowledge base '{kb_name}'")
+            return removed
+        except Exception as e:
+            raise KnowledgeError(f"Failed to prune knowledge base '{kb_name}': {e}")
+    
     async def query_knowledge_base(
         self, 
         kb_name: str, 
         query: str, 
-        max_results: int = 5
+        max_results: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
     ) -> List[KnowledgeResult]:
         """
         Query a specific knowledge base.
@@ -178,6 +238,8 @@ class KnowledgeManager:
             kb_name: Knowledge base name
             query: Query string
             max_results: Maximum number of results
+            filters: Optional metadata filter applied by the vector store
+            min_score: Optional minimum score of returned results
             
         Returns:
             List of knowledge results
@@ -193,7 +255,7 @@ class KnowledgeManager:
             await kb.initialize()
         
         try:
-            results = await kb.query(query, max_results)
+            results = await kb.query(query, max_results, filters=filters, min_score=min_score)
             self.logger.debug(f"Queried knowledge base '{kb_name}' with {len(results)} results")
             return results
         except Exception as e:
@@ -202,30 +264,126 @@ class KnowledgeManager:
     async def query_all_knowledge_bases(
         self, 
         query: str, 
-        max_results_per_kb: int = 3
+        max_results_per_kb: int = 3,
+        kb_names: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
     ) -> Dict[str, List[KnowledgeResult]]:
         """
-        Query all available knowledge bases.
+        Query knowledge bases concurrently.
+        
+        Each base is queried under its own timeout. Bases that fail or time
+        out are left out of the results, so a slow base delays the answer by
+        at most the timeout instead of failing the whole query.
         
         Args:
             query: Query string
             max_results_per_kb: Maximum results per knowledge base
+            kb_names: Knowledge bases to query (defaults to all)
+            timeout: Per-base timeout in seconds (defaults to query_timeout, 0 for none)
+            filters: Optional metadata filter applied by each vector store
+            min_score: Optional minimum score of returned results
             
         Returns:
             Dictionary mapping knowledge base names to results
         """
-        all_results = {}
+        names = list(self.knowledge_bases) if kb_names is None else [name for name in kb_names if name in self.knowledge_bases]
+        timeout = self.query_timeout if timeout is None else timeout
         
-        for kb_name in self.knowledge_bases:
-            try:
-                results = await self.query_knowledge_base(kb_name, query, max_results_per_kb)
-                if results:
-                    all_results[kb_name] = results
-            except Exception as e:
-                self.logger.warning(f"Failed to query knowledge base '{kb_name}': {e}")
+        async def query_one(kb_name: str) -> List[KnowledgeResult]:
+            return await asyncio.wait_for(
+                self.query_knowledge_base(kb_name, query, max_results_per_kb, filters, min_score),
+                timeout=timeout or None
+            )
+        
+        outcomes = await asyncio.gather(*(query_one(kb_name) for kb_name in names), return_exceptions=True)
+        
+        all_results = {}
+        for kb_name, outcome in zip(names, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                self.logger.warning(f"Knowledge base '{kb_name}' timed out after {timeout}s, returning partial results")
+            elif isinstance(outcome, Exception):
+                self.logger.warning(f"Failed to query knowledge base '{kb_name}': {outcome}")
+            elif outcome:
+                all_results[kb_name] = outcome
         
         return all_results
     
+    async def query_knowledge_bases(
+        self,
+        query: str,
+        kb_names: Optional[List[str]] = None,
+        max_results: int = 5,
+        timeout: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None
+    ) -> List[KnowledgeResult]:
+        """
+        Query knowledge bases concurrently and merge their results by score.
+        
+        Args:
+            query: Query string
+            kb_names: Knowledge bases to query (defaults to all)
+            max_results: Maximum number of merged results (also the per-base limit)
+            timeout: Per-base timeout in seconds (defaults to query_timeout, 0 for none)
+            filters: Optional metadata filter applied by each vector store
+            min_score: Optional minimum score of results
+            
+        Returns:
+            Merged list of knowledge results, best first
+        """
+        results = await self.query_all_knowledge_bases(query, max_results, kb_names, timeout, filters, min_score)
+        return self.merge_results(results, max_results)
+    
+    @staticmethod
+    def merge_results(
+        results_by_kb: Dict[str, List[KnowledgeResult]],
+        max_results: Optional[int] = None
+    ) -> List[KnowledgeResult]:
+        """
+        Merge per-base results into one list ordered by score.
+        
+        Results are compared on their absolute scores (similarities in
+        (0, 1] derived from the vector distance), so the best matches win
+        regardless of which base returned them and a base with only weak
+        matches does not have them promoted. Equal scores are ordered by
+        their rank within their base. Each result's metadata records the
+        ``knowledge_base`` it came from, and identical content returned by
+        several bases is kept once.
+        
+        Args:
+            results_by_kb: Dictionary mapping knowledge base names to results
+            max_results: Optional maximum number of results
+            
+        Returns:
+            Merged list of knowledge results, best first
+        """
+        ranked = []
+        for kb_name, results in results_by_kb.items():
+            for rank, result in enumerate(results or []):
+                metadata = dict(result.metadata or {})
+                metadata['knowledge_base'] = kb_name
+                ranked.append((rank, KnowledgeResult(
+                    content=result.content,
+                    source=result.source,
+                    score=result.score,
+                    metadata=metadata
+                )))
+        
+        ranked.sort(key=lambda item: (-item[1].score, item[0]))
+        merged = [result for _, result in ranked]
+        
+        unique = []
+        seen = set()
+        for result in merged:
+            if result.content in seen:
+                continue
+            seen.add(result.content)
+            unique.append(result)
+        
+        return unique[:max_results] if max_results else unique
+    
     def list_knowledge_bases(self) -> List[str]:
         """
         List all available knowledge base names.
@@ -7,10 +7,12 @@ This module contains all prompt-related functionality including:
 """
 
 from .tool_prompts import get_tools_definition
+from .cache import SystemPromptCache, system_prompt_cache
 
 # Prompt building functions
 from .prompts import (
-    build_agent_system_prompt
+    build_agent_system_prompt,
+    render_system_prompt
 )
 
 
@@ -20,4 +22,9 @@ __all__ = [
     
     # Prompt building functions
     "build_agent_system_prompt",
+    "render_system_prompt",
+    
+    # Rendered prompt memoization
+    "SystemPromptCache",
+    "system_prompt_cache",
 ]
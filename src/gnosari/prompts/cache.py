@@ -0,0 +1,102 @@
+"""Memoization of rendered agent system prompts.
+
+Teams are rebuilt for new sessions and after evictions, and each build
+renders every agent's system prompt again (for orchestrators this also
+reloads the team's tools). Rendered prompts are kept per agent name,
+configuration fingerprint and tool set, so rebuilding an unchanged agent
+reuses the exact prompt text.
+"""
+
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from ..core.cache import ConfigHasher
+
+logger = logging.getLogger(__name__)
+
+
+class SystemPromptCache:
+    """Bounded LRU cache of rendered system prompts."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached prompts (default GNOSARI_PROMPT_CACHE_SIZE or 256, 0 disables)
+        """
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("GNOSARI_PROMPT_CACHE_SIZE", "256"))
+        self._prompts: "OrderedDict[str, str]" = OrderedDict()
+        self._hasher = ConfigHasher()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def make_key(self, agent_name: str, config: Dict[str, Any], tool_set: List[Any]) -> Optional[str]:
+        """Compute the cache key of an agent's prompt.
+
+        Args:
+            agent_name: Agent name
+            config: Everything the prompt is rendered from besides the tools
+            tool_set: Tool names with the configurations their definitions are rendered from
+
+        Returns:
+            Cache key, or None if the inputs cannot be fingerprinted (the prompt is then not cached)
+        """
+        if self.max_entries <= 0:
+            return None
+        try:
+            return self._hasher.compute_hash({"agent": agent_name, "config": config, "tools": tool_set})
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching system prompt of '{agent_name}': {e}")
+            return None
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Get a cached prompt.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            The rendered prompt, or None on a miss
+        """
+        if key is None:
+            return None
+        prompt = self._prompts.get(key)
+        if prompt is None:
+            self._stats["misses"] += 1
+            return None
+        self._prompts.move_to_end(key)
+        self._stats["hits"] += 1
+        return prompt
+
+    def put(self, key: Optional[str], prompt: str) -> None:
+        """Cache a rendered prompt.
+
+        Args:
+            key: Cache key from ``make_key``
+            prompt: Rendered prompt
+        """
+        if key is None:
+            return
+        self._prompts[key] = prompt
+        self._prompts.move_to_end(key)
+        while len(self._prompts) > self.max_entries:
+            self._prompts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached prompts and reset the statistics."""
+        self._prompts.clear()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with cached prompt count, hits and misses
+        """
+        return {"entries": len(self._prompts), **self._stats}
+
+
+# Process-wide cache shared by all team builds
+system_prompt_cache = SystemPromptCache()
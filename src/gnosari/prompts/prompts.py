@@ -23,12 +23,37 @@ def build_agent_system_prompt(name: str, instructions: str, agent_tools: List[st
     if tool_manager and team_config and 'tools' in team_config:
         tool_manager.load_tools_from_config(team_config)
     
-    background = [
+    # Sections go from the most to the least widely shared (tools, knowledge,
+    # identity, collaboration) so agents with the same tools share a prompt
+    # prefix, and nothing run-specific is rendered: identical configurations
+    # give byte-identical prompts that providers can serve from their prompt cache.
+    background = []
+    
+    # Add tool information using real tool info if available
+    tool_sections = get_tools_definition(agent_tools, tool_manager, real_tool_info)
+    if tool_sections:
+        background.extend(tool_sections)
+    
+    # Add knowledge base access if configured
+    if agent_config and 'knowledge' in agent_config and agent_config['knowledge']:
+        knowledge_names = agent_config['knowledge']
+        background.append("## Available Knowledge Bases")
+        for kb_name in knowledge_names:
+            description = knowledge_descriptions.get(kb_name, "") if knowledge_descriptions else ""
+            kb_info = f"- **{kb_name}**"
+            if description:
+                kb_info += f": {description}"
+            background.append(kb_info)
+        background.append("")
+        background.append("**Important**: Use the `knowledge_query` tool with exact knowledge base names. Always search knowledge before responding.")
+        background.append("")
+    
+    background.extend([
         f"# {name}",
         "",
         instructions,
         "",
-    ]
+    ])
     
     # Add collaboration mechanisms if configured
     has_delegation = agent_config and 'delegation' in agent_config and agent_config['delegation']
@@ -61,25 +86,6 @@ def build_agent_system_prompt(name: str, instructions: str, agent_tools: List[st
                 if isinstance(transfer_config, dict) and transfer_config.get('agent') and transfer_config.get('instructions'):
                     background.append(f"- **{transfer_config['agent']}**: {transfer_config['instructions']}")
             background.append("")
-
-    # Add knowledge base access if configured
-    if agent_config and 'knowledge' in agent_config and agent_config['knowledge']:
-        knowledge_names = agent_config['knowledge']
-        background.append("## Available Knowledge Bases")
-        for kb_name in knowledge_names:
-            description = knowledge_descriptions.get(kb_name, "") if knowledge_descriptions else ""
-            kb_info = f"- **{kb_name}**"
-            if description:
-                kb_info += f": {description}"
-            background.append(kb_info)
-        background.append("")
-        background.append("**Important**: Use the `knowledge_query` tool with exact knowledge base names. Always search knowledge before responding.")
-        background.append("")
-    
-    # Add tool information using real tool info if available
-    tool_sections = get_tools_definition(agent_tools, tool_manager, real_tool_info)
-    if tool_sections:
-        background.extend(tool_sections)
     
     return {
         "background": background,
@@ -88,3 +94,17 @@ def build_agent_system_prompt(name: str, instructions: str, agent_tools: List[st
     }
 
 
+def render_system_prompt(prompt_components: Dict[str, List[str]]) -> str:
+    """Render system prompt components into the final prompt text.
+    
+    Args:
+        prompt_components: Dictionary with 'background', 'steps', and 'output_instructions' lists
+        
+    Returns:
+        Prompt text with the non-empty components in order
+    """
+    prompt_parts = []
+    for component in ("background", "steps", "output_instructions"):
+        if prompt_components.get(component):
+            prompt_parts.append("\n".join(prompt_components[component]))
+    return "\n".join(prompt_parts)
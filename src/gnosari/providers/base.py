@@ -19,6 +19,8 @@ class ProviderConfig:
     base_url: Optional[str] = None
     env_var_name: str = "OPENAI_API_KEY"
     timeout: int = 300
+    # Retries of the AsyncOpenAI client itself; ProviderTransport retries with gnosari's policy
+    max_retries: int = 0
 
 
 class BaseLLMProvider(ABC):
@@ -59,6 +61,22 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    def create_http_client(self):
+        """
+        Create the HTTP client used by this provider's AsyncOpenAI clients.
+        
+        Requests go through ``ProviderTransport``, which applies gnosari-level
+        request policy (rate-limit budgets, retries with backoff and
+        concurrency limits per endpoint).
+        
+        Returns:
+            httpx-based async client for AsyncOpenAI
+        """
+        from openai import DefaultAsyncHttpxClient
+        from .transport import ProviderTransport
+        
+        return DefaultAsyncHttpxClient(transport=ProviderTransport(self.get_provider_name()))
+    
     def get_api_key(self) -> str:
         """
         Get the API key for this provider.
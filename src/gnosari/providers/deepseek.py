@@ -43,7 +43,9 @@ class DeepSeekProvider(BaseLLMProvider):
             return AsyncOpenAI(
                 api_key=self.get_api_key(),
                 base_url=self.config.base_url,
-                timeout=self.config.timeout
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                http_client=self.create_http_client()
             )
             
         except ImportError:
@@ -0,0 +1,323 @@
+"""
+Rate-limit budgets and retry policy for provider requests.
+
+Providers report their remaining request and token budgets in response
+headers (``x-ratelimit-remaining-requests``, ``x-ratelimit-reset-tokens``,
+``anthropic-ratelimit-requests-remaining``, ...). ``RateLimitBudget`` keeps
+the latest values per endpoint and model and delays new requests while a
+budget is exhausted; once a budget runs low, requests are spaced evenly over
+the time left until it resets, so load is smoothed before the provider
+starts answering with 429s. ``RetryPolicy`` decides which failures are
+retried and how long to back off.
+
+Configuration:
+
+- ``GNOSARI_PROVIDER_MAX_RETRIES``: retries per request (default 3)
+- ``GNOSARI_PROVIDER_BACKOFF_BASE``: first backoff ceiling in seconds (default 0.5)
+- ``GNOSARI_PROVIDER_BACKOFF_MAX``: maximum backoff in seconds (default 30)
+- ``GNOSARI_PROVIDER_PACING_THRESHOLD``: fraction of a budget below which
+  requests are paced (default 0.1, 0 disables pacing)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: timeouts, conflicts, rate limits and server errors
+RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# Header names per budget: (limit, remaining, reset)
+_BUDGET_HEADERS = {
+    "requests": (
+        ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+        ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining",
+         "anthropic-ratelimit-requests-reset"),
+    ),
+    "tokens": (
+        ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+        ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining",
+         "anthropic-ratelimit-tokens-reset"),
+    ),
+}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_count(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit reset header into seconds from now.
+
+    Accepts plain seconds (``"2"``), durations (``"1m30s"``, ``"250ms"``)
+    and RFC 3339 timestamps (``"2024-01-01T00:00:30Z"``).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds until the reset, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Get the delay requested by ``retry-after-ms`` or ``retry-after`` headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the response requests no delay
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for failed provider requests."""
+
+    def __init__(self, max_retries: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None):
+        """Initialize the policy.
+
+        Args:
+            max_retries: Retries per request (default GNOSARI_PROVIDER_MAX_RETRIES or 3)
+            base_delay: Backoff ceiling of the first retry in seconds (default GNOSARI_PROVIDER_BACKOFF_BASE or 0.5)
+            max_delay: Maximum backoff in seconds (default GNOSARI_PROVIDER_BACKOFF_MAX or 30)
+        """
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv("GNOSARI_PROVIDER_MAX_RETRIES", "3"))
+        self.base_delay = base_delay if base_delay is not None else float(
+            os.getenv("GNOSARI_PROVIDER_BACKOFF_BASE", "0.5"))
+        self.max_delay = max_delay if max_delay is not None else float(
+            os.getenv("GNOSARI_PROVIDER_BACKOFF_MAX", "30"))
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """Check whether a response status is retried.
+
+        Args:
+            status_code: Response status code
+            attempt: Number of retries already made
+
+        Returns:
+            True if the request should be sent again
+        """
+        return attempt < self.max_retries and (status_code in RETRY_STATUSES or status_code >= 500)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute the delay before a retry.
+
+        Uses full jitter (a random delay up to an exponentially growing
+        ceiling), so retries of concurrent requests spread out instead of
+        arriving together. A delay requested by the provider is honoured.
+
+        Args:
+            attempt: Number of retries already made
+            retry_after: Delay requested by the provider in seconds
+
+        Returns:
+            Seconds to wait
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class RateLimitBudget:
+    """Request and token budgets of one model at one endpoint."""
+
+    def __init__(self, name: str, pacing_threshold: float = 0.1):
+        """Initialize the budget.
+
+        Args:
+            name: Budget name (endpoint and model), used in logs
+            pacing_threshold: Fraction of a budget below which requests are paced
+        """
+        self.name = name
+        self.pacing_threshold = pacing_threshold
+        # budget -> (limit, remaining, monotonic reset time)
+        self._budgets: Dict[str, Tuple[Optional[int], int, float]] = {}
+        self._blocked_until = 0.0
+        self._next_request_at = 0.0
+        self._stats = {"requests": 0, "throttled": 0, "throttle_seconds": 0.0, "rate_limited": 0}
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the budgets reported in response headers.
+
+        Args:
+            headers: Response headers
+        """
+        now = time.monotonic()
+        for budget, families in _BUDGET_HEADERS.items():
+            for limit_header, remaining_header, reset_header in families:
+                remaining = _parse_count(headers.get(remaining_header))
+                if remaining is None:
+                    continue
+                reset = parse_reset(headers.get(reset_header))
+                self._budgets[budget] = (
+                    _parse_count(headers.get(limit_header)),
+                    remaining,
+                    now + (reset if reset is not None else 1.0)
+                )
+                break
+
+    def block(self, seconds: float) -> None:
+        """Hold back all requests of this budget, e.g. after a 429 response.
+
+        Args:
+            seconds: Seconds to wait before the next request
+        """
+        self._stats["rate_limited"] += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def delay(self, estimated_tokens: int = 0) -> float:
+        """Compute how long the next request should wait.
+
+        Also reserves the request's place in the pacing schedule.
+
+        Args:
+            estimated_tokens: Estimated token cost of the request
+
+        Returns:
+            Seconds to wait before sending
+        """
+        now = time.monotonic()
+        start = max(now, self._blocked_until)
+
+        for budget, (limit, remaining, reset_at) in list(self._budgets.items()):
+            if reset_at <= now:
+                # The window reset; budgets are refreshed by the next response
+                del self._budgets[budget]
+                continue
+            needed = estimated_tokens if budget == "tokens" else 1
+            if remaining < max(needed, 1):
+                start = max(start, reset_at)
+                continue
+            if limit and self.pacing_threshold > 0 and remaining < limit * self.pacing_threshold:
+                # Spread the remaining budget evenly over the rest of the window
+                interval = (reset_at - now) / (remaining / max(needed, 1))
+                start = max(start, self._next_request_at + interval)
+            # Count this request against the budget until the next response updates it
+            self._budgets[budget] = (limit, remaining - needed, reset_at)
+
+        self._next_request_at = start
+        return start - now
+
+    async def wait(self, estimated_tokens: int = 0) -> None:
+        """Wait until the next request fits the budget.
+
+        Args:
+            estimated_tokens: Estimated token cost of the request
+        """
+        self._stats["requests"] += 1
+        delay = self.delay(estimated_tokens)
+        if delay > 0:
+            self._stats["throttled"] += 1
+            self._stats["throttle_seconds"] += delay
+            logger.debug(f"⏳ Delaying request to {self.name} by {delay:.2f}s to stay within rate limits")
+            await asyncio.sleep(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get budget statistics.
+
+        Returns:
+            Dict with last known remaining budgets and throttling counts
+        """
+        return {
+            **{f"remaining_{budget}": remaining for budget, (_, remaining, _) in self._budgets.items()},
+            **self._stats
+        }
+
+
+class RateLimiter:
+    """Registry of rate-limit budgets per endpoint and model."""
+
+    def __init__(self, pacing_threshold: Optional[float] = None):
+        """Initialize the registry.
+
+        Args:
+            pacing_threshold: Fraction of a budget below which requests are paced
+                (default GNOSARI_PROVIDER_PACING_THRESHOLD or 0.1)
+        """
+        self.pacing_threshold = pacing_threshold if pacing_threshold is not None else float(
+            os.getenv("GNOSARI_PROVIDER_PACING_THRESHOLD", "0.1"))
+        self._budgets: Dict[str, RateLimitBudget] = {}
+
+    def get_budget(self, host: str, model: Optional[str]) -> RateLimitBudget:
+        """Get the budget of a model at an endpoint.
+
+        Args:
+            host: Provider endpoint host
+            model: Model name, if the request names one
+
+        Returns:
+            RateLimitBudget instance
+        """
+        name = f"{host}/{model}" if model else host
+        budget = self._budgets.get(name)
+        if budget is None:
+            budget = RateLimitBudget(name, self.pacing_threshold)
+            self._budgets[name] = budget
+        return budget
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics of all budgets.
+
+        Returns:
+            Dict mapping budget names to their statistics
+        """
+        return {name: budget.get_stats() for name, budget in self._budgets.items()}
+
+
+# Process-wide rate-limit budgets
+rate_limiter = RateLimiter()
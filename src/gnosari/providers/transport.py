@@ -0,0 +1,145 @@
+"""
+HTTP transport for provider clients.
+
+Wraps the httpx transport of the AsyncOpenAI clients created by providers,
+so every model request passes through gnosari-level policy before it
+reaches the provider:
+
+- requests wait until the rate-limit budget of their model allows them
+  (see ``rate_limits``), and update it from the response headers
+- 429, 5xx and connection failures are retried with jittered backoff,
+  honouring ``retry-after`` headers
+- requests hold a slot of the provider endpoint's concurrency limit
+  (``GNOSARI_MAX_PROVIDER_REQUESTS``) until their response, including a
+  streamed one, is closed; the slot is released while backing off
+"""
+
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+
+from ..core.admission import admission_controller
+from .rate_limits import RateLimiter, RetryPolicy, parse_retry_after, rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits of the OpenAI client's default transport
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that calls ``on_close`` exactly once when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+
+def _request_body(request: httpx.Request) -> Optional[bytes]:
+    """Get the body of a request, or None if it is streamed (and cannot be sent again)."""
+    try:
+        return request.content
+    except httpx.RequestNotRead:
+        return None
+
+
+def _request_model(body: Optional[bytes]) -> Optional[str]:
+    """Get the model named in a JSON request body."""
+    if not body or not body.startswith(b"{"):
+        return None
+    try:
+        model = json.loads(body).get("model")
+    except ValueError:
+        return None
+    return model if isinstance(model, str) else None
+
+
+class ProviderTransport(httpx.AsyncBaseTransport):
+    """httpx transport applying rate limits, retries and concurrency limits to provider requests."""
+
+    def __init__(self, provider_name: str, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 retry_policy: Optional[RetryPolicy] = None, limiter: Optional[RateLimiter] = None):
+        """Initialize the transport.
+
+        Args:
+            provider_name: Name of the provider, used in logs
+            transport: Transport performing the requests (default: pooled HTTP transport)
+            retry_policy: Retry policy (default: configured from the environment)
+            limiter: Rate-limit budgets (default: the process-wide budgets)
+        """
+        self.provider_name = provider_name
+        self._transport = transport or httpx.AsyncHTTPTransport(limits=DEFAULT_CONNECTION_LIMITS)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter = limiter or rate_limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = _request_body(request)
+        budget = self.limiter.get_budget(request.url.host, _request_model(body))
+        # Rough token estimate of the prompt: about four bytes per token
+        estimated_tokens = len(body) // 4 if body else 0
+        # Streamed bodies are consumed by the first attempt
+        replayable = body is not None
+        attempt = 0
+        while True:
+            await budget.wait(estimated_tokens)
+            try:
+                response = await self._send(request)
+            except httpx.TransportError as e:
+                if not replayable or attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.backoff(attempt)
+                logger.warning(f"🔁 {self.provider_name} request failed ({type(e).__name__}), "
+                               f"retry {attempt + 1}/{self.retry_policy.max_retries} in {delay:.2f}s")
+            else:
+                budget.update(response.headers)
+                if not replayable or not self.retry_policy.should_retry(response.status_code, attempt):
+                    return response
+                retry_after = parse_retry_after(response.headers)
+                delay = self.retry_policy.backoff(attempt, retry_after)
+                if response.status_code == 429:
+                    # Hold back the model's other requests too
+                    budget.block(delay)
+                await response.aclose()
+                logger.warning(f"🔁 {self.provider_name} returned {response.status_code}, "
+                               f"retry {attempt + 1}/{self.retry_policy.max_retries} in {delay:.2f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        limit = admission_controller.get_limit(
+            f"provider:{request.url.host}", admission_controller.max_provider_requests
+        )
+        if limit is None:
+            return await self._transport.handle_async_request(request)
+
+        await limit.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            limit.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, limit.release),
+            extensions=response.extensions,
+            request=request
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
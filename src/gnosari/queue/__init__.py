@@ -1,12 +1,19 @@
 """Gnosari Queue System - Celery-based async job processing."""
 
 from .app import celery_app
-from .base import BaseMessage, BaseConsumer
+from .base import BaseMessage, BaseConsumer, BatchConsumer
 from .config import CeleryConfig
+from .backends import QueueBackend, CeleryQueueBackend, InMemoryQueueBackend, get_queue_backend, set_queue_backend
 
 __all__ = [
     "celery_app",
     "BaseMessage", 
     "BaseConsumer",
-    "CeleryConfig"
+    "BatchConsumer",
+    "CeleryConfig",
+    "QueueBackend",
+    "CeleryQueueBackend",
+    "InMemoryQueueBackend",
+    "get_queue_backend",
+    "set_queue_backend"
 ]
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Pluggable queue backends.
+
+``celery`` (default) delivers messages through the broker to worker
+processes; ``memory`` runs them on in-process asyncio queues, needing no
+broker. Select with GNOSARI_QUEUE_BACKEND or ``set_queue_backend``.
+"""
+
+import logging
+import os
+from typing import Optional
+
+from .base import QueueBackend, TaskHandler, register_task_handler, get_task_handler
+from .celery_backend import CeleryQueueBackend
+from .memory import InMemoryQueueBackend
+
+logger = logging.getLogger(__name__)
+
+_queue_backend: Optional[QueueBackend] = None
+
+
+def _use_local_services() -> None:
+    """Keep results and team configs in process when there is no broker."""
+    from ..services.config_store import config_store
+    from ..services.result_channel import tool_result_channel, LocalResultStore
+
+    if not os.getenv("GNOSARI_TOOL_RESULT_STORE"):
+        tool_result_channel.set_store(LocalResultStore())
+    if not os.getenv("GNOSARI_CONFIG_STORE"):
+        config_store.backend = "local"
+
+
+def set_queue_backend(backend: QueueBackend) -> None:
+    """Set the process-wide queue backend.
+
+    Args:
+        backend: Backend instance
+    """
+    global _queue_backend
+    _queue_backend = backend
+    if not isinstance(backend, CeleryQueueBackend):
+        _use_local_services()
+    logger.info(f"Using '{backend.name}' queue backend")
+
+
+def get_queue_backend() -> QueueBackend:
+    """Get the process-wide queue backend, creating it from GNOSARI_QUEUE_BACKEND.
+
+    Returns:
+        QueueBackend instance
+    """
+    if _queue_backend is None:
+        from ..config import CeleryConfig
+
+        backend_name = os.getenv("GNOSARI_QUEUE_BACKEND", "celery").lower()
+        if backend_name == "memory":
+            set_queue_backend(InMemoryQueueBackend(
+                concurrency=int(os.getenv("GNOSARI_MEMORY_QUEUE_CONCURRENCY", "4")),
+                queue_concurrency=CeleryConfig.queue_concurrency
+            ))
+        else:
+            if backend_name != "celery":
+                logger.warning(f"Unknown queue backend '{backend_name}', defaulting to celery")
+            set_queue_backend(CeleryQueueBackend())
+    return _queue_backend
+
+
+__all__ = [
+    "QueueBackend",
+    "TaskHandler",
+    "CeleryQueueBackend",
+    "InMemoryQueueBackend",
+    "register_task_handler",
+    "get_task_handler",
+    "get_queue_backend",
+    "set_queue_backend"
+]
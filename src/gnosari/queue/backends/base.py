@@ -0,0 +1,83 @@
+"""Queue backend interface and task handler registry."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..base import BaseMessage
+
+
+@dataclass
+class TaskHandler:
+    """In-process handler for a named task."""
+    message_class: type[BaseMessage]
+    handler: Callable[[BaseMessage], Awaitable[Any]]
+
+
+_task_handlers: Dict[str, TaskHandler] = {}
+
+
+def register_task_handler(task_name: str,
+                          message_class: type[BaseMessage],
+                          handler: Callable[[BaseMessage], Awaitable[Any]]) -> None:
+    """Register the coroutine that runs a task in process.
+
+    Backends that don't go through Celery use these handlers; the task name
+    is the same name the Celery task is registered under.
+
+    Args:
+        task_name: Task name
+        message_class: Message class the payload deserializes to
+        handler: Coroutine function processing one message
+    """
+    _task_handlers[task_name] = TaskHandler(message_class=message_class, handler=handler)
+
+
+def get_task_handler(task_name: str) -> Optional[TaskHandler]:
+    """Get the in-process handler for a task.
+
+    Args:
+        task_name: Task name
+
+    Returns:
+        TaskHandler or None if none is registered
+    """
+    return _task_handlers.get(task_name)
+
+
+class QueueBackend(ABC):
+    """Interface for delivering queue messages to consumers."""
+
+    name: str = "base"
+    supports_batching: bool = False
+
+    @abstractmethod
+    def submit(self,
+               task_name: str,
+               message: BaseMessage,
+               queue: Optional[str] = None,
+               priority: Optional[int] = None,
+               timeout: Optional[float] = None,
+               task_id: Optional[str] = None) -> str:
+        """Submit a message for processing.
+
+        Args:
+            task_name: Name of the task that processes the message
+            message: Message to deliver
+            queue: Target queue (None for the default queue)
+            priority: Priority 1-10, lower is higher priority (defaults to message.priority)
+            timeout: Processing timeout in seconds
+            task_id: Task identifier (defaults to the message ID)
+
+        Returns:
+            str: Task identifier
+        """
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics.
+
+        Returns:
+            Dict with backend-specific statistics
+        """
+        return {"backend": self.name}
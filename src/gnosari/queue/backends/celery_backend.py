@@ -0,0 +1,38 @@
+"""Celery queue backend."""
+
+import logging
+from typing import Optional
+
+from ..base import BaseMessage
+from .base import QueueBackend
+
+logger = logging.getLogger(__name__)
+
+
+class CeleryQueueBackend(QueueBackend):
+    """Delivers messages through the Celery broker to worker processes."""
+
+    name = "celery"
+    supports_batching = True
+
+    def submit(self,
+               task_name: str,
+               message: BaseMessage,
+               queue: Optional[str] = None,
+               priority: Optional[int] = None,
+               timeout: Optional[float] = None,
+               task_id: Optional[str] = None) -> str:
+        from ..app import celery_app
+
+        task_id = task_id or message.message_id
+        options = {
+            "priority": priority if priority is not None else message.priority,
+            "task_id": task_id
+        }
+        if queue:
+            options["queue"] = queue
+
+        # Celery's JSON serializer encodes the message once
+        celery_app.send_task(task_name, args=[message.to_dict()], **options)
+        logger.debug(f"Sent {task_name} to Celery (task {task_id}, queue {queue or 'default'})")
+        return task_id
@@ -0,0 +1,173 @@
+"""
+In-process asyncio queue backend.
+
+Runs queued messages on the caller's event loop, with no broker and no
+worker processes. Suited to single-process deployments and test suites.
+Messages take the same JSON round trip they would through Celery, so a
+message that works here serializes under Celery too.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..base import BaseMessage
+from .base import QueueBackend, get_task_handler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE = "default"
+
+
+class InMemoryQueueBackend(QueueBackend):
+    """Asyncio priority queues consumed by in-process worker tasks.
+
+    Each queue has its own worker tasks (``concurrency`` per queue). Lower
+    priority numbers are served first, messages are processed under their
+    timeout, and failures are retried with exponential backoff up to the
+    message's ``max_retries``.
+    """
+
+    name = "memory"
+    supports_batching = False
+
+    def __init__(self, concurrency: int = 4, queue_concurrency: Optional[Dict[str, int]] = None,
+                 retry_base_delay: float = 1.0):
+        """Initialize the in-memory backend.
+
+        Args:
+            concurrency: Worker tasks per queue
+            queue_concurrency: Per-queue overrides of ``concurrency``
+            retry_base_delay: Seconds before the first retry; doubled for each further retry
+        """
+        self.concurrency = max(1, concurrency)
+        self.queue_concurrency = queue_concurrency or {}
+        self.retry_base_delay = retry_base_delay
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._workers: Dict[str, List[asyncio.Task]] = {}
+        # Retries waiting out their backoff before being queued again
+        self._retries: Set[asyncio.Task] = set()
+        self._sequence = itertools.count()
+        self._stats = {"submitted": 0, "processed": 0, "failed": 0, "retried": 0}
+
+    def _get_queue(self, name: str) -> asyncio.PriorityQueue:
+        """Get a queue on the running loop, starting its workers on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new event loop (e.g. a new asyncio.run) - queues of the old one are unusable
+            self._loop = loop
+            self._queues = {}
+            self._workers = {}
+            self._retries = set()
+
+        queue = self._queues.get(name)
+        if queue is None:
+            queue = asyncio.PriorityQueue()
+            self._queues[name] = queue
+            count = self.queue_concurrency.get(name, self.concurrency)
+            self._workers[name] = [
+                loop.create_task(self._worker(name, queue), name=f"gnosari-queue-{name}-{index}")
+                for index in range(count)
+            ]
+        return queue
+
+    def submit(self,
+               task_name: str,
+               message: BaseMessage,
+               queue: Optional[str] = None,
+               priority: Optional[int] = None,
+               timeout: Optional[float] = None,
+               task_id: Optional[str] = None) -> str:
+        if get_task_handler(task_name) is None:
+            raise ValueError(f"No in-process handler registered for task '{task_name}'")
+
+        try:
+            target = self._get_queue(queue or DEFAULT_QUEUE)
+        except RuntimeError:
+            raise RuntimeError("InMemoryQueueBackend.submit must be called from a running event loop")
+
+        task_id = task_id or message.message_id
+        if timeout is None:
+            timeout = getattr(message, "timeout", None)
+        priority = priority if priority is not None else message.priority
+
+        # Same JSON round trip as the Celery serializer
+        payload = json.loads(json.dumps(message.to_dict()))
+        target.put_nowait((priority, next(self._sequence), task_name, payload, task_id, timeout))
+        self._stats["submitted"] += 1
+        logger.debug(f"Queued {task_name} in memory (task {task_id}, queue {queue or DEFAULT_QUEUE}, priority {priority})")
+        return task_id
+
+    async def _worker(self, queue_name: str, queue: asyncio.PriorityQueue) -> None:
+        """Process messages from one queue until cancelled."""
+        while True:
+            item = await queue.get()
+            try:
+                await self._process(queue_name, item)
+            except Exception as e:
+                logger.error(f"❌ Unexpected error in in-memory worker for '{queue_name}': {e}")
+            finally:
+                queue.task_done()
+
+    async def _process(self, queue_name: str, item: Tuple) -> None:
+        """Run one message through its handler, retrying on failure."""
+        priority, _, task_name, payload, task_id, timeout = item
+        task_handler = get_task_handler(task_name)
+        message = task_handler.message_class.from_dict(payload)
+
+        try:
+            await asyncio.wait_for(task_handler.handler(message), timeout=timeout)
+            self._stats["processed"] += 1
+        except Exception as exc:
+            if isinstance(exc, asyncio.TimeoutError):
+                exc = TimeoutError(f"Task {task_id} timed out after {timeout} seconds")
+            if message.retry_count < message.max_retries:
+                message.retry_count += 1
+                countdown = self.retry_base_delay * 2 ** message.retry_count
+                self._stats["retried"] += 1
+                logger.warning(f"⏰ Retrying {task_name} (task {task_id}) in {countdown}s "
+                               f"(attempt {message.retry_count}/{message.max_retries}): {exc}")
+                retry_item = (priority, next(self._sequence), task_name, message.to_dict(), task_id, timeout)
+                retry = asyncio.get_running_loop().create_task(self._requeue(countdown, queue_name, retry_item))
+                self._retries.add(retry)
+                retry.add_done_callback(self._retries.discard)
+            else:
+                self._stats["failed"] += 1
+                logger.error(f"💀 Task {task_id} ({task_name}) failed permanently: {exc}")
+
+    async def _requeue(self, delay: float, queue_name: str, item: Tuple) -> None:
+        await asyncio.sleep(delay)
+        queue = self._queues.get(queue_name)
+        if queue is not None:
+            queue.put_nowait(item)
+
+    async def join(self) -> None:
+        """Wait until every queued message has been processed, including pending retries."""
+        while True:
+            for queue in list(self._queues.values()):
+                await queue.join()
+            if not self._retries:
+                return
+            # Requeued retries are picked up by the next round of queue joins
+            await asyncio.gather(*self._retries, return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Cancel worker tasks and pending retries. Messages still queued are dropped."""
+        workers = [task for tasks in self._workers.values() for task in tasks] + list(self._retries)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues = {}
+        self._workers = {}
+        self._retries = set()
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            **self._stats,
+            "queue_depths": {name: queue.qsize() for name, queue in self._queues.items()}
+        }
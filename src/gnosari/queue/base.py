@@ -1,7 +1,8 @@
 """Base classes for Gnosari queue system messages and consumers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TypeVar
+from typing import Any, Dict, List, Optional, TypeVar
 from pydantic import BaseModel, Field
 from celery import Task
 from datetime import datetime
@@ -100,6 +101,26 @@ class BaseConsumer(ABC):
         return message.retry_count < message.max_retries
 
 
+class BatchConsumer(BaseConsumer):
+    """Base class for consumers that can process several messages at once.
+    
+    Batching amortizes per-task broker and bookkeeping overhead for
+    high-volume small messages. Subclasses override ``process_batch`` with a
+    real batch implementation; the default processes items concurrently.
+    """
+    
+    async def process_batch(self, messages: List[MessageType]) -> List[Any]:
+        """Process a batch of messages.
+        
+        Args:
+            messages: Messages to process
+            
+        Returns:
+            List[Any]: One result per message, in input order
+        """
+        return list(await asyncio.gather(*(self.process(message) for message in messages)))
+
+
 class ConsumerTask(Task):
     """Custom Celery task class for consumers."""
     
@@ -1,12 +1,40 @@
 """Celery configuration for Gnosari queue system."""
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+
+def _parse_queue_concurrency(value: str) -> Dict[str, int]:
+    """Parse a 'queue=concurrency,...' specification."""
+    concurrency = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, count = item.split("=", 1)
+            concurrency[name.strip()] = int(count)
+    return concurrency
 
 
 class CeleryConfig:
     """Celery configuration class following best practices."""
     
+    # Queue names. Short interactive tools get their own queue so they never
+    # wait behind long-running ingestion or shell jobs.
+    INTERACTIVE_QUEUE = "gnosari_interactive"
+    DEFAULT_QUEUE = "gnosari_queue"
+    LONG_RUNNING_QUEUE = "gnosari_long"
+    QUEUES = (INTERACTIVE_QUEUE, DEFAULT_QUEUE, LONG_RUNNING_QUEUE)
+    
+    # Routing thresholds applied to AsyncTool.get_async_metadata()
+    INTERACTIVE_MAX_PRIORITY = 3   # priority <= 3 goes to the interactive queue
+    LONG_RUNNING_MIN_PRIORITY = 8  # priority >= 8 goes to the long-running queue
+    LONG_RUNNING_MIN_TIMEOUT = 900  # timeouts of 15 minutes or more are long-running
+    
+    # Default worker concurrency per queue for `gnosari worker start --queues all`
+    queue_concurrency = _parse_queue_concurrency(os.getenv(
+        "GNOSARI_QUEUE_CONCURRENCY",
+        f"{INTERACTIVE_QUEUE}=4,{DEFAULT_QUEUE}=2,{LONG_RUNNING_QUEUE}=1"
+    ))
+    
     # Broker and Result Backend
     broker_url = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
     result_backend = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
@@ -20,9 +48,20 @@ class CeleryConfig:
     result_expires = 3600  # 1 hour
     result_persistent = True
     
-    # Task Routing
+    # Task Routing (per-message queues from route_for_metadata override this)
+    task_default_queue = DEFAULT_QUEUE
     task_routes = {
-        "gnosari.queue.consumers.*": {"queue": "gnosari_queue"}
+        "gnosari.queue.consumers.*": {"queue": DEFAULT_QUEUE}
+    }
+    
+    # Broker priorities (1-10, lower is higher priority, as in BaseMessage).
+    # The Redis transport emulates priorities with one list per priority step.
+    task_default_priority = 5
+    task_queue_max_priority = 10
+    broker_transport_options = {
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority"
     }
     
     # Worker Configuration
@@ -43,11 +82,40 @@ class CeleryConfig:
     worker_hijack_root_logger = False
     worker_log_color = False
     
+    @classmethod
+    def route_for_metadata(cls, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Map async tool metadata to a queue and broker priority.
+        
+        An explicit ``queue`` in the metadata wins; otherwise high-priority
+        tools go to the interactive queue and low-priority or long-timeout
+        tools to the long-running queue.
+        
+        Args:
+            metadata: Result of AsyncTool.get_async_metadata()
+            
+        Returns:
+            Dict with ``queue`` and ``priority``
+        """
+        metadata = metadata or {}
+        priority = min(max(int(metadata.get("priority", cls.task_default_priority)), 1), 10)
+        timeout = metadata.get("timeout") or 0
+        
+        queue = metadata.get("queue")
+        if not queue:
+            if priority <= cls.INTERACTIVE_MAX_PRIORITY:
+                queue = cls.INTERACTIVE_QUEUE
+            elif priority >= cls.LONG_RUNNING_MIN_PRIORITY or timeout >= cls.LONG_RUNNING_MIN_TIMEOUT:
+                queue = cls.LONG_RUNNING_QUEUE
+            else:
+                queue = cls.DEFAULT_QUEUE
+        
+        return {"queue": queue, "priority": priority}
+    
     @classmethod
     def get_config(cls) -> Dict[str, Any]:
         """Get configuration as dictionary."""
         return {
             attr: getattr(cls, attr)
             for attr in dir(cls)
-            if not attr.startswith("_") and attr != "get_config"
+            if not attr.startswith("_") and attr.islower() and not callable(getattr(cls, attr))
         }
\ No newline at end of file
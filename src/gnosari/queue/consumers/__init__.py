@@ -1,7 +1,14 @@
 """Queue consumers for Gnosari."""
 
 from .example import ExampleMessage, ExampleConsumer, process_example_task
-from .tool_execution import ToolExecutionMessage, ToolExecutionConsumer, process_tool_execution_task
+from .tool_execution import (
+    ToolExecutionMessage,
+    ToolExecutionConsumer,
+    ToolExecutionBatchConsumer,
+    process_tool_execution_task,
+    process_tool_execution_batch_task,
+    tool_execution_batcher
+)
 
 __all__ = [
     "ExampleMessage",
@@ -9,5 +16,8 @@ __all__ = [
     "process_example_task",
     "ToolExecutionMessage",
     "ToolExecutionConsumer",
-    "process_tool_execution_task"
+    "ToolExecutionBatchConsumer",
+    "process_tool_execution_task",
+    "process_tool_execution_batch_task",
+    "tool_execution_batcher"
 ]
\ No newline at end of file
@@ -1,13 +1,19 @@
 """Tool execution message and consumer for async tool processing."""
 
+import atexit
+import json
+import os
 import uuid
 import asyncio
 import importlib
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import Field
-from ..base import BaseMessage, BaseConsumer
+from ..base import BaseMessage, BaseConsumer, BatchConsumer
 from ..app import celery_app
+from ..backends import get_queue_backend, register_task_handler
+from ..services.result_channel import tool_result_channel
 from ...tools.interfaces import AsyncTool
 
 # Set up logger for this module
@@ -27,6 +33,7 @@ class ToolExecutionMessage(BaseMessage):
     agent_id: Optional[str] = Field(default=None, description="ID of the agent that requested the tool")
     session_id: Optional[str] = Field(default=None, description="Session ID for the tool execution")
     team_data: Optional[Dict[str, Any]] = Field(default=None, description="Serialized team data for delegation tools")
+    timeout: int = Field(default=600, description="Tool execution timeout in seconds")
     
     @classmethod
     def create(cls, 
@@ -115,7 +122,6 @@ class ToolExecutionConsumer(BaseConsumer):
         logger.debug(f"   Class: {message.tool_class}")
         logger.debug(f"   Tool Args: {message.tool_args}")
         logger.debug(f"   Init Args: {message.tool_init_args}")
-        logger.debug(f"   Context Data: {message.context_data}")
         
         try:
             logger.debug(f"Creating tool instance for {message.tool_name}")
@@ -131,40 +137,47 @@ class ToolExecutionConsumer(BaseConsumer):
             
             # Create context for tool execution
             logger.debug("Creating RunContextWrapper for tool execution")
-            context_wrapper = self._create_context_wrapper(message)
+            context_wrapper = await self._create_context_wrapper(message)
             
             # Execute the tool
             logger.debug(f"Executing tool {message.tool_name} with args: {message.tool_args}")
-            result = await self._execute_tool(tool_instance, context_wrapper, message.tool_args)
+            result = await self._execute_tool(tool_instance, context_wrapper, message.tool_args, message.timeout)
             logger.info(f"✅ Tool {message.tool_name} executed successfully")
             logger.debug(f"Tool result: {str(result)[:200]}...")
             
-            return {
-                "task_id": message.task_id,
-                "tool_name": message.tool_name,
-                "status": "success",
-                "result": result,
-                "agent_id": message.agent_id,
-                "session_id": message.session_id,
-                "context_data": message.context_data,
-                "processed_at": message.created_at.isoformat()
-            }
+            return self._build_result(message, "success", result=result)
             
         except Exception as e:
             error_result = f"Tool execution failed: {str(e)}"
             logger.error(f"❌ Tool execution error for {message.tool_name}: {error_result}")
             logger.debug(f"Full exception details:", exc_info=True)
             
-            return {
-                "task_id": message.task_id,
-                "tool_name": message.tool_name,
-                "status": "error",
-                "error": error_result,
-                "agent_id": message.agent_id,
-                "session_id": message.session_id,
-                "context_data": message.context_data,
-                "processed_at": message.created_at.isoformat()
-            }
+            return self._build_result(message, "error", error=error_result)
+    
+    @staticmethod
+    def _build_result(message: ToolExecutionMessage, status: str, result: Any = None, error: str = None) -> Dict[str, Any]:
+        """Build the result dictionary returned for a message.
+        
+        Args:
+            message: The processed message
+            status: 'success' or 'error'
+            result: Tool output for successful executions
+            error: Error description for failed executions
+            
+        Returns:
+            Dict[str, Any]: Tool execution result
+        """
+        outcome = {"result": result} if status == "success" else {"error": error}
+        return {
+            "task_id": message.task_id,
+            "tool_name": message.tool_name,
+            "status": status,
+            **outcome,
+            "agent_id": message.agent_id,
+            "session_id": message.session_id,
+            "context_data": message.context_data,
+            "processed_at": message.created_at.isoformat()
+        }
     
     async def _create_tool_instance(self, message: ToolExecutionMessage) -> Any:
         """Create tool instance dynamically from message configuration.
@@ -176,44 +189,8 @@ class ToolExecutionConsumer(BaseConsumer):
             Tool instance or None if creation failed
         """
         try:
-            logger.debug(f"Importing module: {message.tool_module}")
-            # Import the module
-            module = importlib.import_module(message.tool_module)
-            logger.debug(f"Successfully imported module: {message.tool_module}")
-            
-            # Get the tool class
-            logger.debug(f"Getting class {message.tool_class} from module")
-            tool_class = getattr(module, message.tool_class)
-            logger.debug(f"Successfully got class: {tool_class}")
-            
-            # Create tool instance with initialization arguments
-            # If team_data is available, add it to init_args for tools that need it
-            init_args = message.tool_init_args.copy() if message.tool_init_args else {}
-            
-            # For delegation tools, don't pass team_config as init arg since it's handled separately
-            # The tool will be initialized without team_config and then dependencies will be set
-            
-            if init_args:
-                logger.debug(f"Creating tool instance with init args: {init_args}")
-                tool_instance = tool_class(**init_args)
-            else:
-                logger.debug("Creating tool instance with no init args")
-                tool_instance = tool_class()
-            
-            logger.debug(f"Created tool instance: {type(tool_instance)}")
-            
-            
-            # Get the FunctionTool from the tool instance
-            if hasattr(tool_instance, 'get_tool'):
-                logger.debug("Getting tool via get_tool() method")
-                return tool_instance.get_tool()
-            elif hasattr(tool_instance, 'tool'):
-                logger.debug("Getting tool via .tool attribute")
-                return tool_instance.tool
-            else:
-                logger.debug("Using tool instance directly")
-                # Assume it's already a FunctionTool
-                return tool_instance
+            tool_instance = self._instantiate_tool(message)
+            return self._get_function_tool(tool_instance)
             
         except ImportError as e:
             error_msg = f"Failed to import module {message.tool_module}: {e}"
@@ -229,19 +206,73 @@ class ToolExecutionConsumer(BaseConsumer):
             logger.debug("Full exception details:", exc_info=True)
             return None
     
+    def _instantiate_tool(self, message: ToolExecutionMessage) -> Any:
+        """Import the tool class named in the message and instantiate it.
+        
+        Args:
+            message: Tool execution message containing configuration
+            
+        Returns:
+            Tool class instance
+        """
+        logger.debug(f"Importing module: {message.tool_module}")
+        # Import the module
+        module = importlib.import_module(message.tool_module)
+        logger.debug(f"Successfully imported module: {message.tool_module}")
+        
+        # Get the tool class
+        logger.debug(f"Getting class {message.tool_class} from module")
+        tool_class = getattr(module, message.tool_class)
+        logger.debug(f"Successfully got class: {tool_class}")
+        
+        # Create tool instance with initialization arguments
+        # If team_data is available, add it to init_args for tools that need it
+        init_args = message.tool_init_args.copy() if message.tool_init_args else {}
+        
+        # For delegation tools, don't pass team_config as init arg since it's handled separately
+        # The tool will be initialized without team_config and then dependencies will be set
+        
+        if init_args:
+            logger.debug(f"Creating tool instance with init args: {init_args}")
+            tool_instance = tool_class(**init_args)
+        else:
+            logger.debug("Creating tool instance with no init args")
+            tool_instance = tool_class()
+        
+        logger.debug(f"Created tool instance: {type(tool_instance)}")
+        return tool_instance
+    
+    @staticmethod
+    def _get_function_tool(tool_instance: Any) -> Any:
+        """Get the FunctionTool from a tool instance."""
+        if hasattr(tool_instance, 'get_tool'):
+            logger.debug("Getting tool via get_tool() method")
+            return tool_instance.get_tool()
+        elif hasattr(tool_instance, 'tool'):
+            logger.debug("Getting tool via .tool attribute")
+            return tool_instance.tool
+        else:
+            logger.debug("Using tool instance directly")
+            # Assume it's already a FunctionTool
+            return tool_instance
+    
     # Removed _reconstruct_team_dependencies method - delegation tools now build teams on demand from context
     
-    def _create_context_wrapper(self, message: ToolExecutionMessage):
+    async def _create_context_wrapper(self, message: ToolExecutionMessage):
         """Create a RunContextWrapper from pre-serialized context data.
         
+        The team configuration is resolved from the config store when the
+        message carries a config hash instead of the embedded configuration.
+        
         Args:
             message: Tool execution message
             
         Returns:
-            RunContextWrapper with TeamContext if available
+            RunContextWrapper with a SessionContext
         """
         from agents import RunContextWrapper
-        from ...engine.runners.team_runner import TeamContext
+        from ...schemas import SessionContext
+        from ..services.config_store import config_store
         
         # All tools should use consistent context_wrapper approach
         if 'context_wrapper' not in message.context_data:
@@ -251,16 +282,24 @@ class ToolExecutionConsumer(BaseConsumer):
         logger.debug(f"Using pre-serialized RunContextWrapper from context_data for {message.tool_name}")
         wrapper_data = message.context_data['context_wrapper']
         
-        # Reconstruct TeamContext from serialized data
-        team_context = TeamContext(
-            original_config=wrapper_data['context']['original_config'],
-            team=wrapper_data['context'].get('team'),  # Will be None, that's fine
-            session_id=wrapper_data['context']['session_id'],
-            session_context=wrapper_data['context']['session_context']
-        )
+        context_data = wrapper_data['context']
+        
+        config_hash = context_data.get('config_hash')
+        if config_hash:
+            original_config = await config_store.get_async(config_hash)
+            if original_config is None:
+                raise ValueError(f"Team configuration {config_hash[:12]} not found in config store")
+        else:
+            original_config = context_data.get('original_config') or {}
+        
+        # Reconstruct SessionContext from serialized data
+        session_fields = dict(context_data.get('session_context') or {})
+        session_fields.pop('original_config', None)
+        session_fields['session_id'] = context_data.get('session_id') or session_fields.get('session_id')
+        session_context = SessionContext(original_config=original_config, **session_fields)
         
         # Create RunContextWrapper
-        context_wrapper = RunContextWrapper(context=team_context)
+        context_wrapper = RunContextWrapper(context=session_context)
         
         # Set additional attributes if the wrapper supports them
         if hasattr(context_wrapper, 'agent_id'):
@@ -271,13 +310,14 @@ class ToolExecutionConsumer(BaseConsumer):
         logger.debug(f"Reconstructed RunContextWrapper with agent_id={wrapper_data.get('agent_id')}, session_id={wrapper_data.get('session_id')}")
         return context_wrapper
     
-    async def _execute_tool(self, tool_instance: Any, context: Any, args: str) -> str:
+    async def _execute_tool(self, tool_instance: Any, context: Any, args: str, timeout: float = 600.0) -> str:
         """Execute the tool with given arguments.
         
         Args:
             tool_instance: Tool instance to execute (FunctionTool with on_invoke_tool method)
             context: Execution context (RunContextWrapper)
             args: Tool arguments as JSON string
+            timeout: Execution timeout in seconds
             
         Returns:
             Tool execution result
@@ -289,13 +329,13 @@ class ToolExecutionConsumer(BaseConsumer):
             logger.debug("Executing FunctionTool with on_invoke_tool method")
             result = await asyncio.wait_for(
                 tool_instance.on_invoke_tool(context, args),
-                timeout=600.0  # 10 minute timeout for tool execution
+                timeout=timeout
             )
             return result
                 
         except asyncio.TimeoutError:
-            logger.error("Tool execution timed out after 10 minutes")
-            raise ValueError("Tool execution timed out after 10 minutes")
+            logger.error(f"Tool execution timed out after {timeout} seconds")
+            raise ValueError(f"Tool execution timed out after {timeout} seconds")
         except asyncio.CancelledError:
             logger.warning("Tool execution was cancelled")
             # Don't re-raise - let the cleanup happen gracefully
@@ -327,6 +367,97 @@ class ToolExecutionConsumer(BaseConsumer):
         return should_retry
 
 
+class ToolExecutionBatchConsumer(ToolExecutionConsumer, BatchConsumer):
+    """Consumer for micro-batched tool execution messages.
+    
+    Messages for the same tool class and init args are handed to the tool's
+    ``run_batch`` hook together. Groups the hook doesn't handle (or fails on)
+    are executed per item.
+    """
+    
+    async def process_batch(self, messages: List[ToolExecutionMessage]) -> List[Dict[str, Any]]:
+        """Process a batch of tool execution messages.
+        
+        Args:
+            messages: Messages to process
+            
+        Returns:
+            List[Dict[str, Any]]: One result per message, in input order
+        """
+        groups: Dict[Tuple[str, str, str], List[int]] = {}
+        for index, message in enumerate(messages):
+            init_key = json.dumps(message.tool_init_args, sort_keys=True, default=str)
+            groups.setdefault((message.tool_module, message.tool_class, init_key), []).append(index)
+        
+        group_indexes = list(groups.values())
+        group_results = await asyncio.gather(
+            *(self._process_group([messages[i] for i in indexes]) for indexes in group_indexes)
+        )
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        for indexes, outcomes in zip(group_indexes, group_results):
+            for index, outcome in zip(indexes, outcomes):
+                results[index] = outcome
+        return results
+    
+    async def _process_group(self, group: List[ToolExecutionMessage]) -> List[Dict[str, Any]]:
+        """Run one group through ``run_batch``, falling back to per-item execution."""
+        batch_results = None
+        if len(group) > 1:
+            try:
+                tool_instance = self._instantiate_tool(group[0])
+                run_batch = getattr(tool_instance, 'run_batch', None)
+                if run_batch is not None:
+                    items = [(await self._create_context_wrapper(message), message.tool_args) for message in group]
+                    batch_results = await asyncio.wait_for(
+                        run_batch(items), timeout=max(message.timeout for message in group)
+                    )
+                    if batch_results is not None and len(batch_results) != len(group):
+                        logger.warning(f"run_batch for {group[0].tool_name} returned {len(batch_results)} results "
+                                       f"for {len(group)} items, falling back to per-item execution")
+                        batch_results = None
+            except Exception as e:
+                logger.warning(f"Batch execution failed for {group[0].tool_name}, falling back to per-item execution: {e}")
+                batch_results = None
+        
+        if batch_results is None:
+            return await BatchConsumer.process_batch(self, group)
+        
+        logger.info(f"✅ Tool {group[0].tool_name} executed {len(group)} calls as one batch")
+        return [self._build_result(message, "success", result=result) for message, result in zip(group, batch_results)]
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel pending tasks and close a task's event loop."""
+    # Ensure proper cleanup of the event loop and any pending tasks
+    try:
+        # Cancel all remaining tasks
+        pending_tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        if pending_tasks:
+            logger.debug(f"Cancelling {len(pending_tasks)} pending tasks")
+            for task in pending_tasks:
+                task.cancel()
+            
+            # Wait a bit for tasks to cancel gracefully
+            try:
+                loop.run_until_complete(asyncio.wait_for(
+                    asyncio.gather(*pending_tasks, return_exceptions=True),
+                    timeout=5.0
+                ))
+            except asyncio.TimeoutError:
+                logger.warning("Some tasks didn't cancel within timeout")
+        
+        # Close the loop properly
+        loop.close()
+        logger.debug("Event loop closed properly")
+        
+    except Exception as cleanup_error:
+        logger.warning(f"Error during event loop cleanup: {cleanup_error}")
+        # Force close the loop if needed
+        if not loop.is_closed():
+            loop.close()
+
+
 @celery_app.task(bind=True)
 def process_tool_execution_task(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
     """Celery task for processing tool execution messages.
@@ -372,58 +503,27 @@ def process_tool_execution_task(self, message_data: Dict[str, Any]) -> Dict[str,
         asyncio.set_event_loop(loop)
         
         try:
-            # Run with a timeout to prevent hanging
+            # Run with a timeout to prevent hanging (tool timeout plus setup/teardown slack)
             result = loop.run_until_complete(
-                asyncio.wait_for(consumer.process(message), timeout=900.0)  # 15 minute timeout
+                asyncio.wait_for(consumer.process(message), timeout=message.timeout + 60)
             )
             logger.debug("Async tool execution completed")
             
             consumer.on_success(result, message)
+            _publish_result(result, message, loop)
             logger.info(f"🎉 Celery task completed successfully for {message.tool_name}")
             return result
             
         except asyncio.TimeoutError:
-            logger.error(f"Tool execution timed out after 15 minutes for {message.tool_name}")
-            error_result = {
-                "task_id": message.task_id,
-                "tool_name": message.tool_name,
-                "status": "error",
-                "error": "Tool execution timed out after 15 minutes",
-                "agent_id": message.agent_id,
-                "session_id": message.session_id,
-                "context_data": message.context_data,
-                "processed_at": message.created_at.isoformat()
-            }
+            logger.error(f"Tool execution timed out after {message.timeout + 60} seconds for {message.tool_name}")
+            error_result = consumer._build_result(
+                message, "error", error=f"Tool execution timed out after {message.timeout + 60} seconds"
+            )
+            _publish_result(error_result, message, loop)
             return error_result
             
         finally:
-            # Ensure proper cleanup of the event loop and any pending tasks
-            try:
-                # Cancel all remaining tasks
-                pending_tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
-                if pending_tasks:
-                    logger.debug(f"Cancelling {len(pending_tasks)} pending tasks")
-                    for task in pending_tasks:
-                        task.cancel()
-                    
-                    # Wait a bit for tasks to cancel gracefully
-                    try:
-                        loop.run_until_complete(asyncio.wait_for(
-                            asyncio.gather(*pending_tasks, return_exceptions=True),
-                            timeout=5.0
-                        ))
-                    except asyncio.TimeoutError:
-                        logger.warning("Some tasks didn't cancel within timeout")
-                
-                # Close the loop properly
-                loop.close()
-                logger.debug("Event loop closed properly")
-                
-            except Exception as cleanup_error:
-                logger.warning(f"Error during event loop cleanup: {cleanup_error}")
-                # Force close the loop if needed
-                if not loop.is_closed():
-                    loop.close()
+            _close_loop(loop)
     except Exception as exc:
         logger.error(f"🔥 Celery task failed for {message.tool_name}: {exc}")
         consumer.on_failure(exc, message)
@@ -438,9 +538,198 @@ def process_tool_execution_task(self, message_data: Dict[str, Any]) -> Dict[str,
                 max_retries=message.max_retries
             )
         logger.error(f"💀 Task failed permanently for {message.tool_name}")
+        _publish_result(consumer._build_result(message, "error", error=f"Tool execution failed: {exc}"), message)
         raise
 
 
+@celery_app.task(bind=True)
+def process_tool_execution_batch_task(self, messages_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Celery task for processing a micro-batch of tool execution messages.
+    
+    Each item's result is also stored under its own task ID, so the result
+    channel finds batched and individually queued results the same way.
+    
+    Args:
+        self: Celery task instance
+        messages_data: Serialized tool execution messages
+        
+    Returns:
+        List[Dict[str, Any]]: Tool execution results in message order
+    """
+    logger.info(f"🚀 Starting Celery batch task for {len(messages_data)} tool executions")
+    
+    consumer = ToolExecutionBatchConsumer()
+    messages = [ToolExecutionMessage.from_dict(message_data) for message_data in messages_data]
+    timeout = max(message.timeout for message in messages) + 60
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        try:
+            results = loop.run_until_complete(
+                asyncio.wait_for(consumer.process_batch(messages), timeout=timeout)
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Batch of {len(messages)} tool executions timed out after {timeout} seconds")
+            results = [
+                consumer._build_result(message, "error", error=f"Tool execution timed out after {timeout} seconds")
+                for message in messages
+            ]
+        
+        for message, result in zip(messages, results):
+            if result.get("status") == "success":
+                consumer.on_success(result, message)
+            try:
+                self.backend.store_result(message.task_id, result, "SUCCESS")
+            except Exception as e:
+                logger.warning(f"Could not store result for task {message.task_id}: {e}")
+            _publish_result(result, message, loop)
+        
+        logger.info(f"🎉 Celery batch task completed for {len(messages)} tool executions")
+        return results
+    finally:
+        _close_loop(loop)
+
+
+class ToolExecutionBatcher:
+    """Collects tool execution messages into micro-batches on the producer side.
+    
+    Messages are buffered per (queue, priority) and sent as one batch task
+    once ``max_batch_size`` messages are waiting or ``max_wait_ms`` has passed
+    since the first one arrived. A batch of one is sent as a regular task.
+    Batches due on an event loop are sent from a worker thread.
+    """
+    
+    def __init__(self, max_batch_size: Optional[int] = None, max_wait_ms: Optional[int] = None):
+        """Initialize the batcher.
+        
+        Args:
+            max_batch_size: Messages per batch; defaults to GNOSARI_QUEUE_BATCH_SIZE (20)
+            max_wait_ms: Longest a message waits for companions; defaults to GNOSARI_QUEUE_BATCH_WAIT_MS (50)
+        """
+        self.max_batch_size = max_batch_size or int(os.getenv("GNOSARI_QUEUE_BATCH_SIZE", "20"))
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else int(os.getenv("GNOSARI_QUEUE_BATCH_WAIT_MS", "50"))
+        self._buffers: Dict[Tuple[Optional[str], int], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, message_dict: Dict[str, Any], queue: Optional[str], priority: int) -> None:
+        """Buffer a serialized message for batched delivery.
+        
+        Args:
+            message_dict: Serialized ToolExecutionMessage
+            queue: Target queue (None for the default route)
+            priority: Broker priority
+        """
+        key = (queue, priority)
+        with self._lock:
+            buffer = self._buffers.setdefault(key, [])
+            buffer.append(message_dict)
+            first = len(buffer) == 1
+            full = len(buffer) >= self.max_batch_size
+        
+        if full:
+            self._flush_soon(key)
+        elif first:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to wait on - send right away
+                self.flush(key)
+            else:
+                loop.call_later(self.max_wait_ms / 1000, self._flush_soon, key)
+    
+    def _flush_soon(self, key: Tuple[Optional[str], int]) -> None:
+        """Flush a buffer, sending from a worker thread when called on an event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush(key)
+        else:
+            # apply_async blocks on the broker connection - keep it off the event loop
+            loop.run_in_executor(None, self.flush, key)
+    
+    def flush(self, key: Optional[Tuple[Optional[str], int]] = None) -> None:
+        """Send buffered messages.
+        
+        Args:
+            key: (queue, priority) buffer to flush, or None for all buffers
+        """
+        with self._lock:
+            keys = [key] if key is not None else list(self._buffers)
+            batches = [(k, self._buffers.pop(k)) for k in keys if self._buffers.get(k)]
+        
+        for (queue, priority), batch in batches:
+            options = {"priority": priority}
+            if queue:
+                options["queue"] = queue
+            try:
+                if len(batch) == 1:
+                    process_tool_execution_task.apply_async(args=[batch[0]], task_id=batch[0]["task_id"], **options)
+                else:
+                    process_tool_execution_batch_task.apply_async(args=[batch], **options)
+                logger.info(f"📦 Sent batch of {len(batch)} tool execution(s) to {queue or 'default queue'}")
+            except Exception as e:
+                logger.error(f"❌ Failed to send batch of {len(batch)} tool executions: {e}")
+
+
+# Global tool execution batcher instance
+tool_execution_batcher = ToolExecutionBatcher()
+atexit.register(tool_execution_batcher.flush)
+
+
+def _session_context_for(message: ToolExecutionMessage) -> Optional[Dict[str, Any]]:
+    """Get the serialized SessionContext of the run that queued the message."""
+    wrapper_data = message.context_data.get('context_wrapper', {})
+    return wrapper_data.get('context', {}).get('session_context') or None
+
+
+async def run_tool_execution(message: ToolExecutionMessage) -> Dict[str, Any]:
+    """Process a tool execution message in process.
+    
+    Handler used by queue backends other than Celery (e.g. the in-memory
+    backend); mirrors process_tool_execution_task.
+    
+    Args:
+        message: Tool execution message
+        
+    Returns:
+        Dict[str, Any]: Tool execution result
+    """
+    consumer = ToolExecutionConsumer()
+    result = await consumer.process(message)
+    if result.get("status") == "success":
+        consumer.on_success(result, message)
+    try:
+        await tool_result_channel.publish(result, _session_context_for(message))
+    except Exception as e:
+        logger.error(f"❌ Failed to publish result for task {message.task_id}: {e}")
+    return result
+
+
+register_task_handler(process_tool_execution_task.name, ToolExecutionMessage, run_tool_execution)
+
+
+def _publish_result(result: Dict[str, Any], message: ToolExecutionMessage,
+                    loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Deliver a finished result through the tool result channel.
+    
+    Publishing problems are logged and never fail the task itself.
+    
+    Args:
+        result: Tool execution result
+        message: The processed message
+        loop: Event loop of the running task (a fresh loop is used if None or closed)
+    """
+    try:
+        publish = tool_result_channel.publish(result, _session_context_for(message))
+        if loop is not None and not loop.is_closed():
+            loop.run_until_complete(publish)
+        else:
+            asyncio.run(publish)
+    except Exception as e:
+        logger.error(f"❌ Failed to publish result for task {message.task_id}: {e}")
+
+
 def send_tool_execution_message(task_id: str,
                                tool_name: str,
                                tool_module: str,
@@ -451,7 +740,11 @@ def send_tool_execution_message(task_id: str,
                                agent_id: str = None,
                                session_id: str = None,
                                team_data: Dict[str, Any] = None,
-                               priority: int = 5) -> str:
+                               priority: int = 5,
+                               queue: Optional[str] = None,
+                               timeout: Optional[int] = None,
+                               max_retries: Optional[int] = None,
+                               batch: bool = False) -> str:
     """Send a tool execution message to the queue.
     
     Args:
@@ -466,6 +759,10 @@ def send_tool_execution_message(task_id: str,
         session_id: Session ID for the tool execution
         team_data: Serialized team data for delegation tools
         priority: Task priority (1-10, lower is higher priority)
+        queue: Queue to route the task to (defaults to the configured task routes)
+        timeout: Tool execution timeout in seconds
+        max_retries: Maximum number of retries
+        batch: Deliver through the micro-batcher instead of as an individual task
         
     Returns:
         str: Message ID
@@ -478,9 +775,9 @@ def send_tool_execution_message(task_id: str,
     logger.debug(f"   Module: {tool_module}")
     logger.debug(f"   Class: {tool_class}")
     logger.debug(f"   Priority: {priority}")
+    logger.debug(f"   Queue: {queue or 'default'}")
     logger.debug(f"   Args: {tool_args}")
     logger.debug(f"   Init Args: {tool_init_args}")
-    logger.debug(f"   Context: {context_data}")
     
     try:
         message = ToolExecutionMessage.create(
@@ -496,44 +793,31 @@ def send_tool_execution_message(task_id: str,
             team_data=team_data
         )
         
-        # Set priority on message
+        # Set priority and execution limits on message
         message.priority = priority
+        if timeout:
+            message.timeout = timeout
+        if max_retries is not None:
+            message.max_retries = max_retries
         logger.debug(f"Created message with ID: {message.message_id}")
         
-        # Send to queue with priority
-        logger.debug(f"Sending message to Celery queue with priority {priority}")
+        # Send to queue with priority; the backend serializes the message once
+        backend = get_queue_backend()
+        logger.debug(f"Sending message to {backend.name} queue with priority {priority}")
         
-        # Debug: Try to serialize the message to identify circular references
-        message_dict = message.to_dict()
-        logger.debug(f"Message created successfully {message_dict}")
-        
-        try:
-            import json
-            # Attempt to serialize to identify circular references
-            json_str = json.dumps(message_dict)
-            logger.debug(f"Message serialization test passed, size: {len(json_str)} chars")
-        except Exception as json_error:
-            import json  # Ensure json is available for error handling
-            logger.error(f"❌ JSON serialization test failed: {json_error}")
-            logger.debug("Analyzing message structure for circular references...")
-            
-            # Debug each field separately
-            for field_name, field_value in message_dict.items():
-                try:
-                    json.dumps(field_value)
-                    logger.debug(f"✅ Field '{field_name}' serializes OK")
-                except Exception as field_error:
-                    logger.error(f"❌ Field '{field_name}' has circular reference: {field_error}")
-                    logger.debug(f"Field '{field_name}' type: {type(field_value)}")
-                    if isinstance(field_value, dict):
-                        logger.debug(f"Field '{field_name}' keys: {list(field_value.keys())}")
-            
-            # Re-raise the original error
-            raise json_error
+        if batch and backend.supports_batching:
+            tool_execution_batcher.add(message.to_dict(), queue, priority)
+            logger.info(f"✅ Message buffered for batched delivery (ID: {message.message_id})")
+            return message.message_id
         
-        process_tool_execution_task.apply_async(
-            args=[message_dict],
-            priority=priority
+        # Use the tool task ID as the backend task ID so the result channel can find it
+        backend.submit(
+            process_tool_execution_task.name,
+            message,
+            queue=queue,
+            priority=priority,
+            timeout=message.timeout + 60,
+            task_id=task_id
         )
         
         logger.info(f"✅ Message sent to queue successfully (ID: {message.message_id})")
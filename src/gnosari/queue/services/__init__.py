@@ -1,3 +1,20 @@
 """Queue services for async processing."""
 
-__all__ = []
\ No newline at end of file
+from .config_store import ConfigStore, config_store
+from .result_channel import (
+    ResultStore,
+    LocalResultStore,
+    CeleryResultStore,
+    ToolResultChannel,
+    tool_result_channel
+)
+
+__all__ = [
+    "ConfigStore",
+    "config_store",
+    "ResultStore",
+    "LocalResultStore",
+    "CeleryResultStore",
+    "ToolResultChannel",
+    "tool_result_channel"
+]
\ No newline at end of file
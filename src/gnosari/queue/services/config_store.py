@@ -0,0 +1,221 @@
+"""
+Content-addressed team configuration store for queue messages.
+
+Queued tool messages used to embed the whole team configuration, so every
+tool call put a copy of the team YAML on the broker. The producer now
+publishes each configuration once under its content hash and messages carry
+only the hash; workers fetch the configuration on first use and keep it in
+an in-process cache.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ...core.cache import ContentHasher
+from ..config import CeleryConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigStore:
+    """Stores team configurations by content hash.
+
+    Configurations are shared through Redis (the broker by default) so
+    workers in other processes can resolve them. With
+    ``GNOSARI_CONFIG_STORE=local`` they are kept in process only, which
+    suits in-process queue backends.
+    """
+
+    KEY_PREFIX = "gnosari:config:"
+
+    def __init__(self,
+                 backend: Optional[str] = None,
+                 redis_url: Optional[str] = None,
+                 ttl: Optional[int] = None,
+                 max_cached: int = 64):
+        """Initialize the configuration store.
+
+        Args:
+            backend: 'redis' or 'local'; defaults to GNOSARI_CONFIG_STORE (redis)
+            redis_url: Redis URL; defaults to GNOSARI_CONFIG_STORE_URL or the Celery broker URL
+            ttl: Seconds a published configuration is kept in Redis;
+                defaults to GNOSARI_CONFIG_STORE_TTL (24 hours)
+            max_cached: Maximum number of configurations cached in process
+        """
+        self.backend = (backend or os.getenv("GNOSARI_CONFIG_STORE", "redis")).lower()
+        self.redis_url = redis_url or os.getenv("GNOSARI_CONFIG_STORE_URL", CeleryConfig.broker_url)
+        self.ttl = ttl if ttl is not None else int(os.getenv("GNOSARI_CONFIG_STORE_TTL", "86400"))
+        self.max_cached = max_cached
+        self.hasher = ContentHasher()
+
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._published: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._redis = None
+
+    def _get_redis(self):
+        """Create the Redis client lazily."""
+        if self._redis is None:
+            import redis
+            self._redis = redis.Redis.from_url(self.redis_url)
+        return self._redis
+
+    def _remember(self, config_hash: str, config: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[config_hash] = config
+            self._cache.move_to_end(config_hash)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+    def compute_hash(self, config: Dict[str, Any]) -> str:
+        """Compute the content hash of a configuration.
+
+        Args:
+            config: Team configuration
+
+        Returns:
+            SHA256 hash of the canonical JSON form
+        """
+        return self.hasher.compute_hash(self._serialize(config))
+
+    @staticmethod
+    def _serialize(config: Dict[str, Any]) -> str:
+        return json.dumps(config, sort_keys=True, separators=(',', ':'), default=str)
+
+    def publish(self, config: Dict[str, Any]) -> Optional[str]:
+        """Publish a configuration so workers can resolve it by hash.
+
+        Each configuration is uploaded once per process and re-uploaded only
+        when its Redis entry may be about to expire. Blocks on Redis; use
+        ``publish_async`` on an event loop.
+
+        Args:
+            config: Team configuration
+
+        Returns:
+            The configuration hash, or None if it couldn't be stored where
+            workers can reach it (callers should embed the configuration instead)
+        """
+        if not config:
+            return None
+        config_hash, payload = self._prepare(config)
+        if payload is None:
+            return config_hash
+        return config_hash if self._upload(config_hash, payload) else None
+
+    async def publish_async(self, config: Dict[str, Any]) -> Optional[str]:
+        """Publish a configuration without blocking the event loop.
+
+        Same as ``publish``, with the Redis upload run in a worker thread.
+
+        Args:
+            config: Team configuration
+
+        Returns:
+            The configuration hash, or None if it couldn't be stored where workers can reach it
+        """
+        if not config:
+            return None
+        config_hash, payload = self._prepare(config)
+        if payload is None:
+            return config_hash
+        return config_hash if await asyncio.to_thread(self._upload, config_hash, payload) else None
+
+    def _prepare(self, config: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Hash and cache a configuration.
+
+        Returns:
+            The configuration hash and the payload to upload, or None as
+            payload when no upload is needed
+        """
+        payload = self._serialize(config)
+        config_hash = self.hasher.compute_hash(payload)
+
+        self._remember(config_hash, config)
+        if self.backend == "local":
+            return config_hash, None
+
+        with self._lock:
+            published_at = self._published.get(config_hash)
+        if published_at is not None and time.monotonic() - published_at < self.ttl / 2:
+            return config_hash, None
+        return config_hash, payload
+
+    def _upload(self, config_hash: str, payload: str) -> bool:
+        try:
+            self._get_redis().set(self.KEY_PREFIX + config_hash, payload, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Config store unavailable, embedding config in message: {e}")
+            return False
+        with self._lock:
+            self._published[config_hash] = time.monotonic()
+        logger.debug(f"Published team config {config_hash[:12]} ({len(payload)} bytes)")
+        return True
+
+    def get(self, config_hash: str) -> Optional[Dict[str, Any]]:
+        """Resolve a configuration by hash.
+
+        Blocks on Redis for configurations not cached in process; use
+        ``get_async`` on an event loop.
+
+        Args:
+            config_hash: Hash returned by ``publish``
+
+        Returns:
+            Team configuration, or None if it can't be found
+        """
+        config = self._get_cached(config_hash)
+        if config is not None or self.backend == "local":
+            return config
+        return self._fetch(config_hash)
+
+    async def get_async(self, config_hash: str) -> Optional[Dict[str, Any]]:
+        """Resolve a configuration by hash without blocking the event loop.
+
+        Args:
+            config_hash: Hash returned by ``publish``
+
+        Returns:
+            Team configuration, or None if it can't be found
+        """
+        config = self._get_cached(config_hash)
+        if config is not None or self.backend == "local":
+            return config
+        return await asyncio.to_thread(self._fetch, config_hash)
+
+    def _get_cached(self, config_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            config = self._cache.get(config_hash)
+            if config is not None:
+                self._cache.move_to_end(config_hash)
+            return config
+
+    def _fetch(self, config_hash: str) -> Optional[Dict[str, Any]]:
+        """Fetch a configuration from Redis and verify its hash."""
+        try:
+            payload = self._get_redis().get(self.KEY_PREFIX + config_hash)
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch team config {config_hash[:12]}: {e}")
+            return None
+        if payload is None:
+            return None
+
+        text = payload.decode('utf-8') if isinstance(payload, bytes) else payload
+        if self.hasher.compute_hash(text) != config_hash:
+            logger.error(f"❌ Team config {config_hash[:12]} failed hash verification")
+            return None
+
+        config = json.loads(text)
+        self._remember(config_hash, config)
+        logger.debug(f"Fetched team config {config_hash[:12]} from store")
+        return config
+
+
+# Global config store instance
+config_store = ConfigStore()
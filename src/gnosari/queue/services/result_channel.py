@@ -0,0 +1,312 @@
+"""
+Result channel for async tool execution.
+
+Queued tools used to be fire-and-forget: the worker computed a result that
+never reached the conversation. The channel stores completed results (in the
+Celery result backend or a local in-process store), writes them into the
+originating session so the next turn sees them, and lets callers await a
+result to wake a waiting run.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore(ABC):
+    """Storage backend for completed async tool results."""
+
+    @abstractmethod
+    async def put(self, task_id: str, result: Dict[str, Any]) -> None:
+        """Store a completed result.
+
+        Args:
+            task_id: Task identifier
+            result: Result dictionary produced by the consumer
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a completed result without waiting.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Result dictionary, or None if the task hasn't completed
+        """
+        pass
+
+    @abstractmethod
+    async def wait(self, task_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for a result.
+
+        Args:
+            task_id: Task identifier
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Result dictionary, or None on timeout
+        """
+        pass
+
+
+class LocalResultStore(ResultStore):
+    """In-process result store.
+
+    Works when producer and consumer share a process (e.g. an in-process
+    queue backend or tests). Waiters on any event loop are woken thread-safely.
+    """
+
+    def __init__(self, max_results: int = 1000):
+        """Initialize the local store.
+
+        Args:
+            max_results: Maximum number of results kept; oldest are dropped first
+        """
+        self.max_results = max_results
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._lock = threading.Lock()
+
+    async def put(self, task_id: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._results[task_id] = result
+            while len(self._results) > self.max_results:
+                self._results.pop(next(iter(self._results)))
+            waiters = self._waiters.pop(task_id, [])
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(self._resolve, future, result)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Dict[str, Any]) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._results.get(task_id)
+
+    async def wait(self, task_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if task_id in self._results:
+                return self._results[task_id]
+            self._waiters.setdefault(task_id, []).append((loop, future))
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(task_id)
+                if waiters:
+                    self._waiters[task_id] = [w for w in waiters if w[1] is not future]
+                    if not self._waiters[task_id]:
+                        del self._waiters[task_id]
+
+
+class CeleryResultStore(ResultStore):
+    """Result store backed by the Celery result backend.
+
+    Tasks are submitted with the tool task ID as the Celery task ID, so the
+    worker's return value is the stored result and ``put`` has nothing to do.
+    """
+
+    def __init__(self, poll_interval: float = 0.1, max_poll_interval: float = 1.0):
+        """Initialize the Celery-backed store.
+
+        Args:
+            poll_interval: Initial delay between backend polls in seconds
+            max_poll_interval: Upper bound for the polling delay
+        """
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+    async def put(self, task_id: str, result: Dict[str, Any]) -> None:
+        # The Celery task return value is already persisted by the backend
+        return None
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        # Backend reads are blocking network calls (Redis, database) - keep them off the event loop
+        return await asyncio.to_thread(self._fetch, task_id)
+
+    @staticmethod
+    def _fetch(task_id: str) -> Optional[Dict[str, Any]]:
+        from ..app import celery_app
+
+        async_result = celery_app.AsyncResult(task_id)
+        if not async_result.ready():
+            return None
+        if async_result.successful():
+            return async_result.result
+        return {
+            "task_id": task_id,
+            "status": "error",
+            "error": f"Tool execution failed: {async_result.result}"
+        }
+
+    async def wait(self, task_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = self.poll_interval
+
+        while True:
+            result = await self.get(task_id)
+            if result is not None:
+                return result
+            if deadline is not None and loop.time() >= deadline:
+                return None
+            delay = interval if deadline is None else min(interval, max(deadline - loop.time(), 0))
+            await asyncio.sleep(delay)
+            interval = min(interval * 2, self.max_poll_interval)
+
+
+class ToolResultChannel:
+    """Delivers async tool results back to the conversation.
+
+    Workers call ``publish`` when a tool finishes; the result is stored,
+    appended to the originating session and passed to subscribers. Runs that
+    need the answer can ``wait_for_result`` instead of polling.
+    """
+
+    def __init__(self, store: Optional[ResultStore] = None, write_to_session: Optional[bool] = None):
+        """Initialize the result channel.
+
+        Args:
+            store: Result store; defaults to GNOSARI_TOOL_RESULT_STORE ('celery' or 'local')
+            write_to_session: Whether to append results to the originating session;
+                defaults to GNOSARI_TOOL_RESULT_SESSION_WRITE (true)
+        """
+        if store is None:
+            store_type = os.getenv("GNOSARI_TOOL_RESULT_STORE", "celery").lower()
+            store = LocalResultStore() if store_type == "local" else CeleryResultStore()
+        if write_to_session is None:
+            write_to_session = os.getenv("GNOSARI_TOOL_RESULT_SESSION_WRITE", "true").lower() in ("1", "true", "yes")
+
+        self.store = store
+        self.write_to_session = write_to_session
+        self._subscribers: List[Callable[[Dict[str, Any]], Any]] = []
+
+    def set_store(self, store: ResultStore) -> None:
+        """Replace the result store.
+
+        Args:
+            store: New result store
+        """
+        self.store = store
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], Any]) -> None:
+        """Register a callback (sync or async) invoked for every published result.
+
+        Args:
+            callback: Function receiving the result dictionary
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Dict[str, Any]], Any]) -> None:
+        """Remove a previously registered callback.
+
+        Args:
+            callback: Callback to remove
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    async def publish(self, result: Dict[str, Any], session_context: Optional[Dict[str, Any]] = None) -> None:
+        """Publish a completed tool result.
+
+        Args:
+            result: Result dictionary with task_id, tool_name, status and result/error
+            session_context: Serialized SessionContext of the originating run
+        """
+        task_id = result.get("task_id")
+        if not task_id:
+            logger.warning("Skipping result without task_id")
+            return
+
+        await self.store.put(task_id, result)
+
+        if self.write_to_session and result.get("session_id"):
+            await self._write_to_session(result, session_context)
+
+        for callback in list(self._subscribers):
+            try:
+                outcome = callback(result)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+            except Exception as e:
+                logger.warning(f"Result subscriber failed for task {task_id}: {e}")
+
+        logger.info(f"📬 Published result for task {task_id} ({result.get('status', 'unknown')})")
+
+    async def get_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a result if the task has completed.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Result dictionary or None
+        """
+        return await self.store.get(task_id)
+
+    async def wait_for_result(self, task_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait until a task completes.
+
+        Args:
+            task_id: Task identifier
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Result dictionary, or None on timeout
+        """
+        return await self.store.wait(task_id, timeout)
+
+    @staticmethod
+    def format_result(result: Dict[str, Any]) -> str:
+        """Format a result as conversation text.
+
+        Args:
+            result: Result dictionary
+
+        Returns:
+            Message content describing the result
+        """
+        header = f"Async result from {result.get('tool_name', 'tool')} (Task ID: {result.get('task_id')})"
+        if result.get("status") == "success":
+            return f"{header}:\n{result.get('result')}"
+        return f"{header} failed:\n{result.get('error', 'Unknown error')}"
+
+    async def _write_to_session(self, result: Dict[str, Any], session_context: Optional[Dict[str, Any]]) -> None:
+        """Append the result to the originating session as an assistant message."""
+        from ...schemas import SessionContext
+        from ...sessions import GnosariContextSession
+
+        session = None
+        try:
+            context = SessionContext(**session_context) if session_context else None
+            session = GnosariContextSession(result["session_id"], context)
+            await session.add_items([{"role": "assistant", "content": self.format_result(result)}])
+            logger.debug(f"Wrote result for task {result.get('task_id')} to session {result['session_id']}")
+        except Exception as e:
+            logger.error(f"❌ Failed to write result to session {result.get('session_id')}: {e}")
+        finally:
+            if session is not None and hasattr(session, "cleanup"):
+                try:
+                    await session.cleanup()
+                except Exception as e:
+                    logger.debug(f"Session cleanup failed: {e}")
+
+
+# Global tool result channel instance
+tool_result_channel = ToolResultChannel()
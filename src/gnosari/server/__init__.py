@@ -0,0 +1,12 @@
+"""
+HTTP server mode (``gnosari serve``).
+
+Keeps built teams warm and serves concurrent conversations over aiohttp.
+"""
+
+from .app import create_app, run_server
+
+__all__ = [
+    "create_app",
+    "run_server"
+]
@@ -0,0 +1,245 @@
+"""
+HTTP server for running teams.
+
+Serves run and stream endpoints over aiohttp, backed by a ``TeamRuntime``
+that keeps one built team per configuration resident for all sessions.
+
+Endpoints:
+    POST /run     Run a message to completion and return the outputs as JSON
+    POST /stream  Run a message and stream events as Server-Sent Events
+    GET  /health  Runtime statistics
+
+Request body (JSON)::
+
+    {
+        "message": "Hello",
+        "team": "my-team",           # YAML file in the teams directory (optional)
+        "agent": "Writer",           # run a single agent (optional)
+        "session_id": "abc",         # conversation persistence (optional)
+        "session_context": {...},    # optional
+        "max_turns": 10              # optional
+    }
+"""
+
+import json
+import logging
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from ..core.exceptions import AdmissionRejectedError
+from ..engine.runners.cleanup_manager import CleanupManager
+from ..engine.runtime import TeamRuntime
+from ..engine.stream_events import StreamEvent
+from ..sessions import use_shared_engines, dispose_shared_engines
+
+logger = logging.getLogger(__name__)
+
+RUNTIME_KEY = web.AppKey("runtime", TeamRuntime)
+CONFIG_KEY = web.AppKey("config", dict)
+
+
+class RequestError(Exception):
+    """Invalid run request."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _resolve_config(app: web.Application, team: Optional[str]) -> str:
+    """Map a request's team name to a configuration file.
+
+    Args:
+        app: Server application
+        team: Team name (YAML file name without extension), or None for the default team
+
+    Returns:
+        Path to the team configuration
+
+    Raises:
+        RequestError: If the team is unknown or no default team is configured
+    """
+    config = app[CONFIG_KEY]
+    if not team:
+        if not config["default_config"]:
+            raise RequestError("No team given and no default team configured")
+        return config["default_config"]
+
+    teams_dir = config["teams_dir"]
+    if teams_dir is None:
+        raise RequestError("Team selection is disabled: no teams directory configured")
+    for suffix in (".yaml", ".yml"):
+        candidate = (teams_dir / f"{team}{suffix}").resolve()
+        # Only files directly inside the teams directory can be served
+        if candidate.parent == teams_dir and candidate.is_file():
+            return str(candidate)
+    raise RequestError(f"Team '{team}' not found", status=404)
+
+
+async def _parse_request(request: web.Request) -> Dict[str, Any]:
+    try:
+        body = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise RequestError("Request body must be UTF-8 encoded JSON")
+    if not isinstance(body, dict) or not isinstance(body.get("message"), str) or not body["message"]:
+        raise RequestError("'message' is required")
+    max_turns = body.get("max_turns")
+    if max_turns is not None and (not isinstance(max_turns, int) or isinstance(max_turns, bool) or max_turns < 1):
+        raise RequestError("'max_turns' must be a positive integer")
+    body["config_path"] = _resolve_config(request.app, body.get("team"))
+    return body
+
+
+def _event_to_sse(event: Dict[str, Any]) -> bytes:
+    data = event.to_json() if isinstance(event, StreamEvent) else json.dumps(event, default=str)
+    return f"event: {event.get('type', 'message')}\ndata: {data}\n\n".encode("utf-8")
+
+
+def _rejected_response(error: AdmissionRejectedError) -> web.Response:
+    return web.json_response(
+        {"error": str(error), "error_type": type(error).__name__},
+        status=503, headers={"Retry-After": str(max(1, round(error.retry_after)))}
+    )
+
+
+async def handle_run(request: web.Request) -> web.Response:
+    """Run a message to completion."""
+    try:
+        body = await _parse_request(request)
+    except RequestError as e:
+        return web.json_response({"error": str(e)}, status=e.status)
+
+    runtime = request.app[RUNTIME_KEY]
+    try:
+        async with runtime.turn(body["config_path"], body.get("session_id")) as warm:
+            if body.get("agent"):
+                agent = warm.team.get_agent(body["agent"])
+                if not agent:
+                    return web.json_response({"error": f"Agent '{body['agent']}' not found"}, status=404)
+                result = await warm.runner.run_agent_until_done_async(
+                    agent, body["message"], body.get("session_id"), body.get("session_context"), body.get("max_turns")
+                )
+            else:
+                result = await warm.runner.run_team_async(
+                    body["message"], False, body.get("session_id"), body.get("session_context"), body.get("max_turns")
+                )
+    except AdmissionRejectedError as e:
+        return _rejected_response(e)
+    except Exception as e:
+        logger.error(f"❌ Run failed: {e}")
+        return web.json_response({"error": str(e), "error_type": type(e).__name__}, status=500)
+    return web.json_response(result, dumps=lambda data: json.dumps(data, default=str))
+
+
+async def handle_stream(request: web.Request) -> web.StreamResponse:
+    """Run a message and stream its events as Server-Sent Events."""
+    try:
+        body = await _parse_request(request)
+    except RequestError as e:
+        return web.json_response({"error": str(e)}, status=e.status)
+
+    runtime = request.app[RUNTIME_KEY]
+    response = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+    await response.prepare(request)
+
+    last_type = None
+    try:
+        async with runtime.turn(body["config_path"], body.get("session_id")) as warm:
+            if body.get("agent"):
+                events = warm.runner.run_single_agent_stream(
+                    body["agent"], body["message"], False,
+                    body.get("session_id"), body.get("session_context"), body.get("max_turns")
+                )
+            else:
+                events = warm.runner.run_team_stream(
+                    body["message"], False, body.get("session_id"), body.get("session_context"), body.get("max_turns")
+                )
+            async with aclosing(events):
+                async for event in events:
+                    last_type = event.get("type")
+                    await response.write(_event_to_sse(event))
+    except ConnectionResetError:
+        logger.info("Stream client disconnected")
+        return response
+    except Exception as e:
+        logger.error(f"❌ Stream failed: {e}")
+        # The runners yield an error event before raising; failures outside a run do not
+        if last_type != "error":
+            error = {"type": "error", "content": str(e), "error_type": type(e).__name__}
+            try:
+                await response.write(_event_to_sse(error))
+            except ConnectionResetError:
+                return response
+
+    await response.write_eof()
+    return response
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    """Report runtime statistics."""
+    return web.json_response({"status": "ok", "runtime": request.app[RUNTIME_KEY].get_stats()})
+
+
+async def _close_runtime(app: web.Application) -> None:
+    await app[RUNTIME_KEY].close()
+    # Interactive bash sessions outlive runs in keep-alive mode
+    await CleanupManager().cleanup_interactive_bash_sessions()
+    await dispose_shared_engines()
+
+
+def create_app(runtime: Optional[TeamRuntime] = None, default_config: Optional[str] = None,
+               teams_dir: Optional[str] = None) -> web.Application:
+    """Create the server application.
+
+    Args:
+        runtime: Team runtime (default: one team per configuration shared by all sessions)
+        default_config: Configuration used when a request names no team
+        teams_dir: Directory whose YAML files can be selected with the request's ``team``
+
+    Returns:
+        aiohttp application
+    """
+    app = web.Application()
+    app[RUNTIME_KEY] = runtime or TeamRuntime(session_scoped=False)
+    app[CONFIG_KEY] = {
+        "default_config": default_config,
+        "teams_dir": Path(teams_dir).resolve() if teams_dir else None
+    }
+    app.router.add_post("/run", handle_run)
+    app.router.add_post("/stream", handle_stream)
+    app.router.add_get("/health", handle_health)
+    app.on_cleanup.append(_close_runtime)
+    return app
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8080, default_config: Optional[str] = None,
+               teams_dir: Optional[str] = None, model: str = "gpt-4o", temperature: float = 1.0,
+               api_key: Optional[str] = None, max_teams: Optional[int] = None,
+               idle_timeout: Optional[float] = None) -> None:
+    """Run the server until interrupted.
+
+    Args:
+        host: Interface to bind
+        port: Port to listen on
+        default_config: Configuration used when a request names no team
+        teams_dir: Directory of selectable team configurations
+        model: Default model for agents
+        temperature: Default temperature for agents
+        api_key: OpenAI API key
+        max_teams: Maximum number of resident teams
+        idle_timeout: Seconds after which an unused team is evicted
+    """
+    # One event loop for the process lifetime: sessions can share database engines
+    use_shared_engines()
+    runtime = TeamRuntime(max_teams=max_teams, idle_timeout=idle_timeout, api_key=api_key,
+                          model=model, temperature=temperature, session_scoped=False)
+    app = create_app(runtime, default_config=default_config, teams_dir=teams_dir)
+    logger.info(f"🚀 Serving teams on http://{host}:{port}")
+    web.run_app(app, host=host, port=port, print=None)
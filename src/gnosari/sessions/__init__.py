@@ -2,7 +2,7 @@
 Session providers for Gnosari Engine
 """
 
-from .database import DatabaseSession
+from .database import DatabaseSession, use_shared_engines, dispose_shared_engines
 from .api import ApiSession
 from .factory import GnosariContextSession
 
@@ -10,5 +10,7 @@ from .factory import GnosariContextSession
 __all__ = [
     "DatabaseSession",
     "ApiSession", 
-    "GnosariContextSession"
+    "GnosariContextSession",
+    "use_shared_engines",
+    "dispose_shared_engines"
 ]
\ No newline at end of file
@@ -5,6 +5,7 @@ Database session implementation using SQLAlchemy
 import asyncio
 import json
 import logging
+import os
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from agents.memory.session import SessionABC
@@ -20,6 +21,38 @@ from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async
 
 logger = logging.getLogger(__name__)
 
+# Long-running processes share one engine (and connection pool) per database URL
+# across sessions instead of creating and disposing one per session
+_share_engines = os.getenv("SESSION_SHARED_ENGINE", "false").lower() == "true"
+_shared_engines: Dict[str, AsyncEngine] = {}
+_shared_tables_created: set = set()
+
+
+def use_shared_engines(enabled: bool = True) -> None:
+    """Share one database engine per URL across all sessions.
+    
+    Only for processes running a single event loop for their lifetime
+    (such as ``gnosari serve``); shared engines are released with
+    ``dispose_shared_engines``.
+    
+    Args:
+        enabled: Whether new sessions use shared engines
+    """
+    global _share_engines
+    _share_engines = enabled
+
+
+async def dispose_shared_engines() -> None:
+    """Dispose all shared database engines."""
+    for database_url, engine in list(_shared_engines.items()):
+        try:
+            await engine.dispose()
+            logger.debug(f"Disposed shared database engine: {database_url}")
+        except Exception as e:
+            logger.warning(f"Error disposing shared database engine: {e}")
+    _shared_engines.clear()
+    _shared_tables_created.clear()
+
 
 class DatabaseSession(SessionABC):
     """Database session implementation using SQLAlchemy."""
@@ -57,18 +90,25 @@ class DatabaseSession(SessionABC):
         
         # Initialize database engine with robust connection handling
         self._database_available = True
+        self._owns_engine = not _share_engines
         try:
-            self._engine = create_async_engine(
-                self._database_url,
-                pool_size=20,  # Increased from default 5
-                max_overflow=30,  # Increased from default 10
-                pool_timeout=30,  # 30 seconds timeout for getting connection from pool
-                pool_recycle=3600,  # Recycle connections every hour
-                pool_pre_ping=True,  # Validate connections before use
-                connect_args=self._get_connect_args()
-            )
+            if _share_engines and self._database_url in _shared_engines:
+                self._engine = _shared_engines[self._database_url]
+                self._create_tables = self._create_tables and self._database_url not in _shared_tables_created
+            else:
+                self._engine = create_async_engine(
+                    self._database_url,
+                    pool_size=20,  # Increased from default 5
+                    max_overflow=30,  # Increased from default 10
+                    pool_timeout=30,  # 30 seconds timeout for getting connection from pool
+                    pool_recycle=3600,  # Recycle connections every hour
+                    pool_pre_ping=True,  # Validate connections before use
+                    connect_args=self._get_connect_args()
+                )
+                if _share_engines:
+                    _shared_engines[self._database_url] = self._engine
+                logger.info(f"Database engine initialized successfully: {self._database_url}")
             self._setup_database_schema()
-            logger.info(f"Database engine initialized successfully: {self._database_url}")
         except Exception as e:
             logger.error(f"Failed to initialize database engine: {e}")
             self._database_available = False
@@ -79,6 +119,10 @@ class DatabaseSession(SessionABC):
     
     async def cleanup(self):
         """Clean up database connections and resources."""
+        if not getattr(self, '_owns_engine', True):
+            # Shared engines outlive sessions
+            self._engine = None
+            return
         if hasattr(self, '_engine') and self._engine:
             try:
                 await self._engine.dispose()
@@ -88,7 +132,7 @@ class DatabaseSession(SessionABC):
     
     def __del__(self):
         """Ensure cleanup on deletion."""
-        if hasattr(self, '_engine') and self._engine:
+        if getattr(self, '_owns_engine', True) and getattr(self, '_engine', None):
             logger.warning(f"Session {self.session_id} was not properly cleaned up - engine still active")
     
     def _get_connect_args(self):
@@ -158,6 +202,8 @@ class DatabaseSession(SessionABC):
                 async with self._engine.begin() as conn:
                     await conn.run_sync(self._metadata.create_all)
                 self._create_tables = False  # Only create once
+                if not self._owns_engine:
+                    _shared_tables_created.add(self._database_url)
                 logger.info(f"Database tables created successfully for session {self.session_id}")
             except Exception as e:
                 logger.error(f"Failed to create database tables: {e}")
@@ -6,8 +6,11 @@ import logging
 import asyncio
 import json
 import os
+import re
 import subprocess
 import shlex
+import signal
+import uuid
 from pathlib import Path
 from typing import Any, Optional, Literal, List, Dict, Union
 from pydantic import BaseModel, Field, field_validator
@@ -19,7 +22,13 @@ class BashArgs(BaseModel):
     """Arguments for the enhanced bash tool."""
     # Support both single command and multiple commands
     command: Optional[str] = Field(default=None, description="Single bash command to execute")
-    commands: Optional[List[str]] = Field(default=None, description="List of bash commands to execute in sequence")
+    commands: Optional[List[str]] = Field(default=None, description="List of bash commands to execute")
+    execution_mode: Optional[Literal["sequential", "parallel", "shell"]] = Field(
+        default=None,
+        description="How to run multiple commands: 'sequential' (one after another), 'parallel' (independent "
+                    "commands run concurrently) or 'shell' (one persistent shell, so cd/export carry over)"
+    )
+    max_parallel: Optional[int] = Field(default=None, description="Maximum concurrent commands in parallel mode")
     
     # Execution options
     working_directory: Optional[str] = Field(default=None, description="Working directory for command execution (relative to base directory)")
@@ -45,6 +54,14 @@ class BashArgs(BaseModel):
             raise ValueError("Timeout must be between 1 and 300 seconds")
         return v
     
+    @field_validator('max_parallel')
+    @classmethod
+    def validate_max_parallel(cls, v):
+        """Validate parallelism limit."""
+        if v is not None and v < 1:
+            raise ValueError("max_parallel must be at least 1")
+        return v
+    
     class Config:
         extra = "forbid"
 
@@ -52,6 +69,8 @@ class BashArgs(BaseModel):
 class BashTool(SyncTool):
     """Enhanced Bash Tool that supports multiple commands and advanced features."""
     
+    EXECUTION_MODES = ("sequential", "parallel", "shell")
+    
     def __init__(
         self,
         base_directory: str = "./workspace",
@@ -61,7 +80,9 @@ class BashTool(SyncTool):
         unsafe_mode: bool = False,
         commands: Optional[List[str]] = None,  # Pre-configured commands
         timeout: Optional[int] = 30,  # Default timeout
-        env_vars: Optional[Dict[str, str]] = None  # Default environment variables
+        env_vars: Optional[Dict[str, str]] = None,  # Default environment variables
+        execution_mode: str = "sequential",  # Default mode for multiple commands
+        max_parallel: int = 4  # Concurrency limit for parallel mode
     ):
         """Initialize the enhanced bash tool.
         
@@ -74,6 +95,8 @@ class BashTool(SyncTool):
             commands: Pre-configured list of commands to execute (can be overridden at runtime)
             timeout: Default timeout for commands
             env_vars: Default environment variables
+            execution_mode: Default mode for multiple commands ('sequential', 'parallel' or 'shell')
+            max_parallel: Maximum number of commands running at once in parallel mode
         """
         # Call parent constructor
         super().__init__(
@@ -90,6 +113,11 @@ class BashTool(SyncTool):
         self.default_commands = commands
         self.default_timeout = timeout
         self.default_env_vars = env_vars or {}
+        self.max_parallel = max(1, max_parallel)
+        
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"execution_mode must be one of: {list(self.EXECUTION_MODES)}")
+        self.default_execution_mode = execution_mode
         
         # Setup logger
         self.logger = logging.getLogger(__name__)
@@ -106,7 +134,9 @@ class BashTool(SyncTool):
             name=self.name,
             description=self.description,
             params_json_schema=BashArgs.model_json_schema(),
-            on_invoke_tool=self._run_bash
+            on_invoke_tool=self._run_bash,
+            # env_vars is a free-form mapping, which strict schemas cannot express
+            strict_json_schema=False
         )
     
     def _substitute_env_vars(self, command: str) -> str:
@@ -196,8 +226,24 @@ class BashTool(SyncTool):
         full_path.mkdir(parents=True, exist_ok=True)
         return full_path
     
+    def _build_environment(self, env_vars: Dict[str, str]) -> Dict[str, str]:
+        """Build the process environment once per invocation."""
+        env = os.environ.copy()
+        env.update(self.default_env_vars)  # Apply default env vars
+        if env_vars:
+            env.update(env_vars)  # Apply runtime env vars
+        return env
+    
+    def _check_output_size(self, stdout_text: str, stderr_text: str) -> Optional[str]:
+        """Return an error message if output exceeds the configured maximum."""
+        total_size = len(stdout_text.encode('utf-8')) + len(stderr_text.encode('utf-8'))
+        if total_size > self.max_output_size:
+            self.logger.error(f"❌ Output too large: {total_size} bytes")
+            return f"Output too large ({total_size} bytes). Maximum: {self.max_output_size}"
+        return None
+    
     async def _execute_command(self, command: str, working_dir: Path, timeout: int, 
-                               capture_output: bool, env_vars: Dict[str, str]) -> tuple[int, str, str]:
+                               capture_output: bool, env: Dict[str, str]) -> tuple[int, str, str]:
         """Execute a single bash command asynchronously.
         
         Returns:
@@ -207,12 +253,6 @@ class BashTool(SyncTool):
             # Substitute environment variables in command
             expanded_command = self._substitute_env_vars(command)
             
-            # Prepare environment
-            env = os.environ.copy()
-            env.update(self.default_env_vars)  # Apply default env vars
-            if env_vars:
-                env.update(env_vars)  # Apply runtime env vars
-            
             # Log the command
             self.logger.info(f"🔧 Executing: {expanded_command}")
             self.logger.info(f"📁 Working directory: {working_dir}")
@@ -223,7 +263,8 @@ class BashTool(SyncTool):
                 cwd=working_dir,
                 stdout=subprocess.PIPE if capture_output else None,
                 stderr=subprocess.PIPE if capture_output else None,
-                env=env
+                env=env,
+                start_new_session=True  # Own process group, so a timeout kills child commands too
             )
             
             # Wait for completion with timeout
@@ -233,7 +274,10 @@ class BashTool(SyncTool):
                     timeout=timeout
                 )
             except asyncio.TimeoutError:
-                process.kill()
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
                 await process.wait()
                 self.logger.error(f"❌ Command timeout after {timeout} seconds")
                 return -1, "", f"Command timed out after {timeout} seconds"
@@ -243,10 +287,9 @@ class BashTool(SyncTool):
             stderr_text = stderr.decode('utf-8', errors='replace') if stderr else ""
             
             # Check output size
-            total_size = len(stdout_text.encode('utf-8')) + len(stderr_text.encode('utf-8'))
-            if total_size > self.max_output_size:
-                self.logger.error(f"❌ Output too large: {total_size} bytes")
-                return -1, "", f"Output too large ({total_size} bytes). Maximum: {self.max_output_size}"
+            size_error = self._check_output_size(stdout_text, stderr_text)
+            if size_error:
+                return -1, "", size_error
             
             if process.returncode == 0:
                 self.logger.info(f"✅ Command success - Exit code: 0")
@@ -259,6 +302,168 @@ class BashTool(SyncTool):
             self.logger.error(f"❌ Command execution failed: {str(e)}")
             return -1, "", str(e)
     
+    @staticmethod
+    def _make_result(number: int, command: str, exit_code: int, stdout: str, stderr: str) -> Dict[str, Any]:
+        """Build the result record for one command."""
+        return {
+            "command_number": number,
+            "command": command,
+            "exit_code": exit_code,
+            "stdout": stdout.strip() if stdout else "",
+            "stderr": stderr.strip() if stderr else ""
+        }
+    
+    async def _run_sequential(self, commands: List[str], working_dir: Path, timeout: int,
+                              capture_output: bool, env: Dict[str, str], stop_on_error: bool) -> List[Dict[str, Any]]:
+        """Run commands one after another, each in its own shell."""
+        results = []
+        for i, command in enumerate(commands, 1):
+            exit_code, stdout, stderr = await self._execute_command(
+                command, working_dir, timeout, capture_output, env
+            )
+            results.append(self._make_result(i, command, exit_code, stdout, stderr))
+            
+            # Check if we should stop on error
+            if stop_on_error and exit_code != 0:
+                self.logger.warning(f"Stopping execution due to error in command {i}")
+                break
+        return results
+    
+    async def _run_parallel(self, commands: List[str], working_dir: Path, timeout: int, capture_output: bool,
+                            env: Dict[str, str], stop_on_error: bool, max_parallel: int) -> List[Dict[str, Any]]:
+        """Run independent commands concurrently, at most ``max_parallel`` at a time.
+        
+        With ``stop_on_error``, commands that haven't started when one fails are skipped.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+        failed = asyncio.Event()
+        
+        async def run_one(number: int, command: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                if stop_on_error and failed.is_set():
+                    return None
+                exit_code, stdout, stderr = await self._execute_command(
+                    command, working_dir, timeout, capture_output, env
+                )
+                if exit_code != 0:
+                    failed.set()
+                return self._make_result(number, command, exit_code, stdout, stderr)
+        
+        self.logger.info(f"⚡ Running {len(commands)} commands in parallel (max {max_parallel} at once)")
+        outcomes = await asyncio.gather(*(run_one(i, command) for i, command in enumerate(commands, 1)))
+        
+        if stop_on_error and failed.is_set():
+            self.logger.warning("Skipped pending commands due to an error")
+        return [result for result in outcomes if result is not None]
+    
+    async def _run_in_shell(self, commands: List[str], working_dir: Path, timeout: int,
+                            capture_output: bool, env: Dict[str, str], stop_on_error: bool) -> List[Dict[str, Any]]:
+        """Run dependent commands in one persistent shell process.
+        
+        Shell state (current directory, exported variables, functions) carries
+        over between commands, and variables are expanded by the shell rather
+        than by ``_substitute_env_vars``. ``timeout`` applies to each command, so the
+        whole script gets ``timeout * len(commands)`` seconds.
+        """
+        marker = f"__GNOSARI_CMD_END_{uuid.uuid4().hex}"
+        script_lines = []
+        for i, command in enumerate(commands, 1):
+            # Left unexpanded: the shell resolves $VAR against its own state,
+            # including variables exported and directories entered by earlier commands
+            script_lines.append(f"{{\n{command}\n}}")
+            script_lines.append(
+                f"__gnosari_rc=$?; printf '\\n{marker}_{i}_%d\\n' \"$__gnosari_rc\"; "
+                f"printf '\\n{marker}_{i}\\n' >&2"
+            )
+            if stop_on_error:
+                script_lines.append('[ "$__gnosari_rc" -eq 0 ] || exit "$__gnosari_rc"')
+        script = "\n".join(script_lines)
+        
+        self.logger.info(f"🐚 Running {len(commands)} commands in one shell")
+        self.logger.info(f"📁 Working directory: {working_dir}")
+        
+        total_timeout = timeout * len(commands)
+        timed_out = False
+        stdout_chunks: List[bytes] = []
+        stderr_chunks: List[bytes] = []
+        
+        async def drain(stream: asyncio.StreamReader, chunks: List[bytes]) -> None:
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "bash", "-c", script,
+                cwd=working_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+                start_new_session=True  # Own process group, so a timeout kills child commands too
+            )
+            tasks = [
+                asyncio.create_task(drain(process.stdout, stdout_chunks)),
+                asyncio.create_task(drain(process.stderr, stderr_chunks)),
+                asyncio.create_task(process.wait())
+            ]
+            # Read incrementally so output of completed commands survives a timeout
+            _, pending = await asyncio.wait(tasks, timeout=total_timeout)
+            if pending:
+                timed_out = True
+                self.logger.error(f"❌ Shell timeout after {total_timeout} seconds")
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            await asyncio.gather(*tasks)
+        except Exception as e:
+            self.logger.error(f"❌ Shell execution failed: {str(e)}")
+            return [self._make_result(1, commands[0], -1, "", str(e))]
+        
+        stdout_text = b"".join(stdout_chunks).decode('utf-8', errors='replace')
+        stderr_text = b"".join(stderr_chunks).decode('utf-8', errors='replace')
+        
+        size_error = self._check_output_size(stdout_text, stderr_text)
+        if size_error:
+            return [self._make_result(1, commands[0], -1, "", size_error)]
+        
+        # Split the combined output back into per-command sections
+        stdout_parts = re.split(rf"\n?{marker}_(\d+)_(-?\d+)\n", stdout_text)
+        stderr_parts = re.split(rf"\n?{marker}_\d+\n", stderr_text)
+        
+        results = []
+        for index in range((len(stdout_parts) - 1) // 3):
+            number = int(stdout_parts[index * 3 + 1])
+            exit_code = int(stdout_parts[index * 3 + 2])
+            command_stderr = stderr_parts[index] if index < len(stderr_parts) else ""
+            results.append(self._make_result(
+                number, commands[number - 1], exit_code,
+                stdout_parts[index * 3] if capture_output else "",
+                command_stderr if capture_output else ""
+            ))
+        
+        # A command that never printed its marker was interrupted (timeout or exit)
+        if len(results) < len(commands) and (timed_out or not stop_on_error or not results or results[-1]["exit_code"] == 0):
+            number = len(results) + 1
+            trailing_stderr = stderr_parts[len(results)] if len(results) < len(stderr_parts) else ""
+            if timed_out:
+                trailing_stderr = (trailing_stderr + f"\nCommand timed out after {total_timeout} seconds").strip()
+            results.append(self._make_result(
+                number, commands[number - 1], -1 if timed_out else process.returncode,
+                stdout_parts[-1] if capture_output else "",
+                trailing_stderr if capture_output else ""
+            ))
+        
+        for result in results:
+            if result["exit_code"] == 0:
+                self.logger.info(f"✅ Command {result['command_number']} success - Exit code: 0")
+            else:
+                self.logger.warning(f"⚠️ Command {result['command_number']} completed with exit code: {result['exit_code']}")
+        
+        return results
+    
     async def _run_bash(self, ctx: RunContextWrapper[Any], args: str) -> str:
         """Execute bash commands based on configuration and runtime arguments.
         
@@ -293,32 +498,30 @@ class BashTool(SyncTool):
             stop_on_error = parsed_args.stop_on_error
             env_vars = parsed_args.env_vars or {}
             
-            # Execute commands
-            results = []
-            for i, command in enumerate(commands_to_run, 1):
-                # Validate command
+            execution_mode = parsed_args.execution_mode or self.default_execution_mode
+            max_parallel = parsed_args.max_parallel or self.max_parallel
+            
+            # Validate every command before running any of them
+            for command in commands_to_run:
                 self._validate_dangerous_patterns(command)
                 self._validate_command_permissions(command)
-                
-                # Execute command
-                exit_code, stdout, stderr = await self._execute_command(
-                    command, working_dir, timeout, capture_output, env_vars
+            
+            # Build the environment once for the whole invocation
+            env = self._build_environment(env_vars)
+            
+            # Execute commands
+            if len(commands_to_run) > 1 and execution_mode == "parallel":
+                results = await self._run_parallel(
+                    commands_to_run, working_dir, timeout, capture_output, env, stop_on_error, max_parallel
+                )
+            elif len(commands_to_run) > 1 and execution_mode == "shell":
+                results = await self._run_in_shell(
+                    commands_to_run, working_dir, timeout, capture_output, env, stop_on_error
+                )
+            else:
+                results = await self._run_sequential(
+                    commands_to_run, working_dir, timeout, capture_output, env, stop_on_error
                 )
-                
-                # Store result
-                result = {
-                    "command_number": i,
-                    "command": command,
-                    "exit_code": exit_code,
-                    "stdout": stdout.strip() if stdout else "",
-                    "stderr": stderr.strip() if stderr else ""
-                }
-                results.append(result)
-                
-                # Check if we should stop on error
-                if stop_on_error and exit_code != 0:
-                    self.logger.warning(f"Stopping execution due to error in command {i}")
-                    break
             
             # Format output
             output_parts = []
@@ -218,14 +218,14 @@ class DelegateAgentTool(AsyncTool):
             
             parsed_args = DelegateAgentArgs.model_validate_json(args)
             session_id = ctx.context.session_id
-            original_config = ctx.context.team.original_config
+            original_config = ctx.context.original_config
 
             if not original_config:
                 self.logger.warning("No original_config found in context - delegation will fail")
             
             task_id = str(uuid.uuid4())
             
-            message_id = self.send_async_message(
+            message_id = await self.send_async_message_async(
                 task_id=task_id,
                 tool_module='gnosari.tools.builtin.delegation',
                 tool_class='DelegateAgentTool',
@@ -4,7 +4,7 @@ OpenAI Knowledge Query Tool - Using OpenAI Agents SDK FunctionTool class
 
 import logging
 import asyncio
-from typing import Any
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from agents import RunContextWrapper, FunctionTool
 from ...tools.interfaces import SyncTool
@@ -14,6 +14,10 @@ class KnowledgeQueryArgs(BaseModel):
     """Arguments for the knowledge query tool."""
     query: str = Field(..., description="The search query to find relevant information in the knowledge base")
     knowledge_name: str = Field(..., description="The name of the knowledge base to query")
+    knowledge_names: Optional[List[str]] = Field(default=None, description="Additional knowledge bases to search together with knowledge_name; their results are merged by relevance")
+    max_results: Optional[int] = Field(default=5, description="Maximum number of results to return (1-20)")
+    filters: Optional[Dict[str, Any]] = Field(default=None, description="Optional metadata filter on the stored chunks, e.g. {\"data_type\": \"web_page\"}")
+    min_score: Optional[float] = Field(default=None, ge=0, le=1, description="Optional minimum relevance score (0-1) of returned results")
 
 
 class KnowledgeQueryTool(SyncTool):
@@ -42,7 +46,9 @@ class KnowledgeQueryTool(SyncTool):
             name=self.name,
             description=self.description,
             params_json_schema=KnowledgeQueryArgs.model_json_schema(),
-            on_invoke_tool=self._run_knowledge_query
+            on_invoke_tool=self._run_knowledge_query,
+            # filters is a free-form mapping, which strict schemas cannot express
+            strict_json_schema=False
         )
     
     def set_knowledge_manager(self, knowledge_manager):
@@ -68,7 +74,12 @@ class KnowledgeQueryTool(SyncTool):
             if not self.knowledge_manager:
                 return "Error: Knowledge manager not available"
             
-            self.logger.info(f"🔍 KNOWLEDGE QUERY STARTED - Query: '{parsed_args.query}' | Knowledge Base: '{parsed_args.knowledge_name}'")
+            knowledge_names = [parsed_args.knowledge_name]
+            for name in parsed_args.knowledge_names or []:
+                if name not in knowledge_names:
+                    knowledge_names.append(name)
+            
+            self.logger.info(f"🔍 KNOWLEDGE QUERY STARTED - Query: '{parsed_args.query}' | Knowledge Base: '{', '.join(knowledge_names)}'")
             
             # Check if knowledge base exists
             try:
@@ -80,15 +91,31 @@ class KnowledgeQueryTool(SyncTool):
                 self.logger.error(f"Error getting knowledge bases: {e}")
                 available_bases = []
             
-            if parsed_args.knowledge_name not in available_bases:
+            missing = [name for name in knowledge_names if name not in available_bases]
+            if missing:
                 available_bases_str = ', '.join(available_bases) if available_bases else 'None'
-                return f"Error: Knowledge base '{parsed_args.knowledge_name}' not found. Available bases: {available_bases_str}"
+                return f"Error: Knowledge base '{missing[0]}' not found. Available bases: {available_bases_str}"
+            
+            max_results = min(max(parsed_args.max_results or 5, 1), 20)
             
             # Perform the query (async method)
-            results = await self.knowledge_manager.query_knowledge_base(
-                parsed_args.knowledge_name, 
-                parsed_args.query
-            )
+            if len(knowledge_names) > 1:
+                # Search the bases concurrently and merge their results by score
+                results = await self.knowledge_manager.query_knowledge_bases(
+                    parsed_args.query,
+                    kb_names=knowledge_names,
+                    max_results=max_results,
+                    filters=parsed_args.filters,
+                    min_score=parsed_args.min_score
+                )
+            else:
+                results = await self.knowledge_manager.query_knowledge_base(
+                    parsed_args.knowledge_name, 
+                    parsed_args.query,
+                    max_results=max_results,
+                    filters=parsed_args.filters,
+                    min_score=parsed_args.min_score
+                )
             
             # Extract content from results
             if results:
@@ -9,10 +9,10 @@ from typing import Any, Optional, Dict, List
 from pydantic import BaseModel, Field
 from agents import RunContextWrapper, FunctionTool
 from ...tools.interfaces import SyncTool
-from sqlalchemy import create_engine, text, MetaData, Table
+from ..sql import sql_engine_registry, sql_result_cache, classify_sql, SQLClassification
+from sqlalchemy import text, MetaData, Table
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
 
 
 class MySQLQueryArgs(BaseModel):
@@ -38,7 +38,9 @@ class MySQLQueryTool(SyncTool):
                  pool_timeout: int = 30,
                  pool_recycle: int = 3600,
                  query_timeout: int = 30,
-                 echo: bool = False):
+                 echo: bool = False,
+                 enable_result_cache: bool = False,
+                 result_cache_ttl: int = 60):
         """Initialize the MySQL query tool.
         
         Args:
@@ -54,6 +56,8 @@ class MySQLQueryTool(SyncTool):
             pool_recycle: Time in seconds before connection is recycled
             query_timeout: Default timeout for queries in seconds
             echo: Whether to echo SQL statements (for debugging)
+            enable_result_cache: Cache results of SELECT queries (opt-in)
+            result_cache_ttl: Time in seconds before a cached result expires
         """
         # Call parent constructor first
         super().__init__(
@@ -74,12 +78,16 @@ class MySQLQueryTool(SyncTool):
         self.pool_recycle = pool_recycle
         self.query_timeout = query_timeout
         self.echo = echo
+        self.enable_result_cache = enable_result_cache
+        self.result_cache_ttl = result_cache_ttl
         
         # Setup logger
         self.logger = logging.getLogger(__name__)
         
         # Initialize engine and session factory
         self.engine = None
+        self._engine_key = None
+        self._connection_key = None
         self.SessionFactory = None
         self._initialize_connection()
         
@@ -100,10 +108,12 @@ class MySQLQueryTool(SyncTool):
                 f"{self.host}:{self.port}/{self.database}?charset={self.charset}"
             )
             
-            # Create engine with connection pooling
-            self.engine = create_engine(
+            # Connection identity used for result caching and invalidation
+            self._connection_key = sql_engine_registry.normalize_url(connection_url)
+            
+            # Get a shared engine - tools pointing at the same database reuse one pool
+            self.engine, self._engine_key = sql_engine_registry.acquire(
                 connection_url,
-                poolclass=QueuePool,
                 pool_size=self.pool_size,
                 max_overflow=self.max_overflow,
                 pool_timeout=self.pool_timeout,
@@ -125,21 +135,30 @@ class MySQLQueryTool(SyncTool):
             self.logger.error(f"❌ FAILED TO INITIALIZE MYSQL CONNECTION: {str(e)}")
             raise
     
-    def _validate_query(self, query: str, query_type: str) -> bool:
-        """Validate the SQL query for safety and type consistency."""
-        query_upper = query.strip().upper()
+    def _validate_query(self, query: str, query_type: str) -> SQLClassification:
+        """Validate the SQL query for safety and type consistency.
+        
+        Returns:
+            SQLClassification verdict for the query
+        """
+        classification = classify_sql(query, 'mysql')
+        
+        if classification.statement_count == 0:
+            raise ValueError("Query is empty.")
+        
+        if classification.statement_count > 1:
+            raise ValueError(f"Query contains {classification.statement_count} statements. Submit one statement per call.")
         
         # Check if query type matches the actual query
-        if not query_upper.startswith(query_type.upper()):
-            self.logger.warning(f"Query type '{query_type}' doesn't match query start: {query_upper[:20]}...")
+        if classification.statement_type != query_type.upper():
+            self.logger.warning(f"Query type '{query_type}' doesn't match statement type: {classification.statement_type}")
         
         # Basic safety checks
         dangerous_keywords = ['DROP', 'TRUNCATE', 'ALTER', 'CREATE', 'GRANT', 'REVOKE']
-        for keyword in dangerous_keywords:
-            if keyword in query_upper:
-                self.logger.warning(f"Query contains potentially dangerous keyword: {keyword}")
+        for keyword in classification.find_keywords(dangerous_keywords):
+            self.logger.warning(f"Query contains potentially dangerous keyword: {keyword}")
         
-        return True
+        return classification
     
     async def _run_mysql_query(self, ctx: RunContextWrapper[Any], args: str) -> str:
         """
@@ -164,7 +183,17 @@ class MySQLQueryTool(SyncTool):
             self.logger.debug(f"Query: {parsed_args.query}")
             
             # Validate query
-            self._validate_query(parsed_args.query, parsed_args.query_type)
+            classification = self._validate_query(parsed_args.query, parsed_args.query_type)
+            
+            is_select = parsed_args.query_type.upper() == "SELECT" and classification.read_only
+            cache_key = (sql_result_cache.normalize_sql(parsed_args.query, 'mysql'), parsed_args.limit)
+            
+            # Serve repeated SELECT queries from the result cache
+            if is_select and self.enable_result_cache:
+                cached = sql_result_cache.get(self._connection_key, cache_key)
+                if cached is not None:
+                    self.logger.info("✅ MYSQL QUERY CACHE HIT - SELECT")
+                    return cached
             
             # Create session
             session = self.SessionFactory()
@@ -188,6 +217,13 @@ class MySQLQueryTool(SyncTool):
                     final_timeout
                 )
             
+            if is_select:
+                if self.enable_result_cache:
+                    sql_result_cache.put(self._connection_key, cache_key, result, ttl=self.result_cache_ttl)
+            else:
+                # Writes may change anything on this connection
+                sql_result_cache.invalidate_connection(self._connection_key)
+            
             # Log successful result
             result_preview = str(result)[:200] + "..." if len(str(result)) > 200 else str(result)
             self.logger.info(f"✅ MYSQL QUERY SUCCESSFUL - {parsed_args.query_type} executed")
@@ -195,6 +231,11 @@ class MySQLQueryTool(SyncTool):
             
             return result
             
+        except ValueError as e:
+            error_msg = f"Query validation error: {str(e)}"
+            self.logger.error(f"❌ MYSQL QUERY FAILED with validation error: {error_msg}")
+            return error_msg
+            
         except SQLAlchemyError as e:
             error_msg = f"Database error executing {parsed_args.query_type} query: {str(e)}"
             self.logger.error(f"❌ MYSQL QUERY FAILED with SQLAlchemyError: {error_msg}")
@@ -284,10 +325,15 @@ class MySQLQueryTool(SyncTool):
         return self.tool
     
     def close_connections(self):
-        """Close all database connections."""
-        if self.engine:
-            self.engine.dispose()
-            self.logger.info("🔒 MySQL connections closed")
+        """Release this tool's reference to the shared engine.
+        
+        The engine is disposed once no other tool uses it.
+        """
+        if self._engine_key:
+            sql_engine_registry.release(self._engine_key)
+            self._engine_key = None
+            self.engine = None
+            self.logger.info("🔒 MySQL connections released")
 
 
 def get_default_mysql_query_tool() -> FunctionTool:
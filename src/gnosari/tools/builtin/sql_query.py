@@ -11,10 +11,14 @@ from urllib.parse import urlparse
 from pydantic import BaseModel, Field, field_validator
 from agents import RunContextWrapper, FunctionTool
 from ...tools.interfaces import SyncTool
-from sqlalchemy import create_engine, text, MetaData, inspect
+from ..sql import sql_engine_registry, sql_result_cache, classify_sql, SQLClassification
+from ..sql.formatters import COMPACT_FORMATS, format_rows, fit_to_token_budget
+from sqlalchemy import text, MetaData, inspect
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool, NullPool
+
+
+VALID_RETURN_FORMATS = ['json', 'table', 'raw', *COMPACT_FORMATS]
 
 
 class SQLQueryArgs(BaseModel):
@@ -23,7 +27,11 @@ class SQLQueryArgs(BaseModel):
     query_type: str = Field(default="SELECT", description="Type of query (SELECT, INSERT, UPDATE, DELETE, etc.)")
     limit: Optional[int] = Field(default=None, description="Maximum number of rows to return (for SELECT queries)")
     timeout: Optional[int] = Field(default=None, description="Query timeout in seconds (overrides configured timeout)")
-    return_format: str = Field(default="json", description="Return format: 'json', 'table', or 'raw'")
+    return_format: Optional[str] = Field(
+        default=None,
+        description="Return format: 'columnar' (compact JSON), 'csv', 'tsv', 'markdown', 'json', 'table', or 'raw'. "
+                    "Defaults to the tool's configured format."
+    )
 
     @field_validator('query_type')
     @classmethod
@@ -38,9 +46,10 @@ class SQLQueryArgs(BaseModel):
     @classmethod
     def validate_return_format(cls, v):
         """Validate return format."""
-        valid_formats = ['json', 'table', 'raw']
-        if v.lower() not in valid_formats:
-            raise ValueError(f"Return format must be one of: {valid_formats}")
+        if v is None:
+            return v
+        if v.lower() not in VALID_RETURN_FORMATS:
+            raise ValueError(f"Return format must be one of: {VALID_RETURN_FORMATS}")
         return v.lower()
 
 
@@ -57,7 +66,11 @@ class SQLQueryTool(SyncTool):
                  echo: bool = False,
                  enable_unsafe_operations: bool = False,
                  allowed_schemas: Optional[List[str]] = None,
-                 blocked_keywords: Optional[List[str]] = None):
+                 blocked_keywords: Optional[List[str]] = None,
+                 enable_result_cache: bool = False,
+                 result_cache_ttl: int = 60,
+                 default_return_format: str = "json",
+                 max_result_tokens: Optional[int] = None):
         """Initialize the SQL query tool.
         
         Args:
@@ -71,6 +84,10 @@ class SQLQueryTool(SyncTool):
             enable_unsafe_operations: Allow dangerous operations (DROP, TRUNCATE, etc.)
             allowed_schemas: List of allowed schema names (None = all allowed)
             blocked_keywords: Additional keywords to block in queries
+            enable_result_cache: Cache results of read-only queries (opt-in)
+            result_cache_ttl: Time in seconds before a cached result expires
+            default_return_format: Format used when a call doesn't specify one
+            max_result_tokens: Token budget for SELECT results; rows beyond it are dropped
         """
         # Call parent constructor first
         super().__init__(
@@ -89,15 +106,27 @@ class SQLQueryTool(SyncTool):
         self.enable_unsafe_operations = enable_unsafe_operations
         self.allowed_schemas = allowed_schemas
         self.blocked_keywords = blocked_keywords or []
+        self.enable_result_cache = enable_result_cache
+        self.result_cache_ttl = result_cache_ttl
+        self.max_result_tokens = max_result_tokens
+        
+        if default_return_format.lower() not in VALID_RETURN_FORMATS:
+            raise ValueError(f"default_return_format must be one of: {VALID_RETURN_FORMATS}")
+        self.default_return_format = default_return_format.lower()
         
         # Setup logger
         self.logger = logging.getLogger(__name__)
         
         # Parse database URL to determine database type
         self.db_type = self._parse_database_type(database_url)
+        self.sql_dialect = 'mysql' if self.db_type == 'MySQL' else 'generic'
+        
+        # Connection identity used for result caching and invalidation
+        self._connection_key = sql_engine_registry.normalize_url(database_url)
         
         # Initialize engine and session factory
         self.engine = None
+        self._engine_key = None
         self.SessionFactory = None
         self._initialize_connection()
         
@@ -144,27 +173,6 @@ class SQLQueryTool(SyncTool):
     def _initialize_connection(self):
         """Initialize the database connection and session factory."""
         try:
-            # Choose appropriate pooling strategy based on database type
-            if self.db_type.lower() == 'sqlite':
-                # SQLite doesn't support connection pooling
-                poolclass = NullPool
-                pool_kwargs = {}
-            else:
-                poolclass = QueuePool
-                pool_kwargs = {
-                    'pool_size': self.pool_size,
-                    'max_overflow': self.max_overflow,
-                    'pool_timeout': self.pool_timeout,
-                    'pool_recycle': self.pool_recycle
-                }
-            
-            # Create engine with appropriate configuration
-            engine_kwargs = {
-                'poolclass': poolclass,
-                'echo': self.echo,
-                **pool_kwargs
-            }
-            
             # Add database-specific connection arguments
             connect_args = {}
             
@@ -185,11 +193,16 @@ class SQLQueryTool(SyncTool):
                     'check_same_thread': False
                 })
             
-            if connect_args:
-                engine_kwargs['connect_args'] = connect_args
-            
-            # Create engine
-            self.engine = create_engine(self.database_url, **engine_kwargs)
+            # Get a shared engine - tools pointing at the same database reuse one pool
+            self.engine, self._engine_key = sql_engine_registry.acquire(
+                self.database_url,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout,
+                pool_recycle=self.pool_recycle,
+                echo=self.echo,
+                connect_args=connect_args
+            )
             
             # Create session factory
             self.SessionFactory = sessionmaker(bind=self.engine)
@@ -200,13 +213,30 @@ class SQLQueryTool(SyncTool):
             self.logger.error(f"❌ FAILED TO INITIALIZE SQL CONNECTION: {str(e)}")
             raise
     
-    def _validate_query_safety(self, query: str, query_type: str) -> bool:
-        """Validate the SQL query for safety."""
-        query_upper = query.strip().upper()
+    def _validate_query_safety(self, query: str, query_type: str) -> SQLClassification:
+        """Validate the SQL query for safety.
+        
+        The query is tokenized, so keywords inside string literals, comments
+        or identifiers such as ``updated_at`` never trigger a block.
+        
+        Returns:
+            SQLClassification verdict for the query
+        """
+        classification = classify_sql(query, self.sql_dialect)
+        
+        if classification.statement_count == 0:
+            raise ValueError("Query is empty.")
+        
+        # Multi-statement payloads can smuggle writes behind a harmless first statement
+        if classification.statement_count > 1 and not self.enable_unsafe_operations:
+            raise ValueError(
+                f"Query contains {classification.statement_count} statements. Submit one statement per call "
+                f"or set enable_unsafe_operations=True to allow."
+            )
         
         # Check if query type matches the actual query
-        if not query_upper.startswith(query_type.upper()):
-            self.logger.warning(f"Query type '{query_type}' doesn't match query start: {query_upper[:20]}...")
+        if classification.statement_type != query_type.upper():
+            self.logger.warning(f"Query type '{query_type}' doesn't match statement type: {classification.statement_type}")
         
         # Define dangerous keywords
         dangerous_keywords = [
@@ -220,33 +250,45 @@ class SQLQueryTool(SyncTool):
         
         # Check for dangerous operations if not explicitly allowed
         if not self.enable_unsafe_operations:
-            for keyword in all_blocked:
-                if keyword in query_upper:
-                    raise ValueError(f"Query contains blocked keyword: {keyword}. Set enable_unsafe_operations=True to allow.")
+            found = classification.find_keywords(all_blocked)
+            if found:
+                raise ValueError(f"Query contains blocked keyword: {found[0]}. Set enable_unsafe_operations=True to allow.")
         
-        # Check schema restrictions
-        if self.allowed_schemas:
-            # This is a basic check - more sophisticated schema validation could be added
-            for schema in self.allowed_schemas:
-                if schema.upper() in query_upper:
-                    break
-            else:
-                # If we're checking specific tables/schemas, this would need more sophisticated parsing
-                pass
-        
-        return True
+        return classification
     
     def _format_results(self, columns: List[str], rows: List, return_format: str, query_type: str) -> str:
         """Format query results based on the requested format."""
         if not rows and query_type.upper() == 'SELECT':
             return "Query executed successfully. No rows returned."
         
+        if return_format in COMPACT_FORMATS:
+            if not columns:
+                return f"Query executed successfully. {len(rows)} rows affected."
+            return format_rows(
+                columns,
+                rows,
+                return_format,
+                metadata={"status": "success", "database_type": self.db_type, "query_type": query_type},
+                max_tokens=self.max_result_tokens
+            )
+        
         if return_format == 'json':
-            return self._format_as_json(columns, rows, query_type)
+            formatter = self._format_as_json
         elif return_format == 'table':
-            return self._format_as_table(columns, rows, query_type)
+            formatter = self._format_as_table
         else:  # raw
-            return self._format_as_raw(columns, rows, query_type)
+            formatter = self._format_as_raw
+        
+        if query_type.upper() != 'SELECT' or not self.max_result_tokens:
+            return formatter(columns, rows, query_type)
+        
+        def render(count: int) -> str:
+            output = formatter(columns, rows[:count], query_type) if count else "Query executed successfully."
+            if count < len(rows):
+                output += f"\n(truncated: showing {count} of {len(rows)} rows)"
+            return output
+        
+        return fit_to_token_budget(render, len(rows), self.max_result_tokens)
     
     def _format_as_json(self, columns: List[str], rows: List, query_type: str) -> str:
         """Format results as JSON."""
@@ -343,12 +385,29 @@ class SQLQueryTool(SyncTool):
             
             # Use config values as defaults, allow per-call overrides
             final_timeout = parsed_args.timeout or self.query_timeout
+            return_format = parsed_args.return_format or self.default_return_format
             
             self.logger.info(f"🗄️ SQL QUERY STARTED - Database: {self.db_type} | Type: {parsed_args.query_type} | Timeout: {final_timeout}s")
             self.logger.debug(f"Query: {parsed_args.query}")
             
             # Validate query safety
-            self._validate_query_safety(parsed_args.query, parsed_args.query_type)
+            classification = self._validate_query_safety(parsed_args.query, parsed_args.query_type)
+            
+            read_only = classification.read_only
+            cache_key = (
+                sql_result_cache.normalize_sql(parsed_args.query, self.sql_dialect),
+                parsed_args.query_type,
+                parsed_args.limit,
+                return_format,
+                self.max_result_tokens
+            )
+            
+            # Serve repeated read-only queries from the result cache
+            if read_only and self.enable_result_cache:
+                cached = sql_result_cache.get(self._connection_key, cache_key)
+                if cached is not None:
+                    self.logger.info(f"✅ SQL QUERY CACHE HIT - {parsed_args.query_type} on {self.db_type}")
+                    return cached
             
             # Create session
             session = self.SessionFactory()
@@ -361,10 +420,17 @@ class SQLQueryTool(SyncTool):
                 parsed_args.query,
                 parsed_args.query_type,
                 parsed_args.limit,
-                parsed_args.return_format,
+                return_format,
                 final_timeout
             )
             
+            if read_only:
+                if self.enable_result_cache:
+                    sql_result_cache.put(self._connection_key, cache_key, result, ttl=self.result_cache_ttl)
+            else:
+                # Writes may change anything on this connection
+                sql_result_cache.invalidate_connection(self._connection_key)
+            
             # Log successful result
             result_preview = str(result)[:200] + "..." if len(str(result)) > 200 else str(result)
             self.logger.info(f"✅ SQL QUERY SUCCESSFUL - {parsed_args.query_type} executed on {self.db_type}")
@@ -457,10 +523,15 @@ class SQLQueryTool(SyncTool):
             return {"error": str(e)}
     
     def close_connections(self):
-        """Close all database connections."""
-        if self.engine:
-            self.engine.dispose()
-            self.logger.info(f"🔒 {self.db_type} connections closed")
+        """Release this tool's reference to the shared engine.
+        
+        The engine is disposed once no other tool uses it.
+        """
+        if self._engine_key:
+            sql_engine_registry.release(self._engine_key)
+            self._engine_key = None
+            self.engine = None
+            self.logger.info(f"🔒 {self.db_type} connections released")
 
 
 def get_default_sql_query_tool(database_url: str = "sqlite:///test.db") -> FunctionTool:
@@ -4,7 +4,7 @@ Tool interfaces for defining different execution capabilities.
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 from agents import FunctionTool, RunContextWrapper
 from gnosari.tools.base import BaseTool
 
@@ -55,33 +55,96 @@ class AsyncTool(BaseTool):
         
         Returns:
             Dict containing async execution settings like priority,
-            timeout, retry configuration, etc.
+            timeout, retry configuration, etc. An optional ``queue``
+            pins the tool to a queue; otherwise the queue is chosen from
+            priority and timeout (see CeleryConfig.route_for_metadata).
         """
         return {
             "priority": 5,
             "timeout": 600,  # 10 minutes
             "max_retries": 3,
-            "retry_delay": 2
+            "retry_delay": 2,
+            "batch": False  # Opt in to micro-batched queue delivery
         }
     
+    async def run_batch(self, items: List[Tuple[RunContextWrapper[Any], str]]) -> Optional[List[Any]]:
+        """Execute a batch of queued calls of this tool at once.
+        
+        Tools that can serve several calls more cheaply together (e.g. one
+        embedding request for many queries) override this. The default
+        returns None, and the consumer executes each item individually.
+        
+        Args:
+            items: (context, JSON arguments) pairs, one per queued call
+            
+        Returns:
+            One result per item in input order, or None to fall back to
+            per-item execution
+        """
+        return None
+    
     @staticmethod
     def serialize_context(ctx: RunContextWrapper[Any]) -> Dict[str, Any]:
         """Serialize RunContextWrapper to plain dictionary for queue messages.
         
+        The team configuration is published to the config store and only its
+        hash is included, so message size doesn't grow with the team. If the
+        store is unavailable the configuration is embedded as before. Blocks
+        on the config store; use ``serialize_context_async`` on an event loop.
+        
         Args:
             ctx: RunContextWrapper instance to serialize
             
         Returns:
             Dict containing serialized context data
         """
+        # Import here to avoid circular imports
+        from gnosari.queue.services.config_store import config_store
+        
+        original_config = ctx.context.original_config if ctx.context else None
+        config_hash = config_store.publish(original_config) if original_config else None
+        return AsyncTool._build_context_data(ctx, config_hash)
+    
+    @staticmethod
+    async def serialize_context_async(ctx: RunContextWrapper[Any]) -> Dict[str, Any]:
+        """Serialize RunContextWrapper without blocking the event loop.
+        
+        Same as ``serialize_context``, with the config store upload run in a
+        worker thread.
+        
+        Args:
+            ctx: RunContextWrapper instance to serialize
+            
+        Returns:
+            Dict containing serialized context data
+        """
+        # Import here to avoid circular imports
+        from gnosari.queue.services.config_store import config_store
+        
+        original_config = ctx.context.original_config if ctx.context else None
+        config_hash = await config_store.publish_async(original_config) if original_config else None
+        return AsyncTool._build_context_data(ctx, config_hash)
+    
+    @staticmethod
+    def _build_context_data(ctx: RunContextWrapper[Any], config_hash: Optional[str]) -> Dict[str, Any]:
+        """Build the serialized context, referencing the configuration by hash when it was published."""
+        original_config = ctx.context.original_config if ctx.context else None
+        session_context = dict(ctx.context.session_context) if ctx.context else {}
+        session_context.pop('original_config', None)
+        
+        context = {
+            'team': None,  # Can't serialize team object, will be rebuilt
+            'session_id': ctx.context.session_id if ctx.context else None,
+            'session_context': session_context
+        }
+        if config_hash:
+            context['config_hash'] = config_hash
+        else:
+            context['original_config'] = original_config
+        
         return {
             'context_wrapper': {
-                'context': {
-                    'original_config': ctx.context.original_config if ctx.context else None,
-                    'team': None,  # Can't serialize team object, will be rebuilt
-                    'session_id': ctx.context.session_id if ctx.context else None,
-                    'session_context': ctx.context.session_context if ctx.context else {}
-                },
+                'context': context,
                 'agent_id': getattr(ctx, 'agent_id', 'Unknown'),
                 'session_id': getattr(ctx, 'session_id', None)
             }
@@ -97,6 +160,37 @@ class AsyncTool(BaseTool):
                           priority: int = None) -> str:
         """Send async execution message to queue.
         
+        Blocks on the config store the first time a team configuration is
+        seen; use ``send_async_message_async`` from tool invocations.
+        
+        Args:
+            task_id: Unique task identifier
+            tool_module: Module path of the tool class
+            tool_class: Class name of the tool
+            tool_args: JSON string of tool execution arguments
+            context: RunContextWrapper with execution context
+            tool_init_args: Arguments for tool initialization
+            priority: Task priority (uses get_async_metadata if not provided)
+            
+        Returns:
+            str: Message ID
+        """
+        return self._send_message(task_id, tool_module, tool_class, tool_args, context,
+                                  self.serialize_context(context), tool_init_args, priority)
+    
+    async def send_async_message_async(self, 
+                                       task_id: str,
+                                       tool_module: str,
+                                       tool_class: str,
+                                       tool_args: str,
+                                       context: RunContextWrapper[Any],
+                                       tool_init_args: Dict[str, Any] = None,
+                                       priority: int = None) -> str:
+        """Send async execution message to queue without blocking the event loop.
+        
+        The team configuration is uploaded to the config store in a worker
+        thread before the message is sent.
+        
         Args:
             task_id: Unique task identifier
             tool_module: Module path of the tool class
@@ -109,16 +203,29 @@ class AsyncTool(BaseTool):
         Returns:
             str: Message ID
         """
+        context_data = await self.serialize_context_async(context)
+        return self._send_message(task_id, tool_module, tool_class, tool_args, context,
+                                  context_data, tool_init_args, priority)
+    
+    def _send_message(self,
+                      task_id: str,
+                      tool_module: str,
+                      tool_class: str,
+                      tool_args: str,
+                      context: RunContextWrapper[Any],
+                      context_data: Dict[str, Any],
+                      tool_init_args: Optional[Dict[str, Any]],
+                      priority: Optional[int]) -> str:
+        """Route and send a message whose context is already serialized."""
         # Import here to avoid circular imports
+        from gnosari.queue.config import CeleryConfig
         from gnosari.queue.consumers.tool_execution import send_tool_execution_message
         
-        # Get metadata for priority if not provided
-        if priority is None:
-            metadata = self.get_async_metadata()
-            priority = metadata.get("priority", 5)
-        
-        # Serialize context
-        context_data = self.serialize_context(context)
+        # Route by metadata: dedicated queue and broker priority
+        metadata = dict(self.get_async_metadata())
+        if priority is not None:
+            metadata["priority"] = priority
+        route = CeleryConfig.route_for_metadata(metadata)
         
         # Get session info
         session_id = context.context.session_id if context.context else None
@@ -135,11 +242,30 @@ class AsyncTool(BaseTool):
             context_data=context_data,
             agent_id=agent_id,
             session_id=session_id,
-            priority=priority
+            priority=route["priority"],
+            queue=route["queue"],
+            timeout=metadata.get("timeout"),
+            max_retries=metadata.get("max_retries"),
+            batch=bool(metadata.get("batch"))
         )
         
         return message_id
     
+    async def wait_for_async_result(self, task_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the result of a queued task.
+        
+        Args:
+            task_id: Task identifier returned when the task was queued
+            timeout: Seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            Result dictionary with status and result/error, or None on timeout
+        """
+        # Import here to avoid circular imports
+        from gnosari.queue.services.result_channel import tool_result_channel
+        
+        return await tool_result_channel.wait_for_result(task_id, timeout)
+    
     def format_async_response(self, 
                              task_id: str, 
                              message_id: str, 
@@ -162,7 +288,8 @@ class AsyncTool(BaseTool):
                 f"Message ID: {message_id}\n"
                 f"Target: {target_name}\n"
                 f"Session: {session_id or 'None'}\n\n"
-                f"The task will be processed by the next available worker.")
+                f"The task will be processed by the next available worker. "
+                f"Its result will be added to this conversation when it completes.")
 
 
 class SyncTool(BaseTool):
@@ -0,0 +1,22 @@
+"""
+Shared infrastructure for the SQL tools.
+
+This package holds the pieces used by both ``SQLQueryTool`` and
+``MySQLQueryTool`` that are not tools themselves.
+"""
+
+from .engine_registry import SQLEngineRegistry, sql_engine_registry, dispose_all_sql_engines
+from .result_cache import SQLResultCache, sql_result_cache
+from .classifier import SQLClassification, SQLStatement, classify_sql, normalize_sql
+
+__all__ = [
+    'SQLEngineRegistry',
+    'sql_engine_registry',
+    'dispose_all_sql_engines',
+    'SQLResultCache',
+    'sql_result_cache',
+    'SQLClassification',
+    'SQLStatement',
+    'classify_sql',
+    'normalize_sql',
+]
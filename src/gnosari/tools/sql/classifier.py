@@ -0,0 +1,329 @@
+"""
+Tokenizer-based SQL statement classifier.
+
+The SQL tools used to scan raw statement text for forbidden keywords, which
+flagged harmless queries (a column named ``updated_at``, a keyword inside a
+string literal) and let multi-statement payloads through. This module splits
+SQL into tokens while skipping string literals, quoted identifiers and
+comments, then identifies each statement's type. Verdicts are cached per
+normalized SQL.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+# Statement types that never modify data
+READ_ONLY_STATEMENT_TYPES = frozenset({'SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN', 'VALUES'})
+
+# Main verbs that may follow a WITH clause
+_CTE_MAIN_VERBS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'MERGE', 'VALUES'})
+
+# Statement type aliases
+_TYPE_ALIASES = {'DESC': 'DESCRIBE', 'TABLE': 'SELECT'}
+
+# Token placeholders for content that never contributes keywords
+_PLACEHOLDERS = {'literal': '<literal>', 'ident': '<ident>', 'param': '<param>'}
+
+
+@dataclass(frozen=True)
+class SQLStatement:
+    """A single classified statement."""
+    statement_type: str
+    words: Tuple[str, ...]
+    read_only: bool
+
+    def contains_sequence(self, keyword: str) -> bool:
+        """
+        Check whether a keyword (or multi-word phrase) appears as whole tokens.
+
+        Args:
+            keyword: Keyword such as ``TRUNCATE`` or ``DROP DATABASE``
+
+        Returns:
+            True if the words of ``keyword`` occur consecutively in the statement
+        """
+        needle = tuple(keyword.upper().split())
+        if not needle:
+            return False
+        size = len(needle)
+        return any(self.words[i:i + size] == needle for i in range(len(self.words) - size + 1))
+
+
+@dataclass(frozen=True)
+class SQLClassification:
+    """Classification verdict for a SQL payload."""
+    statements: Tuple[SQLStatement, ...]
+
+    @property
+    def statement_count(self) -> int:
+        """Number of non-empty statements in the payload."""
+        return len(self.statements)
+
+    @property
+    def statement_type(self) -> Optional[str]:
+        """Type of the first statement, or None for an empty payload."""
+        return self.statements[0].statement_type if self.statements else None
+
+    @property
+    def read_only(self) -> bool:
+        """True if the payload has statements and none of them writes."""
+        return bool(self.statements) and all(statement.read_only for statement in self.statements)
+
+    def find_keywords(self, keywords: Iterable[str]) -> List[str]:
+        """
+        Find which of the given keywords occur as tokens in any statement.
+
+        Args:
+            keywords: Keywords or multi-word phrases to look for
+
+        Returns:
+            Keywords that were found, in input order
+        """
+        return [kw for kw in keywords if any(statement.contains_sequence(kw) for statement in self.statements)]
+
+
+def _scan(sql: str, dialect: str = 'generic') -> List[Tuple[str, str]]:
+    """
+    Scan SQL text into ``(kind, text)`` tokens.
+
+    Kinds are ``word``, ``literal``, ``ident``, ``param``, ``punct`` and
+    ``sep`` (statement separator). Comments and whitespace are dropped.
+    The ``mysql`` dialect honours backslash escapes and ``#`` comments; the
+    generic dialect honours PostgreSQL dollar quoting instead.
+    """
+    mysql = dialect == 'mysql'
+    tokens: List[Tuple[str, str]] = []
+    i = 0
+    length = len(sql)
+
+    while i < length:
+        char = sql[i]
+        start = i
+
+        if char.isspace():
+            i += 1
+        elif (char == '-' and sql.startswith('--', i)) or (char == '#' and mysql):
+            # Line comment (# is MySQL-specific)
+            end = sql.find('\n', i)
+            i = length if end == -1 else end + 1
+        elif char == '/' and sql.startswith('/*!', i) and mysql:
+            # MySQL executable comment - its body is executed, so scan it as code
+            i += 3
+            while i < length and sql[i].isdigit():
+                i += 1
+        elif char == '/' and sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+        elif char in ("'", '"', '`'):
+            # Literal or quoted identifier; a doubled quote escapes itself.
+            # Backslash escapes apply to MySQL strings and PostgreSQL E'...' strings.
+            escapes = char != '`' and (mysql or (
+                char == "'" and start > 0 and sql[start - 1] in 'eE'
+                and bool(tokens) and tokens[-1] == ('word', sql[start - 1])
+            ))
+            i += 1
+            while i < length:
+                if sql[i] == '\\' and escapes:
+                    i += 2
+                    continue
+                if sql[i] == char:
+                    if i + 1 < length and sql[i + 1] == char:
+                        i += 2
+                        continue
+                    break
+                i += 1
+            i = min(i + 1, length)
+            tokens.append(('literal' if char == "'" else 'ident', sql[start:i]))
+        elif char == '$' and not mysql:
+            # PostgreSQL dollar-quoted string ($$...$$ or $tag$...$tag$) or $1 parameter
+            end_tag = sql.find('$', i + 1)
+            tag = sql[i:end_tag + 1] if end_tag != -1 else ''
+            if tag and (len(tag) == 2 or tag[1:-1].replace('_', '').isalnum()) and not tag[1:-1].isdigit():
+                close = sql.find(tag, end_tag + 1)
+                i = length if close == -1 else close + len(tag)
+                tokens.append(('literal', sql[start:i]))
+            else:
+                i += 1
+                while i < length and sql[i].isdigit():
+                    i += 1
+                tokens.append(('param', sql[start:i]))
+        elif char == ';':
+            tokens.append(('sep', ';'))
+            i += 1
+        elif char.isalpha() or char == '_':
+            while i < length and (sql[i].isalnum() or sql[i] in '_$'):
+                i += 1
+            tokens.append(('word', sql[start:i]))
+        elif char.isdigit():
+            while i < length and (sql[i].isalnum() or sql[i] == '.'):
+                i += 1
+            tokens.append(('punct', sql[start:i]))
+        else:
+            tokens.append(('punct', char))
+            i += 1
+
+    return tokens
+
+
+def _split_statements(tokens: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """Split scanned tokens into non-empty statements."""
+    statements: List[List[Tuple[str, str]]] = []
+    current: List[Tuple[str, str]] = []
+    for token in tokens:
+        if token[0] == 'sep':
+            if current:
+                statements.append(current)
+            current = []
+        else:
+            current.append(token)
+    if current:
+        statements.append(current)
+    return statements
+
+
+def _join_statements(statements: List[List[Tuple[str, str]]]) -> str:
+    """Render scanned statements as a single normalized string."""
+    return ' ; '.join(' '.join(text for _, text in statement) for statement in statements)
+
+
+def _placeholder_tokens(statement: List[Tuple[str, str]]) -> List[str]:
+    """Upper-case words and replace literals/identifiers with placeholders."""
+    return [text.upper() if kind == 'word' else _PLACEHOLDERS.get(kind, text) for kind, text in statement]
+
+
+def normalize_sql(sql: str, dialect: str = 'generic') -> str:
+    """
+    Normalize SQL text for use as a cache key.
+
+    Comments are removed and whitespace between tokens is collapsed, while
+    string literals and quoted identifiers are kept verbatim. The result is
+    only meant for comparison and is never executed.
+
+    Args:
+        sql: SQL text
+        dialect: ``mysql`` or ``generic``
+
+    Returns:
+        Normalized SQL string
+    """
+    return _join_statements(_split_statements(_scan(sql, dialect)))
+
+
+def tokenize_sql(sql: str, dialect: str = 'generic') -> List[List[str]]:
+    """
+    Split SQL into statements of tokens.
+
+    String literals, quoted identifiers and comments never produce word
+    tokens; literals and identifiers become ``<literal>`` and ``<ident>``
+    placeholders so statement structure is preserved.
+
+    Args:
+        sql: SQL text, possibly containing several statements
+        dialect: ``mysql`` or ``generic``
+
+    Returns:
+        One token list per statement. Words are upper-cased.
+    """
+    return [_placeholder_tokens(statement) for statement in _split_statements(_scan(sql, dialect))]
+
+
+def _statement_type(tokens: Sequence[str]) -> str:
+    """Determine the main verb of a tokenized statement."""
+    words = [token for token in tokens if token not in ('(', ')')]
+    if not words:
+        return 'UNKNOWN'
+
+    first = _TYPE_ALIASES.get(words[0], words[0])
+    if first != 'WITH':
+        return first
+
+    # Skip the CTE definitions and find the first top-level main verb
+    depth = 0
+    for token in tokens[1:]:
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif depth == 0 and token in _CTE_MAIN_VERBS:
+            return token
+    return 'SELECT'
+
+
+def _is_read_only(statement_type: str, tokens: Sequence[str]) -> bool:
+    """Decide whether a statement of the given type only reads data."""
+    words = [token for token in tokens if token.isalpha() or '_' in token]
+
+    if statement_type == 'EXPLAIN':
+        # EXPLAIN ANALYZE executes the explained statement
+        if 'ANALYZE' in words or 'ANALYSE' in words:
+            inner = words[1:]
+            while inner and inner[0] in ('ANALYZE', 'ANALYSE', 'VERBOSE'):
+                inner = inner[1:]
+            return _statement_type(inner) in READ_ONLY_STATEMENT_TYPES
+        return True
+
+    if statement_type not in READ_ONLY_STATEMENT_TYPES:
+        return False
+
+    if statement_type == 'SELECT':
+        # SELECT ... INTO creates tables or files; FOR UPDATE/SHARE takes locks
+        if 'INTO' in words:
+            return False
+        for index, word in enumerate(words[:-1]):
+            if word == 'FOR' and words[index + 1] in ('UPDATE', 'SHARE'):
+                return False
+        # Data-modifying CTEs
+        if tokens and tokens[0] == 'WITH' and any(word in ('INSERT', 'UPDATE', 'DELETE', 'MERGE') for word in words):
+            return False
+
+    return True
+
+
+_verdict_cache: "OrderedDict[Tuple, SQLClassification]" = OrderedDict()
+_verdict_cache_lock = threading.Lock()
+_VERDICT_CACHE_SIZE = 1024
+
+
+def classify_sql(sql: str, dialect: str = 'generic') -> SQLClassification:
+    """
+    Classify a SQL payload.
+
+    Verdicts are cached per normalized SQL, so agents re-issuing the same
+    query (even with different comments or spacing) reuse the verdict.
+
+    Args:
+        sql: SQL text to classify
+        dialect: ``mysql`` for MySQL/MariaDB lexing rules, ``generic`` otherwise
+
+    Returns:
+        SQLClassification with per-statement types and read-only flags
+    """
+    tokenized = tokenize_sql(sql, dialect)
+    # Token structure is the normalized form: comments, spacing, keyword case
+    # and literal contents never change the verdict
+    key = (tuple(tuple(tokens) for tokens in tokenized), dialect)
+
+    with _verdict_cache_lock:
+        verdict = _verdict_cache.get(key)
+        if verdict is not None:
+            _verdict_cache.move_to_end(key)
+            return verdict
+
+    statements = []
+    for tokens in tokenized:
+        statement_type = _statement_type(tokens)
+        statements.append(SQLStatement(
+            statement_type=statement_type,
+            words=tuple(token for token in tokens if token[0].isalpha() or token[0] == '_'),
+            read_only=_is_read_only(statement_type, tokens)
+        ))
+    verdict = SQLClassification(statements=tuple(statements))
+
+    with _verdict_cache_lock:
+        _verdict_cache[key] = verdict
+        if len(_verdict_cache) > _VERDICT_CACHE_SIZE:
+            _verdict_cache.popitem(last=False)
+    return verdict
@@ -0,0 +1,244 @@
+"""
+Process-wide SQLAlchemy engine registry shared by the SQL tools.
+
+Every SQL tool instance used to create its own engine and connection pool.
+Teams are built repeatedly (per delegation, per prompt build), so a single
+database could end up with many idle pools. The registry hands out one engine
+per normalized connection URL and pool options, caps the number of
+connections any one URL may hold and disposes everything at shutdown.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool, QueuePool
+
+
+# Upper bound on pool_size + max_overflow summed over all engines of one URL
+DEFAULT_MAX_CONNECTIONS_PER_URL = int(os.getenv("GNOSARI_SQL_MAX_CONNECTIONS_PER_URL", "20"))
+
+
+@dataclass
+class _EngineRecord:
+    """Bookkeeping for an engine owned by the registry."""
+    engine: Engine
+    url_key: str
+    connections: int
+    ref_count: int = 0
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class SQLEngineRegistry:
+    """
+    Registry that shares SQLAlchemy engines across SQL tool instances.
+
+    Engines are keyed by the normalized connection URL plus the pool options
+    used to build them. The total number of pooled connections per URL is
+    bounded by ``max_connections_per_url``; once a URL is at its limit, new
+    requests with different options reuse the URL's existing engine instead of
+    opening another pool.
+    """
+
+    def __init__(self, max_connections_per_url: int = DEFAULT_MAX_CONNECTIONS_PER_URL):
+        """
+        Initialize the registry.
+
+        Args:
+            max_connections_per_url: Default connection limit for every URL
+        """
+        self.max_connections_per_url = max_connections_per_url
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._engines: Dict[Tuple[str, Tuple], _EngineRecord] = {}
+        self._url_limits: Dict[str, int] = {}
+
+    @staticmethod
+    def normalize_url(database_url: str) -> str:
+        """
+        Normalize a connection URL so equivalent URLs share an engine.
+
+        Driver name and host are lower-cased and query parameters sorted.
+
+        Args:
+            database_url: SQLAlchemy database URL
+
+        Returns:
+            Normalized URL string (credentials included)
+        """
+        url = make_url(database_url)
+        url = url.set(
+            drivername=url.drivername.lower(),
+            host=url.host.lower() if url.host else url.host,
+            query=dict(sorted(url.query.items()))
+        )
+        return url.render_as_string(hide_password=False)
+
+    @staticmethod
+    def _safe_url(url_key: str) -> str:
+        """Render a URL key with the password hidden, for logging."""
+        return make_url(url_key).render_as_string(hide_password=True)
+
+    def set_url_limit(self, database_url: str, max_connections: int) -> None:
+        """
+        Override the connection limit for a single URL.
+
+        Args:
+            database_url: SQLAlchemy database URL
+            max_connections: Maximum pooled connections for this URL
+        """
+        with self._lock:
+            self._url_limits[self.normalize_url(database_url)] = max_connections
+
+    def _get_url_limit(self, url_key: str) -> int:
+        return self._url_limits.get(url_key, self.max_connections_per_url)
+
+    def _connections_in_use(self, url_key: str) -> int:
+        return sum(record.connections for record in self._engines.values() if record.url_key == url_key)
+
+    def acquire(self,
+                database_url: str,
+                pool_size: int = 5,
+                max_overflow: int = 10,
+                pool_timeout: int = 30,
+                pool_recycle: int = 3600,
+                echo: bool = False,
+                connect_args: Optional[Dict[str, Any]] = None) -> Tuple[Engine, Tuple]:
+        """
+        Get a shared engine for the given URL and pool options.
+
+        Args:
+            database_url: SQLAlchemy database URL
+            pool_size: Number of connections to maintain in the pool
+            max_overflow: Maximum overflow connections beyond pool_size
+            pool_timeout: Timeout for getting connection from pool
+            pool_recycle: Time in seconds before connection is recycled
+            echo: Whether to echo SQL statements
+            connect_args: Driver-specific connection arguments
+
+        Returns:
+            Tuple of (engine, registry key). Pass the key to ``release``.
+        """
+        url_key = self.normalize_url(database_url)
+        is_sqlite = url_key.startswith("sqlite")
+        connect_args = connect_args or {}
+
+        with self._lock:
+            limit = self._get_url_limit(url_key)
+
+            if is_sqlite:
+                # SQLite doesn't support connection pooling
+                options = {'echo': echo}
+                requested = 0
+            else:
+                # Clamp the pool so one engine can never exceed the URL limit
+                pool_size = max(1, min(pool_size, limit))
+                max_overflow = max(0, min(max_overflow, limit - pool_size))
+                options = {
+                    'pool_size': pool_size,
+                    'max_overflow': max_overflow,
+                    'pool_timeout': pool_timeout,
+                    'pool_recycle': pool_recycle,
+                    'echo': echo
+                }
+                requested = pool_size + max_overflow
+
+            key = (url_key, tuple(sorted({**options, **{f"connect_args.{k}": v for k, v in connect_args.items()}}.items())))
+
+            record = self._engines.get(key)
+            if record is None and requested and self._connections_in_use(url_key) + requested > limit:
+                # URL is at its connection limit - share the largest existing pool instead
+                existing = [(k, r) for k, r in self._engines.items() if r.url_key == url_key]
+                if existing:
+                    key, record = max(existing, key=lambda item: item[1].connections)
+                    self.logger.warning(
+                        f"SQL connection limit ({limit}) reached for {self._safe_url(url_key)}; "
+                        f"reusing existing engine instead of creating a new pool"
+                    )
+
+            if record is None:
+                engine_kwargs: Dict[str, Any] = {
+                    'poolclass': NullPool if is_sqlite else QueuePool,
+                    **options
+                }
+                if connect_args:
+                    engine_kwargs['connect_args'] = connect_args
+
+                engine = create_engine(database_url, **engine_kwargs)
+                record = _EngineRecord(engine=engine, url_key=url_key, connections=requested, options=options)
+                self._engines[key] = record
+                self.logger.debug(f"Created shared SQL engine for {self._safe_url(url_key)} ({options})")
+
+            record.ref_count += 1
+            return record.engine, key
+
+    def release(self, key: Tuple) -> None:
+        """
+        Release a reference obtained from ``acquire``.
+
+        The engine is disposed once no tool references it anymore.
+
+        Args:
+            key: Registry key returned by ``acquire``
+        """
+        with self._lock:
+            record = self._engines.get(key)
+            if record is None:
+                return
+            record.ref_count -= 1
+            if record.ref_count <= 0:
+                del self._engines[key]
+                record.engine.dispose()
+                self.logger.debug(f"Disposed shared SQL engine for {self._safe_url(record.url_key)}")
+
+    def dispose_all(self) -> None:
+        """Dispose every engine held by the registry."""
+        with self._lock:
+            records = list(self._engines.values())
+            self._engines.clear()
+
+        for record in records:
+            try:
+                record.engine.dispose()
+            except Exception as e:
+                self.logger.error(f"Error disposing SQL engine for {self._safe_url(record.url_key)}: {e}")
+
+        if records:
+            self.logger.info(f"🔒 Disposed {len(records)} shared SQL engines")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with engine and connection counts per URL
+        """
+        with self._lock:
+            by_url: Dict[str, Dict[str, int]] = {}
+            for record in self._engines.values():
+                stats = by_url.setdefault(self._safe_url(record.url_key), {'engines': 0, 'connections': 0, 'references': 0})
+                stats['engines'] += 1
+                stats['connections'] += record.connections
+                stats['references'] += record.ref_count
+            return {
+                'total_engines': len(self._engines),
+                'max_connections_per_url': self.max_connections_per_url,
+                'by_url': by_url
+            }
+
+
+# Global engine registry instance
+sql_engine_registry = SQLEngineRegistry()
+
+
+def dispose_all_sql_engines() -> None:
+    """Dispose all shared SQL engines (called automatically at interpreter exit)."""
+    sql_engine_registry.dispose_all()
+
+
+atexit.register(dispose_all_sql_engines)
@@ -0,0 +1,187 @@
+"""
+Compact result encodings for SQL tool output.
+
+A list of row dicts pretty-printed as JSON repeats every column name on every
+row and adds heavy whitespace. The encoders here emit the same information
+as columnar JSON, CSV/TSV or a markdown table, and can trim a result to a
+token budget at row boundaries.
+"""
+
+import csv
+import io
+import json
+import logging
+from typing import Any, Callable, List, Optional, Sequence
+
+
+COMPACT_FORMATS = ('columnar', 'csv', 'tsv', 'markdown')
+
+logger = logging.getLogger(__name__)
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    """Load the tiktoken encoding once; None if tiktoken is unavailable."""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+            try:
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except ValueError:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # tiktoken missing or its BPE files can't be fetched - fall back to an estimate
+            logger.debug(f"tiktoken unavailable, estimating token counts: {e}")
+            _encoding = None
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text.
+
+    Uses tiktoken when available, otherwise estimates four characters per token.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Number of tokens
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def to_cell(value: Any) -> Any:
+    """Convert a database value into a JSON-serializable cell."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, 'isoformat'):  # datetime objects
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def _text_cell(value: Any) -> str:
+    cell = to_cell(value)
+    return "" if cell is None else str(cell)
+
+
+def format_columnar_json(columns: Sequence[str], rows: Sequence[Sequence[Any]], metadata: dict) -> str:
+    """Encode rows as compact JSON with column names listed once."""
+    return json.dumps({
+        **metadata,
+        "columns": list(columns),
+        "rows": [[to_cell(value) for value in row] for row in rows]
+    }, separators=(',', ':'), default=str)
+
+
+def format_delimited(columns: Sequence[str], rows: Sequence[Sequence[Any]], delimiter: str = ',') -> str:
+    """Encode rows as CSV (or TSV with ``delimiter='\\t'``) with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator='\n')
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_text_cell(value) for value in row])
+    return buffer.getvalue().rstrip('\n')
+
+
+def format_markdown(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    """Encode rows as a GitHub-flavoured markdown table."""
+    def escape(text: str) -> str:
+        return text.replace('|', '\\|').replace('\n', ' ')
+
+    lines = [
+        "| " + " | ".join(escape(str(column)) for column in columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|"
+    ]
+    for row in rows:
+        lines.append("| " + " | ".join(escape(_text_cell(value)) for value in row) + " |")
+    return "\n".join(lines)
+
+
+def fit_to_token_budget(render: Callable[[int], str], total_rows: int, max_tokens: Optional[int]) -> str:
+    """
+    Render as many rows as fit in a token budget.
+
+    ``render(n)`` must return the output for the first ``n`` rows (including
+    any truncation note when ``n < total_rows``). Rows are never cut in half;
+    at least the header (``n == 0``) is always returned.
+
+    Args:
+        render: Callback rendering the first n rows
+        total_rows: Number of rows available
+        max_tokens: Token budget, or None for no limit
+
+    Returns:
+        Rendered output within the budget where possible
+    """
+    full = render(total_rows)
+    if not max_tokens or count_tokens(full) <= max_tokens:
+        return full
+
+    # Binary search for the largest row count that fits
+    low, high = 0, total_rows - 1
+    best = render(0)
+    while low <= high:
+        middle = (low + high) // 2
+        candidate = render(middle)
+        if count_tokens(candidate) <= max_tokens:
+            best = candidate
+            low = middle + 1
+        else:
+            high = middle - 1
+    return best
+
+
+def format_rows(columns: Sequence[str],
+                rows: Sequence[Sequence[Any]],
+                return_format: str,
+                metadata: Optional[dict] = None,
+                max_tokens: Optional[int] = None) -> str:
+    """
+    Encode a result set in one of the compact formats.
+
+    Args:
+        columns: Column names
+        rows: Result rows
+        return_format: One of ``columnar``, ``csv``, ``tsv`` or ``markdown``
+        metadata: Extra top-level fields for columnar JSON
+        max_tokens: Optional token budget; rows beyond it are dropped
+
+    Returns:
+        Encoded result
+    """
+    metadata = metadata or {}
+    total = len(rows)
+
+    def render(count: int) -> str:
+        subset: List[Sequence[Any]] = list(rows[:count])
+        truncated = count < total
+        if return_format == 'columnar':
+            extra = {"row_count": count}
+            if truncated:
+                extra.update({"truncated": True, "total_rows": total})
+            return format_columnar_json(columns, subset, {**metadata, **extra})
+
+        if return_format == 'csv':
+            body = format_delimited(columns, subset, ',')
+        elif return_format == 'tsv':
+            body = format_delimited(columns, subset, '\t')
+        elif return_format == 'markdown':
+            body = format_markdown(columns, subset)
+        else:
+            raise ValueError(f"Unsupported compact format: {return_format}")
+
+        if truncated:
+            body += f"\n(truncated: showing {count} of {total} rows)"
+        return body
+
+    return fit_to_token_budget(render, total, max_tokens)
@@ -0,0 +1,183 @@
+"""
+Result cache for read-only SQL statements.
+
+Agents frequently re-issue identical read-only queries across turns and
+delegations. The cache stores the formatted tool output keyed by connection
+and normalized SQL, expires entries after a TTL, evicts least recently used
+entries once a memory budget is exceeded and drops every entry of a
+connection as soon as a write statement runs against it.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from .classifier import normalize_sql as _normalize_sql
+
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_BYTES = int(os.getenv("GNOSARI_SQL_RESULT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))  # 16 MB
+
+
+@dataclass
+class _CachedResult:
+    """A cached tool result with its expiry and accounted size."""
+    value: str
+    expires_at: float
+    size: int
+
+
+class SQLResultCache:
+    """
+    In-memory LRU cache for read-only SQL query results.
+
+    Entries are grouped by connection key so that a write on a connection
+    invalidates all of that connection's cached reads.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the result cache.
+
+        Args:
+            max_bytes: Memory budget for cached results across all connections
+        """
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], _CachedResult]" = OrderedDict()
+        self._by_connection: Dict[str, Set[Tuple[str, Hashable]]] = {}
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def normalize_sql(query: str, dialect: str = 'generic') -> str:
+        """
+        Normalize SQL text for use in a cache key.
+
+        Drops comments and collapses whitespace between tokens. String
+        literals are left untouched, so queries differing only in literal
+        content never share an entry.
+
+        Args:
+            query: SQL statement
+            dialect: ``mysql`` or ``generic`` lexing rules
+
+        Returns:
+            Normalized SQL string
+        """
+        return _normalize_sql(query, dialect)
+
+    def _remove(self, key: Tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry.size
+        keys = self._by_connection.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_connection[key[0]]
+
+    def get(self, connection_key: str, query_key: Hashable) -> Optional[str]:
+        """
+        Look up a cached result.
+
+        Args:
+            connection_key: Identifier of the database connection
+            query_key: Normalized SQL plus any options that affect the output
+
+        Returns:
+            Cached result string, or None on a miss or expired entry
+        """
+        key = (connection_key, query_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, connection_key: str, query_key: Hashable, value: str, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+        """
+        Store a result.
+
+        Results larger than the whole memory budget are not cached.
+
+        Args:
+            connection_key: Identifier of the database connection
+            query_key: Normalized SQL plus any options that affect the output
+            value: Formatted tool result
+            ttl: Time to live in seconds
+        """
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes or ttl <= 0:
+            return
+
+        key = (connection_key, query_key)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _CachedResult(value=value, expires_at=time.monotonic() + ttl, size=size)
+            self._by_connection.setdefault(connection_key, set()).add(key)
+            self._total_bytes += size
+
+            # Evict least recently used entries until we're within budget
+            while self._total_bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_connection(self, connection_key: str) -> int:
+        """
+        Drop every cached result for a connection.
+
+        Args:
+            connection_key: Identifier of the database connection
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = list(self._by_connection.get(connection_key, ()))
+            for key in keys:
+                self._remove(key)
+        if keys:
+            self.logger.debug(f"Invalidated {len(keys)} cached SQL results after write")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._by_connection.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, memory usage and hit/miss counters
+        """
+        with self._lock:
+            return {
+                'total_entries': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'connections': len(self._by_connection),
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+
+# Global result cache instance shared by all SQL tools
+sql_result_cache = SQLResultCache()
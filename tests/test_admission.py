@@ -0,0 +1,125 @@
+"""
+Tests for concurrency limits and admission control.
+"""
+
+import asyncio
+import contextvars
+
+import httpx
+import pytest
+from gnosari.core.admission import AdmissionController, ConcurrencyLimit
+from gnosari.core.exceptions import AdmissionRejectedError
+from gnosari.providers.transport import ProviderTransport
+
+
+class TestConcurrencyLimit:
+    """Test slots and the bounded admission queue."""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_immediately(self):
+        """Test that a caller finding the queue full is rejected without waiting."""
+        limit = ConcurrencyLimit("test", max_concurrent=1, max_queue=1, queue_timeout=5)
+        await limit.acquire()
+        waiter = asyncio.create_task(limit.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await limit.acquire()
+        assert excinfo.value.limit_name == "test"
+
+        limit.release()
+        await waiter
+        limit.release()
+        stats = limit.get_stats()
+        assert stats["admitted"] == 2
+        assert stats["rejected"] == 1
+        assert stats["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Test that a queued caller is rejected after the queue timeout."""
+        limit = ConcurrencyLimit("test", max_concurrent=1, max_queue=10, queue_timeout=0.02)
+        await limit.acquire()
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await limit.acquire()
+
+        assert limit.get_stats()["timed_out"] == 1
+        assert "after 0.02s" in str(excinfo.value)
+        assert limit.get_stats()["waiting"] == 0
+
+
+class TestAdmissionController:
+    """Test run admission and provider request limits."""
+
+    @pytest.mark.asyncio
+    async def test_slots_bound_concurrency(self):
+        """Test that no more runs than allowed execute at once."""
+        controller = AdmissionController()
+        running = 0
+        peak = 0
+
+        async def run():
+            nonlocal running, peak
+            async with controller.admit_run("Team", "Agent", {"concurrency": {"max_runs": 2}}):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(run() for _ in range(6)))
+
+        assert peak == 2
+        assert controller.get_stats()["team:Team"]["admitted"] == 6
+
+    @pytest.mark.asyncio
+    async def test_nested_run_does_not_take_second_team_slot(self):
+        """Test that a delegation inside an admitted run is not queued behind its own parent."""
+        controller = AdmissionController()
+        settings = {"concurrency": {"max_runs": 1, "queue_timeout": 0.05}}
+
+        async def delegate():
+            async with controller.admit_run("Team", "Writer", settings):
+                return "done"
+
+        async with controller.admit_run("Team", "Lead", settings):
+            # Tools run in tasks spawned by the parent run
+            result = await asyncio.create_task(delegate())
+            # Unrelated runs still wait for the parent's slot
+            with pytest.raises(AdmissionRejectedError):
+                await asyncio.get_running_loop().create_task(
+                    delegate(), context=contextvars.Context()
+                )
+
+        assert result == "done"
+        assert controller.get_stats()["team:Team"]["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unlimited_by_default(self):
+        """Test that no limit is created when concurrency is not configured."""
+        controller = AdmissionController()
+        controller.max_team_runs = 0
+        controller.max_agent_runs = 0
+
+        async with controller.admit_run("Team", "Agent"):
+            pass
+
+        assert controller.get_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_provider_slot_held_until_stream_closed(self, monkeypatch):
+        """Test that a provider request keeps its slot until the response is closed."""
+        controller = AdmissionController()
+        controller.max_provider_requests = 1
+        monkeypatch.setattr("gnosari.providers.transport.admission_controller", controller)
+
+        def respond(request):
+            return httpx.Response(200, content=b"data: chunk\n\n")
+
+        client = httpx.AsyncClient(transport=ProviderTransport("test", httpx.MockTransport(respond)))
+        async with client.stream("POST", "https://api.example.com/v1/chat") as response:
+            assert controller.get_stats()["provider:api.example.com"]["active"] == 1
+            await response.aread()
+        await client.aclose()
+
+        assert controller.get_stats()["provider:api.example.com"]["active"] == 0
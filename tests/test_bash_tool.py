@@ -0,0 +1,99 @@
+"""
+Tests for the bash tool execution modes.
+"""
+
+import json
+import time
+
+import pytest
+from gnosari.tools.builtin.bash import BashTool
+
+
+async def run(tool, **args):
+    return await tool._run_bash(None, json.dumps(args))
+
+
+@pytest.fixture
+def tool(tmp_path):
+    return BashTool(base_directory=str(tmp_path))
+
+
+class TestParallelMode:
+    """Test concurrent execution of independent commands."""
+
+    @pytest.mark.asyncio
+    async def test_commands_run_concurrently(self, tool):
+        """Test that parallel commands overlap and results keep command order."""
+        started = time.monotonic()
+        output = await run(tool, commands=[f"sleep 0.3; echo {i}" for i in range(1, 4)], execution_mode="parallel")
+
+        assert time.monotonic() - started < 0.8
+        assert "Executed 3 of 3 commands" in output
+        assert output.index("STDOUT:\n1") < output.index("STDOUT:\n2") < output.index("STDOUT:\n3")
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_skips_pending_commands(self, tool):
+        """Test that commands not yet started are skipped after a failure."""
+        output = await run(tool, commands=["false", "echo skipped"], execution_mode="parallel", max_parallel=1)
+
+        assert "Executed 1 of 2 commands" in output
+        assert "skipped" not in output
+
+
+class TestShellMode:
+    """Test dependent commands in one persistent shell."""
+
+    @pytest.mark.asyncio
+    async def test_state_carries_over(self, tool, tmp_path, monkeypatch):
+        """Test that cd and export persist, and variables are expanded by the shell."""
+        monkeypatch.setenv("GNOSARI_TEST_VAR", "parent")
+        (tmp_path / "sub").mkdir()
+
+        output = await run(tool, commands=[
+            "cd sub", "export GNOSARI_TEST_VAR=child", "echo $GNOSARI_TEST_VAR $PWD"
+        ], execution_mode="shell")
+
+        assert "Executed 3 of 3 commands" in output
+        assert f"STDOUT:\nchild {tmp_path / 'sub'}" in output
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_exits_shell(self, tool):
+        """Test that the shell stops at the first failing command."""
+        output = await run(tool, commands=["echo first", "false", "echo never"], execution_mode="shell")
+
+        assert "Executed 2 of 3 commands" in output
+        assert "Exit code: 1" in output
+        assert "never" not in output
+
+    @pytest.mark.asyncio
+    async def test_continue_after_error(self, tool):
+        """Test that all commands run when stop_on_error is disabled."""
+        output = await run(tool, commands=["false", "echo after"], execution_mode="shell", stop_on_error=False)
+
+        assert "Executed 2 of 2 commands" in output
+        assert "STDOUT:\nafter" in output
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_completed_output(self, tool):
+        """Test that a timed out command is reported and earlier output is kept."""
+        started = time.monotonic()
+        output = await run(tool, commands=["echo done", "sleep 10"], execution_mode="shell", timeout=1)
+
+        assert time.monotonic() - started < 5
+        assert "STDOUT:\ndone" in output
+        assert "Exit code: -1" in output
+        assert "timed out after 2 seconds" in output
+
+
+class TestSequentialMode:
+    """Test commands run one after another."""
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, tool):
+        """Test that a command exceeding the timeout is killed with its children."""
+        started = time.monotonic()
+        output = await run(tool, command="sleep 10; echo late", timeout=1)
+
+        assert time.monotonic() - started < 5
+        assert "Exit code: -1" in output
+        assert "timed out after 1 seconds" in output
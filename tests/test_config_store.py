@@ -0,0 +1,196 @@
+"""
+Tests for the content-addressed team configuration store.
+"""
+
+import importlib
+import threading
+from types import SimpleNamespace
+
+import pytest
+from gnosari.queue.services.config_store import ConfigStore
+from gnosari.tools.builtin.delegation import DelegateAgentTool
+from gnosari.tools.interfaces import AsyncTool
+
+# The package re-exports the store instance under the module's name
+config_store_module = importlib.import_module("gnosari.queue.services.config_store")
+
+TEAM_CONFIG = {"name": "Support Team", "agents": [{"name": "Lead", "instructions": "Help", "orchestrator": True}]}
+
+
+class FakeRedis:
+    """Redis client stand-in recording calls and the threads they run on."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.sets = 0
+        self.threads = []
+        self.fail = fail
+
+    def set(self, key, value, ex=None):
+        self.threads.append(threading.current_thread())
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.sets += 1
+        self.data[key] = value.encode("utf-8")
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+
+class RecordingBackend:
+    """Queue backend stand-in recording submitted messages."""
+
+    name = "recording"
+    supports_batching = False
+
+    def __init__(self):
+        self.messages = []
+
+    def submit(self, task_name, message, **options):
+        self.messages.append(message)
+        return message.message_id
+
+
+def make_store(redis):
+    store = ConfigStore(backend="redis", redis_url="redis://unused", ttl=60)
+    store._redis = redis
+    return store
+
+
+class TestConfigStore:
+    """Test publishing and resolving configurations by hash."""
+
+    def test_worker_resolves_published_config(self):
+        """Test that another process resolves a configuration published once."""
+        redis = FakeRedis()
+        producer = make_store(redis)
+
+        config_hash = producer.publish(TEAM_CONFIG)
+        assert producer.publish(TEAM_CONFIG) == config_hash
+
+        assert redis.sets == 1
+        assert config_hash == producer.compute_hash(TEAM_CONFIG)
+        assert make_store(redis).get(config_hash) == TEAM_CONFIG
+
+    def test_tampered_config_fails_hash_check(self):
+        """Test that a stored payload not matching its hash is rejected."""
+        redis = FakeRedis()
+        config_hash = make_store(redis).publish(TEAM_CONFIG)
+        redis.data[ConfigStore.KEY_PREFIX + config_hash] = b'{"name": "Other Team"}'
+
+        assert make_store(redis).get(config_hash) is None
+
+    def test_unknown_hash(self):
+        """Test that an unknown hash resolves to None."""
+        assert make_store(FakeRedis()).get("0" * 64) is None
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_redis_off_the_event_loop(self):
+        """Test that the async variants do their Redis calls in worker threads."""
+        redis = FakeRedis()
+
+        config_hash = await make_store(redis).publish_async(TEAM_CONFIG)
+        config = await make_store(redis).get_async(config_hash)
+
+        assert config == TEAM_CONFIG
+        assert len(redis.threads) == 2
+        assert threading.main_thread() not in redis.threads
+
+    @pytest.mark.asyncio
+    async def test_cached_config_needs_no_redis(self):
+        """Test that configurations cached in process are resolved without Redis."""
+        redis = FakeRedis()
+        store = make_store(redis)
+        config_hash = await store.publish_async(TEAM_CONFIG)
+        redis.threads.clear()
+
+        assert await store.get_async(config_hash) == TEAM_CONFIG
+        assert redis.threads == []
+
+
+class TestConfigEmbeddingFallback:
+    """Test that messages embed the configuration when the store is unavailable."""
+
+    def make_context(self):
+        context = SimpleNamespace(original_config=TEAM_CONFIG, session_context={"account_id": 1}, session_id="s1")
+        return SimpleNamespace(context=context, agent_id="Lead")
+
+    def test_message_carries_hash(self, monkeypatch):
+        """Test that a published configuration is referenced by hash only."""
+        store = make_store(FakeRedis())
+        monkeypatch.setattr(config_store_module, "config_store", store)
+
+        context = AsyncTool.serialize_context(self.make_context())["context_wrapper"]["context"]
+
+        assert context["config_hash"] == store.compute_hash(TEAM_CONFIG)
+        assert "original_config" not in context
+
+    def test_unavailable_store_embeds_config(self, monkeypatch):
+        """Test that the configuration is embedded when Redis cannot be reached."""
+        monkeypatch.setattr(config_store_module, "config_store", make_store(FakeRedis(fail=True)))
+
+        context = AsyncTool.serialize_context(self.make_context())["context_wrapper"]["context"]
+
+        assert context["original_config"] == TEAM_CONFIG
+        assert "config_hash" not in context
+
+
+class TestAsyncSendPath:
+    """Test that queued tool messages publish the configuration off the event loop."""
+
+    def make_context(self):
+        context = SimpleNamespace(original_config=TEAM_CONFIG, session_context={}, session_id="s1")
+        return SimpleNamespace(context=context, agent_id="Lead")
+
+    @pytest.fixture
+    def backend(self, monkeypatch):
+        backend = RecordingBackend()
+        monkeypatch.setattr("gnosari.queue.consumers.tool_execution.get_queue_backend", lambda: backend)
+        return backend
+
+    @pytest.mark.asyncio
+    async def test_send_publishes_in_worker_thread(self, monkeypatch, backend):
+        """Test that the async send path uploads the configuration off the event loop."""
+        redis = FakeRedis()
+        store = make_store(redis)
+        monkeypatch.setattr(config_store_module, "config_store", store)
+
+        await DelegateAgentTool().send_async_message_async(
+            task_id="task-1", tool_module="m", tool_class="C", tool_args="{}", context=self.make_context()
+        )
+
+        message, = backend.messages
+        assert message.context_data["context_wrapper"]["context"]["config_hash"] == store.compute_hash(TEAM_CONFIG)
+        assert redis.threads and threading.main_thread() not in redis.threads
+
+    @pytest.mark.asyncio
+    async def test_unavailable_store_is_tried_once_off_the_loop(self, monkeypatch, backend):
+        """Test that a failed upload embeds the configuration without retrying on the event loop."""
+        redis = FakeRedis(fail=True)
+        monkeypatch.setattr(config_store_module, "config_store", make_store(redis))
+
+        await DelegateAgentTool().send_async_message_async(
+            task_id="task-1", tool_module="m", tool_class="C", tool_args="{}", context=self.make_context()
+        )
+
+        message, = backend.messages
+        assert message.context_data["context_wrapper"]["context"]["original_config"] == TEAM_CONFIG
+        assert len(redis.threads) == 1
+        assert threading.main_thread() not in redis.threads
+
+    @pytest.mark.asyncio
+    async def test_async_delegation_uses_async_send_path(self, monkeypatch, backend):
+        """Test that queued delegations do not touch Redis on the event loop."""
+        redis = FakeRedis()
+        monkeypatch.setattr(config_store_module, "config_store", make_store(redis))
+
+        output = await DelegateAgentTool()._run_delegate_agent_async(
+            self.make_context(), '{"target_agent": "Worker", "message": "hi"}'
+        )
+
+        assert "queued for async execution" in output
+        assert len(backend.messages) == 1
+        assert redis.threads and threading.main_thread() not in redis.threads
@@ -0,0 +1,66 @@
+"""
+Tests for token delta coalescing.
+"""
+
+import asyncio
+
+import pytest
+from gnosari.engine.runners.delta_coalescer import coalesce_deltas
+from gnosari.engine.stream_events import ResponseEvent
+
+
+async def produce(events, pause=0.0):
+    for event in events:
+        if pause:
+            await asyncio.sleep(pause)
+        yield event
+
+
+async def collect(stream):
+    return [event async for event in stream]
+
+
+def delta(content, agent_name="Writer"):
+    return ResponseEvent(content, agent_name, delta=True)
+
+
+class TestDeltaCoalescing:
+    """Test flushing of merged deltas by size, time and event boundaries."""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_deltas_are_merged(self):
+        """Test that deltas arriving together become one chunk."""
+        events = await collect(coalesce_deltas(produce([delta("Hel"), delta("lo")]), max_delay=1))
+
+        assert events == [{"type": "response", "id": "response_Writer", "content": "Hello", "agent_name": "Writer"}]
+
+    @pytest.mark.asyncio
+    async def test_chunk_is_flushed_at_max_chars(self):
+        """Test that a chunk is emitted once it reaches the size limit."""
+        source = produce([delta("ab"), delta("cd"), delta("e")])
+
+        events = await collect(coalesce_deltas(source, max_delay=1, max_chars=4))
+
+        assert [event["content"] for event in events] == ["abcd", "e"]
+
+    @pytest.mark.asyncio
+    async def test_chunk_is_flushed_after_max_delay(self):
+        """Test that pending text is emitted when the source goes quiet."""
+        source = produce([delta("a"), delta("b")], pause=0.05)
+
+        events = await collect(coalesce_deltas(source, max_delay=0.01))
+
+        assert [event["content"] for event in events] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_other_events_and_agents_split_chunks(self):
+        """Test that order is kept across tool calls and agent changes."""
+        tool_result = {"type": "tool_result", "content": "42"}
+        source = produce([delta("a"), delta("b"), tool_result, delta("c"), delta("d", "Reviewer")])
+
+        events = await collect(coalesce_deltas(source, max_delay=1))
+
+        assert [(event["type"], event["content"]) for event in events] == [
+            ("response", "ab"), ("tool_result", "42"), ("response", "c"), ("response", "d")
+        ]
+        assert events[-1]["agent_name"] == "Reviewer"
@@ -0,0 +1,353 @@
+"""
+Tests for knowledge base ingestion against a fake Embedchain app.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import time
+
+import pytest
+from gnosari.core.cache import CacheConfig, CacheManager, ConfigHasher
+from gnosari.core.exceptions import KnowledgeError
+from gnosari.engine.knowledge.knowledge_loader import KnowledgeLoader
+from gnosari.knowledge import EmbedchainKnowledgeBase, KnowledgeManager
+
+
+class FakeDB:
+    """Vector store stand-in holding chunk metadata by id."""
+
+    def __init__(self):
+        self.chunks = {}
+
+    def get(self, where):
+        (field, value), = where.items()
+        ids = [chunk_id for chunk_id, meta in self.chunks.items() if meta.get(field) == value]
+        return {"ids": ids, "metadatas": [self.chunks[chunk_id] for chunk_id in ids]}
+
+    def delete(self, where):
+        for chunk_id in self.get(where)["ids"]:
+            del self.chunks[chunk_id]
+
+
+class FakeApp:
+    """Embedchain app stand-in recording writes and their concurrency."""
+
+    def __init__(self, add_delay=0.0, chunk_size=1000, db=None):
+        self.db = db or FakeDB()
+        self.add_delay = add_delay
+        self.chunk_size = chunk_size
+        self.added = []
+        self.deleted = []
+        self.active_writes = 0
+        self.peak_writes = 0
+        self._lock = threading.Lock()
+
+    def add(self, source):
+        with self._lock:
+            self.active_writes += 1
+            self.peak_writes = max(self.peak_writes, self.active_writes)
+        time.sleep(self.add_delay)
+        source_hash = hashlib.md5(source.encode()).hexdigest()
+        self.db.chunks[f"{source_hash}-{self.chunk_size}-0"] = {"url": source, "hash": source_hash, "chunk_size": self.chunk_size}
+        self.added.append(source)
+        with self._lock:
+            self.active_writes -= 1
+        return source_hash
+
+    def delete(self, source_hash):
+        self.deleted.append(source_hash)
+        self.db.delete(where={"hash": source_hash})
+
+
+def make_knowledge_base(tmp_path, app, knowledge_id="docs", config=None):
+    cache = CacheManager(CacheConfig(
+        cache_dir=str(tmp_path / "cache"), cache_name="knowledge_cache", hash_strategy=ConfigHasher()
+    ))
+    kb = EmbedchainKnowledgeBase(knowledge_id, dict(config or {}, id=knowledge_id), knowledge_id, cache)
+    kb.embedchain_app = app
+    kb._initialized = True
+    return kb
+
+
+class TestKnowledgeLoaderIngestion:
+    """Test that the items of one knowledge base are ingested one at a time."""
+
+    @pytest.mark.asyncio
+    async def test_items_of_one_base_are_added_sequentially(self, tmp_path):
+        """Test that one app never sees concurrent adds while separate bases load concurrently."""
+        apps = {name: FakeApp(add_delay=0.05) for name in ("docs", "faq")}
+        manager = KnowledgeManager(cache_dir=str(tmp_path / "cache"))
+        for name, app in apps.items():
+            manager.knowledge_bases[name] = make_knowledge_base(tmp_path / name, app, name)
+        loader = KnowledgeLoader(progress_callback=lambda message: None, max_concurrency=4)
+        loader.knowledge_manager = manager
+
+        started = time.monotonic()
+        await loader.load_knowledge_bases([
+            {"name": name, "id": name, "type": "text", "data": [f"{name} one", f"{name} two", f"{name} three"]}
+            for name in apps
+        ])
+        elapsed = time.monotonic() - started
+
+        for name, app in apps.items():
+            assert app.added == [f"{name} one", f"{name} two", f"{name} three"]
+            assert app.peak_writes == 1
+        # Both bases ingested at once: three sequential adds each, not six
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_failed_item_does_not_stop_the_base(self, tmp_path):
+        """Test that the remaining items are still added after one fails."""
+        app = FakeApp()
+        original_add = app.add
+
+        def add(source):
+            if source == "broken":
+                raise RuntimeError("unreachable")
+            return original_add(source)
+
+        app.add = add
+        manager = KnowledgeManager(cache_dir=str(tmp_path / "cache"))
+        manager.knowledge_bases["docs"] = make_knowledge_base(tmp_path, app)
+        loader = KnowledgeLoader(progress_callback=lambda message: None)
+        loader.knowledge_manager = manager
+
+        with pytest.raises(Exception, match="unreachable"):
+            await loader._add_data_to_knowledge_base("docs", ["first", "broken", "last"])
+
+        assert app.added == ["first", "last"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_to_one_base_are_serialized(self, tmp_path):
+        """Test that direct concurrent add_data calls on one knowledge base do not overlap."""
+        app = FakeApp(add_delay=0.02)
+        kb = make_knowledge_base(tmp_path, app)
+
+        await asyncio.gather(*(kb.add_data(f"item {i}", f"item {i}") for i in range(4)))
+
+        assert sorted(app.added) == [f"item {i}" for i in range(4)]
+        assert app.peak_writes == 1
+        assert sorted(kb._get_cache_entry().metadata["sources"]) == [f"item {i}" for i in range(4)]
+
+
+def write_file(path, content, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def source_hash(source):
+    return hashlib.md5(source.encode()).hexdigest()
+
+
+class TestIncrementalIngestion:
+    """Test that only new or changed sources are embedded."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sources_are_skipped(self, tmp_path):
+        """Test that loading the same data again embeds nothing, also after a restart."""
+        docs = tmp_path / "docs"
+        files = [write_file(docs / name, name) for name in ("a.md", "b.md", "notes.txt")]
+        write_file(docs / "image.png", "binary")
+        app = FakeApp()
+        kb = make_knowledge_base(tmp_path, app, config={"type": "directory"})
+
+        await kb.add_data(str(docs), str(docs))
+        await kb.add_data(str(docs), str(docs))
+
+        assert app.added == files
+
+        restarted_app = FakeApp()
+        restarted = make_knowledge_base(tmp_path, restarted_app, config={"type": "directory"})
+        await restarted.add_data(str(docs), str(docs))
+
+        assert restarted_app.added == []
+
+    @pytest.mark.asyncio
+    async def test_changed_files_are_re_added(self, tmp_path):
+        """Test that only a file whose mtime or size changed is embedded again."""
+        docs = tmp_path / "docs"
+        first = write_file(docs / "a.md", "first", mtime=1_000_000)
+        write_file(docs / "b.md", "second", mtime=1_000_000)
+        app = FakeApp()
+        kb = make_knowledge_base(tmp_path, app, config={"type": "directory"})
+        await kb.add_data(str(docs), str(docs))
+        app.added.clear()
+
+        write_file(docs / "a.md", "first, edited", mtime=2_000_000)
+        await kb.add_data(str(docs), str(docs))
+
+        assert app.added == [first]
+        assert app.deleted == []
+
+    @pytest.mark.asyncio
+    async def test_content_fingerprint_ignores_touched_files(self, tmp_path):
+        """Test that fingerprint: content re-embeds on content changes but not on a new mtime."""
+        docs = tmp_path / "docs"
+        path = write_file(docs / "a.md", "same", mtime=1_000_000)
+        app = FakeApp()
+        kb = make_knowledge_base(tmp_path, app, config={"type": "directory", "fingerprint": "content"})
+        await kb.add_data(str(docs), str(docs))
+        app.added.clear()
+
+        write_file(docs / "a.md", "same", mtime=2_000_000)
+        await kb.add_data(str(docs), str(docs))
+        assert app.added == []
+
+        write_file(docs / "a.md", "different", mtime=2_000_000)
+        await kb.add_data(str(docs), str(docs))
+        assert app.added == [path]
+
+    @pytest.mark.asyncio
+    async def test_files_removed_from_directory_are_deleted(self, tmp_path):
+        """Test that a file deleted from a directory has its vectors removed on the next load."""
+        docs = tmp_path / "docs"
+        kept = write_file(docs / "a.md", "kept")
+        removed = write_file(docs / "b.md", "removed")
+        app = FakeApp()
+        kb = make_knowledge_base(tmp_path, app, config={"type": "directory"})
+        await kb.add_data(str(docs), str(docs))
+
+        os.remove(removed)
+        await kb.add_data(str(docs), str(docs))
+
+        assert app.deleted == [source_hash(removed)]
+        assert [meta["url"] for meta in app.db.chunks.values()] == [kept]
+        assert list(kb._get_cache_entry().metadata["sources"]) == [kept]
+
+    @pytest.mark.asyncio
+    async def test_config_change_replaces_old_chunks(self, tmp_path):
+        """Test that chunks ingested under a previous chunk_size are removed when the config changes."""
+        db = FakeDB()
+        old_app = FakeApp(chunk_size=500, db=db)
+        kb = make_knowledge_base(tmp_path, old_app, config={"embedchain": {"chunker": {"chunk_size": 500}}})
+        for item in ("first", "second"):
+            await kb.add_data(item, item)
+
+        new_app = FakeApp(chunk_size=200, db=db)
+        changed = make_knowledge_base(tmp_path, new_app, config={"embedchain": {"chunker": {"chunk_size": 200}}})
+        await changed.add_data("first", "first")
+
+        assert new_app.added == ["first"]
+        assert sorted(new_app.deleted) == sorted(source_hash(item) for item in ("first", "second"))
+        assert list(db.chunks.values()) == [{"url": "first", "hash": source_hash("first"), "chunk_size": 200}]
+        assert list(changed._get_cache_entry().metadata["sources"]) == ["first"]
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_data_is_pruned(self, tmp_path):
+        """Test that prune_sources deletes what was ingested from data items no longer configured."""
+        app = FakeApp()
+        kb = make_knowledge_base(tmp_path, app)
+        for item in ("keep me", "drop me"):
+            await kb.add_data(item, item)
+
+        assert await kb.prune_sources(["keep me"]) == 1
+        assert await kb.prune_sources(["keep me"]) == 0
+
+        assert app.deleted == [source_hash("drop me")]
+        assert kb._get_cache_entry().data_sources == ["keep me"]
+
+    @pytest.mark.asyncio
+    async def test_loader_prunes_after_loading(self, tmp_path):
+        """Test that reloading with fewer items embeds nothing new and deletes the dropped item."""
+        app = FakeApp()
+        manager = KnowledgeManager(cache_dir=str(tmp_path / "cache"))
+        manager.knowledge_bases["docs"] = make_knowledge_base(tmp_path, app)
+        loader = KnowledgeLoader(progress_callback=lambda message: None)
+        loader.knowledge_manager = manager
+
+        await loader._add_data_to_knowledge_base("docs", ["one", "two"])
+        await loader._add_data_to_knowledge_base("docs", ["one"])
+
+        assert app.added == ["one", "two"]
+        assert app.deleted == [source_hash("two")]
+
+
+class TestKnowledgeDeletion:
+    """Test deleting knowledge by source, directory and hash."""
+
+    async def make_loaded_manager(self, tmp_path):
+        docs = tmp_path / "docs"
+        files = [write_file(docs / name, name) for name in ("a.md", "b.md")]
+        app = FakeApp()
+        kb = make_knowledge_base(tmp_path, app, config={"type": "directory"})
+        await kb.add_data(str(docs), str(docs))
+        await kb.add_data("inline note", "inline note")
+        manager = KnowledgeManager(cache_dir=str(tmp_path / "cache"))
+        manager.knowledge_bases["docs"] = kb
+        return manager, app, kb, docs, files
+
+    def remaining_sources(self, kb):
+        return sorted(kb._get_cache_entry().metadata["sources"])
+
+    @pytest.mark.asyncio
+    async def test_delete_by_source(self, tmp_path):
+        """Test that a single ingested file is deleted and forgotten."""
+        manager, app, kb, docs, (first, second) = await self.make_loaded_manager(tmp_path)
+
+        assert await manager.delete_data_from_knowledge_base("docs", first) is True
+
+        assert app.deleted == [source_hash(first)]
+        assert self.remaining_sources(kb) == sorted([second, "inline note"])
+        assert first not in [meta["url"] for meta in app.db.chunks.values()]
+
+    @pytest.mark.asyncio
+    async def test_delete_by_directory(self, tmp_path):
+        """Test that deleting a directory data item removes all of its files."""
+        manager, app, kb, docs, files = await self.make_loaded_manager(tmp_path)
+
+        assert await manager.delete_data_from_knowledge_base("docs", str(docs)) is True
+
+        assert sorted(app.deleted) == sorted(source_hash(path) for path in files)
+        assert self.remaining_sources(kb) == ["inline note"]
+
+    @pytest.mark.asyncio
+    async def test_delete_by_hash(self, tmp_path):
+        """Test that an Embedchain source hash identifies the source to delete."""
+        manager, app, kb, docs, files = await self.make_loaded_manager(tmp_path)
+
+        assert await manager.delete_data_from_knowledge_base("docs", source_hash("inline note")) is True
+
+        assert app.deleted == [source_hash("inline note")]
+        assert self.remaining_sources(kb) == files
+
+    @pytest.mark.asyncio
+    async def test_deleted_source_is_re_added_on_next_load(self, tmp_path):
+        """Test that a deleted source is no longer considered up to date."""
+        manager, app, kb, docs, (first, second) = await self.make_loaded_manager(tmp_path)
+        await manager.delete_data_from_knowledge_base("docs", first)
+        app.added.clear()
+
+        await kb.add_data(str(docs), str(docs))
+
+        assert app.added == [first]
+
+    @pytest.mark.asyncio
+    async def test_untracked_content_is_matched_on_chunk_metadata(self, tmp_path):
+        """Test that content ingested before sources were tracked is deleted by url or hash."""
+        app = FakeApp()
+        app.db.chunks = {
+            "legacy-0": {"url": "https://example.com/a", "hash": "legacy-a"},
+            "legacy-1": {"url": "https://example.com/b", "hash": "legacy-b"},
+        }
+        kb = make_knowledge_base(tmp_path, app)
+
+        assert await kb.delete_data("https://example.com/a") is True
+        assert await kb.delete_data("legacy-b") is True
+
+        assert app.deleted == ["legacy-a", "legacy-b"]
+        assert app.db.chunks == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_source_and_base(self, tmp_path):
+        """Test that unknown sources report False and unknown bases raise KnowledgeError."""
+        manager, app, kb, docs, files = await self.make_loaded_manager(tmp_path)
+
+        assert await manager.delete_data_from_knowledge_base("docs", "never added") is False
+        assert app.deleted == []
+        with pytest.raises(KnowledgeError, match="not found"):
+            await manager.delete_data_from_knowledge_base("missing", "anything")
@@ -0,0 +1,238 @@
+"""
+Tests for multi-base knowledge queries and the knowledge query tool.
+"""
+
+import inspect
+import json
+
+import pytest
+from gnosari.knowledge import EmbedchainKnowledgeBase, KnowledgeManager, KnowledgeResult
+from gnosari.tools.builtin.knowledge import KnowledgeQueryTool
+
+
+class FakeSearchApp:
+    """Embedchain app stand-in answering searches with chunks and vector distances."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.searches = []
+
+    def search(self, query, num_documents=3, where=None):
+        self.searches.append({"query": query, "num_documents": num_documents, "where": where})
+        chunks = [
+            {"context": content, "metadata": {"url": f"{content}.md", "score": distance, **metadata}}
+            for content, distance, *extra in self.chunks
+            for metadata in [extra[0] if extra else {}]
+        ]
+        if where:
+            chunks = [chunk for chunk in chunks if all(chunk["metadata"].get(k) == v for k, v in where.items())]
+        return chunks[:num_documents]
+
+
+class LegacySearchApp:
+    """Embedchain app stand-in whose search takes only the query."""
+
+    def __init__(self, count):
+        self.count = count
+        self.calls = 0
+
+    def search(self, query):
+        self.calls += 1
+        return [{"context": f"chunk {i}", "metadata": {"score": float(i)}} for i in range(self.count)]
+
+
+def make_manager(tmp_path, chunks_by_kb):
+    manager = KnowledgeManager(cache_dir=str(tmp_path / "cache"))
+    for name, chunks in chunks_by_kb.items():
+        kb = EmbedchainKnowledgeBase(name, {"id": name}, name)
+        kb.embedchain_app = FakeSearchApp(chunks)
+        kb._initialized = True
+        manager.knowledge_bases[name] = kb
+    return manager
+
+
+def result(content, score):
+    return KnowledgeResult(content=content, source=content, score=score, metadata={})
+
+
+class TestMergeResults:
+    """Test merging of per-base results."""
+
+    def test_merge_orders_by_absolute_score(self):
+        """Test that a base with only weak matches does not outrank strong matches elsewhere."""
+        merged = KnowledgeManager.merge_results({
+            "docs": [result("exact", 0.9), result("close", 0.8)],
+            "faq": [result("weak", 0.3), result("weaker", 0.2)],
+        })
+
+        assert [r.content for r in merged] == ["exact", "close", "weak", "weaker"]
+        assert [r.score for r in merged] == [0.9, 0.8, 0.3, 0.2]
+        assert merged[2].metadata["knowledge_base"] == "faq"
+
+    def test_merge_deduplicates_and_limits(self):
+        """Test that duplicate content is kept once, at its best score, and the limit applies."""
+        merged = KnowledgeManager.merge_results({
+            "docs": [result("shared", 0.5), result("docs only", 0.4)],
+            "faq": [result("shared", 0.7), result("faq only", 0.6)],
+        }, max_results=2)
+
+        assert [(r.content, r.metadata["knowledge_base"]) for r in merged] == [("shared", "faq"), ("faq only", "faq")]
+
+    def test_equal_scores_follow_rank(self):
+        """Test that results with equal scores keep their rank within their base."""
+        merged = KnowledgeManager.merge_results({
+            "docs": [result("docs first", 1.0), result("docs second", 1.0)],
+            "faq": [result("faq first", 1.0)],
+        })
+
+        assert [r.content for r in merged] == ["docs first", "faq first", "docs second"]
+
+
+class TestKnowledgeQueryTool:
+    """Test the knowledge query tool against fake Embedchain bases."""
+
+    @pytest.mark.asyncio
+    async def test_single_base_query(self, tmp_path):
+        """Test that one knowledge base is queried directly."""
+        manager = make_manager(tmp_path, {"docs": [("install guide", 0.5)], "faq": [("faq answer", 0.1)]})
+        tool = KnowledgeQueryTool(manager)
+
+        output = await tool._run_knowledge_query(None, json.dumps({"query": "install", "knowledge_name": "docs"}))
+
+        assert output == "install guide"
+        assert manager.knowledge_bases["faq"].embedchain_app.searches == []
+
+    @pytest.mark.asyncio
+    async def test_several_bases_are_merged(self, tmp_path):
+        """Test that knowledge_names fans the query out and merges the results by score."""
+        manager = make_manager(tmp_path, {
+            "docs": [("install guide", 0.5), ("changelog", 3.0)],
+            "faq": [("faq answer", 0.1)],
+        })
+        tool = KnowledgeQueryTool(manager)
+
+        output = await tool._run_knowledge_query(None, json.dumps({
+            "query": "install", "knowledge_name": "docs", "knowledge_names": ["faq"], "max_results": 2
+        }))
+
+        assert output == "faq answer\n\ninstall guide"
+        for kb in manager.knowledge_bases.values():
+            assert kb.embedchain_app.searches[0]["num_documents"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_base_is_reported(self, tmp_path):
+        """Test that an unknown name among knowledge_names is reported before querying."""
+        manager = make_manager(tmp_path, {"docs": [("install guide", 0.5)]})
+        tool = KnowledgeQueryTool(manager)
+
+        output = await tool._run_knowledge_query(None, json.dumps({
+            "query": "install", "knowledge_name": "docs", "knowledge_names": ["missing"]
+        }))
+
+        assert output.startswith("Error: Knowledge base 'missing' not found")
+        assert manager.knowledge_bases["docs"].embedchain_app.searches == []
+
+    @pytest.mark.asyncio
+    async def test_filters_and_min_score_reach_the_search(self, tmp_path):
+        """Test that tool filters become the where clause and weak matches are dropped."""
+        manager = make_manager(tmp_path, {"docs": [
+            ("install guide", 0.5, {"data_type": "web_page"}),
+            ("release notes", 0.1, {"data_type": "text"}),
+            ("old install guide", 3.0, {"data_type": "web_page"}),
+        ]})
+        tool = KnowledgeQueryTool(manager)
+
+        output = await tool._run_knowledge_query(None, json.dumps({
+            "query": "install", "knowledge_name": "docs", "filters": {"data_type": "web_page"}, "min_score": 0.5
+        }))
+
+        assert output == "install guide"
+        assert manager.knowledge_bases["docs"].embedchain_app.searches[0]["where"] == {"data_type": "web_page"}
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_to_every_base(self, tmp_path):
+        """Test that filters and min_score are passed to each base of a multi-base query."""
+        manager = make_manager(tmp_path, {
+            "docs": [("install guide", 0.5, {"lang": "en"}), ("guide d'installation", 0.2, {"lang": "fr"})],
+            "faq": [("faq answer", 1.0, {"lang": "en"})],
+        })
+        tool = KnowledgeQueryTool(manager)
+
+        output = await tool._run_knowledge_query(None, json.dumps({
+            "query": "install", "knowledge_name": "docs", "knowledge_names": ["faq"],
+            "filters": {"lang": "en"}, "min_score": 0.6
+        }))
+
+        assert output == "install guide"
+        for kb in manager.knowledge_bases.values():
+            assert kb.embedchain_app.searches[0]["where"] == {"lang": "en"}
+
+    @pytest.mark.asyncio
+    async def test_min_score_is_validated(self, tmp_path):
+        """Test that scores outside 0-1 are rejected before querying."""
+        manager = make_manager(tmp_path, {"docs": [("install guide", 0.5)]})
+        tool = KnowledgeQueryTool(manager)
+
+        output = await tool._run_knowledge_query(None, json.dumps({"query": "install", "knowledge_name": "docs", "min_score": 2}))
+
+        assert output.startswith("Failed to query knowledge base")
+        assert manager.knowledge_bases["docs"].embedchain_app.searches == []
+
+
+class TestSearchSignatureProbing:
+    """Test how the adapter adapts to the installed Embedchain search signature."""
+
+    def make_kb(self, app):
+        kb = EmbedchainKnowledgeBase("docs", {"id": "docs"}, "docs")
+        kb.embedchain_app = app
+        kb._initialized = True
+        return kb
+
+    @pytest.mark.asyncio
+    async def test_limits_are_pushed_to_search(self):
+        """Test that a search accepting num_documents and where receives both."""
+        app = FakeSearchApp([("a", 0.0), ("b", 1.0), ("c", 2.0)])
+        kb = self.make_kb(app)
+
+        results = await kb.query("q", max_results=2, filters={"url": "a.md"})
+
+        assert kb._search_accepts_limits is True
+        assert app.searches == [{"query": "q", "num_documents": 2, "where": {"url": "a.md"}}]
+        assert [r.content for r in results] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_search_is_called_with_query_only(self, monkeypatch):
+        """Test that an older search signature gets the query alone, probed once, with results sliced."""
+        probes = []
+        signature = inspect.signature
+
+        def counting_signature(obj):
+            probes.append(obj)
+            return signature(obj)
+
+        monkeypatch.setattr("gnosari.knowledge.embedchain_adapter.inspect.signature", counting_signature)
+        app = LegacySearchApp(count=5)
+        kb = self.make_kb(app)
+
+        first = await kb.query("q", max_results=2, filters={"url": "a.md"})
+        await kb.query("q", max_results=2)
+
+        assert kb._search_accepts_limits is False
+        assert len(probes) == 1
+        assert app.calls == 2
+        assert [r.content for r in first] == ["chunk 0", "chunk 1"]
+
+    @pytest.mark.asyncio
+    async def test_uninspectable_search_falls_back(self, monkeypatch):
+        """Test that a search whose signature cannot be read is called with the query only."""
+        def no_signature(obj):
+            raise ValueError("no signature found")
+
+        monkeypatch.setattr("gnosari.knowledge.embedchain_adapter.inspect.signature", no_signature)
+        app = LegacySearchApp(count=1)
+        kb = self.make_kb(app)
+
+        results = await kb.query("q", max_results=3)
+
+        assert kb._search_accepts_limits is False
+        assert [r.content for r in results] == ["chunk 0"]
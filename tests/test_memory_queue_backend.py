@@ -0,0 +1,101 @@
+"""
+Tests for the in-process asyncio queue backend.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from gnosari.queue.base import BaseMessage
+from gnosari.queue.backends import InMemoryQueueBackend, register_task_handler
+
+
+class CountingMessage(BaseMessage):
+    """Message carrying a number to record."""
+    number: int = 0
+
+
+processed = []
+attempts = {}
+
+
+async def record_number(message: CountingMessage) -> None:
+    attempts[message.number] = attempts.get(message.number, 0) + 1
+    if message.number < 0 and attempts[message.number] == 1:
+        raise RuntimeError("transient failure")
+    processed.append(message.number)
+
+
+register_task_handler("tests.record_number", CountingMessage, record_number)
+
+
+def make_message(number: int, **kwargs) -> CountingMessage:
+    return CountingMessage(message_id=str(uuid.uuid4()), number=number, **kwargs)
+
+
+class TestInMemoryQueueBackend:
+    """Test priorities, retries and timeouts of the in-memory backend."""
+
+    def setup_method(self):
+        processed.clear()
+        attempts.clear()
+
+    @pytest.mark.asyncio
+    async def test_lower_priority_number_is_served_first(self):
+        """Test that queued messages are processed in priority order."""
+        backend = InMemoryQueueBackend(concurrency=1)
+        for number, priority in [(1, 9), (2, 5), (3, 1)]:
+            backend.submit("tests.record_number", make_message(number), priority=priority)
+
+        await backend.join()
+        await backend.shutdown()
+
+        assert processed == [3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_retried(self):
+        """Test that a failing message is retried up to max_retries."""
+        backend = InMemoryQueueBackend(concurrency=1, retry_base_delay=0.01)
+
+        backend.submit("tests.record_number", make_message(-1, max_retries=1))
+        # join() also waits for the retry scheduled after the first failure
+        await backend.join()
+        await backend.shutdown()
+
+        assert attempts[-1] == 2
+        assert processed == [-1]
+        assert backend.get_stats()["retried"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_fails_message(self):
+        """Test that a message exceeding its timeout fails without retries."""
+        async def slow(message: CountingMessage) -> None:
+            await asyncio.sleep(1)
+
+        register_task_handler("tests.slow", CountingMessage, slow)
+        backend = InMemoryQueueBackend()
+
+        backend.submit("tests.slow", make_message(1, max_retries=0), timeout=0.05)
+        await backend.join()
+        await backend.shutdown()
+
+        assert backend.get_stats()["failed"] == 1
+
+    def test_unknown_task_is_rejected(self):
+        """Test that submitting a task without a handler raises."""
+        with pytest.raises(ValueError):
+            InMemoryQueueBackend().submit("tests.unknown", make_message(1))
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_pending_retries(self):
+        """Test that retries still waiting out their backoff are dropped on shutdown."""
+        backend = InMemoryQueueBackend(concurrency=1, retry_base_delay=10)
+
+        backend.submit("tests.record_number", make_message(-2, max_retries=1))
+        while not backend._retries:
+            await asyncio.sleep(0.01)
+        await backend.shutdown()
+
+        assert attempts[-2] == 1
+        assert processed == []
+        assert not backend._retries
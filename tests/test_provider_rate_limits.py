@@ -0,0 +1,171 @@
+"""
+Tests for provider retries, backoff and rate-limit budgets.
+"""
+
+import time
+
+import httpx
+import pytest
+from aiohttp import test_utils, web
+from gnosari.providers.rate_limits import RateLimiter, RetryPolicy, parse_reset, parse_retry_after
+from gnosari.providers.transport import ProviderTransport
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}],
+}
+
+
+class FakeProvider:
+    """Local chat completions endpoint answering with scripted responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.request_times = []
+
+    async def handle(self, request):
+        self.request_times.append(time.monotonic())
+        status, headers = self.responses.pop(0) if self.responses else (200, {})
+        if status != 200:
+            return web.json_response({"error": {"message": "slow down"}}, status=status, headers=headers)
+        return web.json_response(COMPLETION, headers=headers)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.handle)
+        self.server = test_utils.TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url("/v1"))
+
+
+def make_client(limiter, max_retries=3):
+    policy = RetryPolicy(max_retries=max_retries, base_delay=0.01, max_delay=0.5)
+    return httpx.AsyncClient(transport=ProviderTransport("test", retry_policy=policy, limiter=limiter))
+
+
+class TestHeaderParsing:
+    """Test parsing of reset and retry-after headers."""
+
+    def test_reset_durations(self):
+        """Test the duration formats used by rate-limit reset headers."""
+        assert parse_reset("2") == 2.0
+        assert parse_reset("1m30s") == 90.0
+        assert parse_reset("250ms") == 0.25
+        assert parse_reset("soon") is None
+
+    def test_retry_after_prefers_milliseconds(self):
+        """Test that retry-after-ms takes precedence over retry-after."""
+        assert parse_retry_after({"retry-after-ms": "20", "retry-after": "5"}) == 0.02
+        assert parse_retry_after({"retry-after": "5"}) == 5.0
+        assert parse_retry_after({}) is None
+
+
+class TestProviderTransport:
+    """Test the provider transport against a local server returning 429s."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(self):
+        """Test that 429 responses are retried after the requested delay."""
+        provider = FakeProvider([(429, {"retry-after-ms": "50"}), (429, {"retry-after-ms": "50"})])
+        base_url = await provider.start()
+        limiter = RateLimiter()
+        client = make_client(limiter)
+        try:
+            response = await client.post(f"{base_url}/chat/completions", json={"model": "gpt-4o"})
+        finally:
+            await client.aclose()
+            await provider.server.close()
+
+        assert response.status_code == 200
+        assert len(provider.request_times) == 3
+        assert provider.request_times[1] - provider.request_times[0] >= 0.05
+        assert limiter.get_stats()[f"{response.request.url.host}/gpt-4o"]["rate_limited"] == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_return_last_response(self):
+        """Test that the last 429 response is returned once retries are exhausted."""
+        provider = FakeProvider([(429, {"retry-after-ms": "1"})] * 3)
+        base_url = await provider.start()
+        client = make_client(RateLimiter(), max_retries=1)
+        try:
+            response = await client.post(f"{base_url}/chat/completions", json={"model": "gpt-4o"})
+        finally:
+            await client.aclose()
+            await provider.server.close()
+
+        assert response.status_code == 429
+        assert len(provider.request_times) == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_delays_next_request(self):
+        """Test that a request waits for the reset of an exhausted request budget."""
+        headers = {
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "100ms",
+        }
+        provider = FakeProvider([(200, headers), (200, {})])
+        base_url = await provider.start()
+        client = make_client(RateLimiter())
+        try:
+            for _ in range(2):
+                response = await client.post(f"{base_url}/chat/completions", json={"model": "gpt-4o"})
+                assert response.status_code == 200
+        finally:
+            await client.aclose()
+            await provider.server.close()
+
+        assert provider.request_times[1] - provider.request_times[0] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_openai_client_succeeds_through_rate_limits(self):
+        """Test that an AsyncOpenAI client using the transport gets a completion despite 429s."""
+        from openai import AsyncOpenAI
+
+        provider = FakeProvider([(429, {"retry-after": "0"}), (503, {})])
+        base_url = await provider.start()
+        client = AsyncOpenAI(api_key="test", base_url=base_url, max_retries=0, http_client=make_client(RateLimiter()))
+        try:
+            completion = await client.chat.completions.create(
+                model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+            )
+        finally:
+            await client.close()
+            await provider.server.close()
+
+        assert completion.choices[0].message.content == "hello"
+        assert len(provider.request_times) == 3
+
+
+class TestRateLimitBudget:
+    """Test pacing of requests as a budget runs low."""
+
+    def test_low_budget_spreads_requests(self):
+        """Test that requests are spaced over the window once the budget is low."""
+        budget = RateLimiter(pacing_threshold=0.1).get_budget("api.example.com", "gpt-4o")
+        budget.update({
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "5",
+            "x-ratelimit-reset-requests": "10s",
+        })
+
+        delays = [budget.delay() for _ in range(3)]
+
+        # Each request is spaced by the time left divided by the requests left
+        assert delays[0] == 0
+        assert delays[1] == pytest.approx(10 / 4, abs=0.05)
+        assert delays[2] == pytest.approx(10 / 4 + 10 / 3, abs=0.05)
+
+    def test_ample_budget_is_not_paced(self):
+        """Test that requests are sent immediately while the budget is ample."""
+        budget = RateLimiter(pacing_threshold=0.1).get_budget("api.example.com", "gpt-4o")
+        budget.update({
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "90",
+            "x-ratelimit-reset-requests": "10s",
+        })
+
+        assert budget.delay() == 0
@@ -0,0 +1,129 @@
+"""
+Tests for routing async tool messages to queues.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from gnosari.queue.config import CeleryConfig
+from gnosari.tools.builtin.delegation import DelegateAgentTool
+from gnosari.tools.interfaces import AsyncTool
+
+
+class RecordingBackend:
+    """Queue backend stand-in recording submitted messages."""
+
+    name = "recording"
+    supports_batching = False
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, task_name, message, **options):
+        self.submitted.append((message, options))
+        return message.message_id
+
+
+class ScriptedTool(AsyncTool):
+    """Async tool with configurable queue metadata."""
+
+    def __init__(self, metadata):
+        super().__init__(name="scripted", description="Scripted tool", input_schema=None)
+        self.metadata = metadata
+
+    def get_tool(self):
+        return None
+
+    def get_async_tool(self):
+        return None
+
+    def get_async_metadata(self):
+        return self.metadata
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = RecordingBackend()
+    monkeypatch.setattr("gnosari.queue.consumers.tool_execution.get_queue_backend", lambda: backend)
+    return backend
+
+
+def send(tool, priority=None):
+    return tool.send_async_message(
+        task_id="task-1",
+        tool_module=__name__,
+        tool_class="ScriptedTool",
+        tool_args="{}",
+        context=SimpleNamespace(context=None, agent_id="Lead"),
+        priority=priority,
+    )
+
+
+class TestRouteForMetadata:
+    """Test the mapping from tool metadata to queue and priority."""
+
+    @pytest.mark.parametrize("metadata, queue", [
+        ({"priority": 1, "timeout": 30}, CeleryConfig.INTERACTIVE_QUEUE),
+        ({"priority": 3, "timeout": 3600}, CeleryConfig.INTERACTIVE_QUEUE),
+        ({"priority": 5, "timeout": 600}, CeleryConfig.DEFAULT_QUEUE),
+        ({"priority": 7, "timeout": 899}, CeleryConfig.DEFAULT_QUEUE),
+        ({"priority": 5, "timeout": 900}, CeleryConfig.LONG_RUNNING_QUEUE),
+        ({"priority": 8, "timeout": 60}, CeleryConfig.LONG_RUNNING_QUEUE),
+        ({"priority": 1, "queue": "custom"}, "custom"),
+        ({}, CeleryConfig.DEFAULT_QUEUE),
+        (None, CeleryConfig.DEFAULT_QUEUE),
+    ])
+    def test_queue_selection(self, metadata, queue):
+        """Test that priority and timeout pick the interactive, default or long-running queue."""
+        assert CeleryConfig.route_for_metadata(metadata)["queue"] == queue
+
+    @pytest.mark.parametrize("priority, expected", [(0, 1), (-5, 1), (11, 10), ("4", 4)])
+    def test_priority_is_clamped(self, priority, expected):
+        """Test that priorities are coerced into the broker's 1-10 range."""
+        assert CeleryConfig.route_for_metadata({"priority": priority})["priority"] == expected
+
+    def test_delegation_is_long_running(self):
+        """Test that delegations, with their 15 minute timeout, go to the long-running queue."""
+        metadata = DelegateAgentTool.get_async_metadata(None)
+
+        assert CeleryConfig.route_for_metadata(metadata)["queue"] == CeleryConfig.LONG_RUNNING_QUEUE
+
+
+class TestAsyncToolMessages:
+    """Test that queued messages carry the routing and limits of their tool."""
+
+    def test_message_timeout_follows_tool_timeout(self, backend):
+        """Test that the message and backend timeouts are derived from the tool's timeout."""
+        send(ScriptedTool({"priority": 2, "timeout": 45, "max_retries": 1}))
+
+        (message, options), = backend.submitted
+        assert message.timeout == 45
+        assert message.max_retries == 1
+        assert options == {
+            "queue": CeleryConfig.INTERACTIVE_QUEUE, "priority": 2, "timeout": 105, "task_id": "task-1"
+        }
+
+    def test_long_timeout_routes_to_long_running_queue(self, backend):
+        """Test that a long tool timeout selects the long-running queue and a matching deadline."""
+        send(ScriptedTool({"priority": 5, "timeout": 1800}))
+
+        (message, options), = backend.submitted
+        assert message.timeout == 1800
+        assert options["queue"] == CeleryConfig.LONG_RUNNING_QUEUE
+        assert options["timeout"] == 1860
+
+    def test_missing_timeout_keeps_message_default(self, backend):
+        """Test that tools without a timeout fall back to the message default."""
+        send(ScriptedTool({"priority": 5}))
+
+        (message, options), = backend.submitted
+        assert message.timeout == 600
+        assert options["timeout"] == 660
+
+    def test_explicit_priority_overrides_metadata(self, backend):
+        """Test that a priority passed by the caller is used for routing."""
+        send(ScriptedTool({"priority": 9, "timeout": 60}), priority=2)
+
+        (message, options), = backend.submitted
+        assert message.priority == 2
+        assert options["queue"] == CeleryConfig.INTERACTIVE_QUEUE
@@ -0,0 +1,164 @@
+"""
+Tests for delivery of async tool results.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from gnosari.queue.app import celery_app
+from gnosari.queue.services.result_channel import CeleryResultStore, LocalResultStore, ToolResultChannel
+
+RESULT = {
+    "task_id": "task-1",
+    "tool_name": "web_search",
+    "status": "success",
+    "result": "42 results",
+    "session_id": "session-1",
+}
+
+
+class FakeSession:
+    """Session stand-in recording the items written to it."""
+
+    instances = []
+
+    def __init__(self, session_id, context):
+        self.session_id = session_id
+        self.context = context
+        self.items = []
+        self.cleaned_up = False
+        FakeSession.instances.append(self)
+
+    async def add_items(self, items):
+        self.items.extend(items)
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+class FakeAsyncResult:
+    """Celery AsyncResult stand-in recording the threads it is read from."""
+
+    threads = []
+
+    def __init__(self, task_id):
+        self.task_id = task_id
+
+    def ready(self):
+        FakeAsyncResult.threads.append(threading.current_thread())
+        return True
+
+    def successful(self):
+        return True
+
+    @property
+    def result(self):
+        return {"task_id": self.task_id, "status": "success"}
+
+
+class TestLocalResultStore:
+    """Test the in-process result store."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_woken_by_put(self):
+        """Test that every waiter of a task receives the published result."""
+        store = LocalResultStore()
+
+        waiters = [asyncio.create_task(store.wait("task-1", timeout=1)) for _ in range(2)]
+        await asyncio.sleep(0)
+        await store.put("task-1", RESULT)
+
+        assert await asyncio.gather(*waiters) == [RESULT, RESULT]
+        assert store._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_put_from_another_thread_wakes_waiter(self):
+        """Test that a result stored by a worker thread wakes a waiter on the loop."""
+        store = LocalResultStore()
+
+        waiter = asyncio.create_task(store.wait("task-1", timeout=1))
+        await asyncio.sleep(0)
+        await asyncio.to_thread(asyncio.run, store.put("task-1", RESULT))
+
+        assert await waiter == RESULT
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Test that a waiter gets None after the timeout and is unregistered."""
+        store = LocalResultStore()
+
+        assert await store.wait("task-1", timeout=0.01) is None
+        assert store._waiters == {}
+        await store.put("task-1", RESULT)
+        assert await store.wait("task-1", timeout=0.01) == RESULT
+
+    @pytest.mark.asyncio
+    async def test_oldest_results_are_dropped(self):
+        """Test that the store keeps at most max_results results."""
+        store = LocalResultStore(max_results=2)
+
+        for task_id in ("a", "b", "c"):
+            await store.put(task_id, {"task_id": task_id})
+
+        assert await store.get("a") is None
+        assert await store.get("c") == {"task_id": "c"}
+
+
+class TestCeleryResultStore:
+    """Test the Celery-backed result store."""
+
+    @pytest.mark.asyncio
+    async def test_backend_reads_run_off_the_event_loop(self, monkeypatch):
+        """Test that the blocking result backend is read from a worker thread."""
+        FakeAsyncResult.threads = []
+        monkeypatch.setattr(celery_app, "AsyncResult", FakeAsyncResult)
+
+        result = await CeleryResultStore().get("task-1")
+
+        assert result == {"task_id": "task-1", "status": "success"}
+        assert FakeAsyncResult.threads and threading.main_thread() not in FakeAsyncResult.threads
+
+
+class TestToolResultChannel:
+    """Test publishing of results to stores, sessions and subscribers."""
+
+    def setup_method(self):
+        FakeSession.instances = []
+
+    @pytest.mark.asyncio
+    async def test_publish_writes_result_to_session(self, monkeypatch):
+        """Test that a published result is appended to its session and reaches waiters and subscribers."""
+        monkeypatch.setattr("gnosari.sessions.GnosariContextSession", FakeSession)
+        channel = ToolResultChannel(store=LocalResultStore(), write_to_session=True)
+        received = []
+        channel.subscribe(received.append)
+
+        waiter = asyncio.create_task(channel.wait_for_result("task-1", timeout=1))
+        await asyncio.sleep(0)
+        await channel.publish(RESULT, session_context={"account_id": 1, "team_id": 2, "agent_id": 3})
+
+        assert await waiter == RESULT
+        assert received == [RESULT]
+        session, = FakeSession.instances
+        assert session.session_id == "session-1"
+        assert session.context.account_id == 1
+        assert session.items == [{"role": "assistant", "content": ToolResultChannel.format_result(RESULT)}]
+        assert session.cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_publish_without_session_write(self, monkeypatch):
+        """Test that session writes can be disabled."""
+        monkeypatch.setattr("gnosari.sessions.GnosariContextSession", FakeSession)
+        channel = ToolResultChannel(store=LocalResultStore(), write_to_session=False)
+
+        await channel.publish(RESULT)
+
+        assert FakeSession.instances == []
+        assert await channel.get_result("task-1") == RESULT
+
+    def test_format_failed_result(self):
+        """Test that failed results carry the error text."""
+        content = ToolResultChannel.format_result({"task_id": "t", "tool_name": "sql", "status": "error", "error": "boom"})
+
+        assert content == "Async result from sql (Task ID: t) failed:\nboom"
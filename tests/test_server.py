@@ -0,0 +1,149 @@
+"""
+Tests for the HTTP server mode.
+"""
+
+import json
+
+import pytest
+from aiohttp import test_utils
+from gnosari.engine.runtime import TeamRuntime
+from gnosari.server import create_app
+
+
+class FakeTeam:
+    """Built team stand-in."""
+
+    name = "Test Team"
+    orchestrator = None
+    workers = {}
+
+    def get_agent(self, name):
+        return name if name == "Writer" else None
+
+
+class FakeBuilder:
+    """Team builder stand-in."""
+
+    builds = 0
+
+    async def build_team(self, config_path):
+        FakeBuilder.builds += 1
+        return FakeTeam()
+
+    async def cleanup_mcp_servers(self):
+        pass
+
+
+class FakeRunner:
+    """Runner stand-in echoing messages."""
+
+    def __init__(self, team):
+        self.team = team
+
+    async def run_team_async(self, message, debug, session_id, session_context, max_turns):
+        return {"outputs": [{"type": "completion", "content": f"echo: {message}"}], "is_done": True}
+
+    async def run_team_stream(self, message, debug, session_id, session_context, max_turns):
+        yield {"type": "response", "content": "echo: ", "agent_name": "Writer"}
+        yield {"type": "response", "content": message, "agent_name": "Writer"}
+        yield {"type": "completion", "content": f"echo: {message}", "is_done": True}
+
+    async def close_idle_sessions(self, max_idle):
+        return 0
+
+    async def close(self):
+        pass
+
+
+class FakeRuntime(TeamRuntime):
+    """Runtime building fake teams."""
+
+    def _create_builder(self, session_id):
+        return FakeBuilder()
+
+    def _create_runner(self, team):
+        return FakeRunner(team)
+
+
+@pytest.fixture
+def teams_dir(tmp_path):
+    (tmp_path / "echo.yaml").write_text("name: Echo\n")
+    return tmp_path
+
+
+async def make_client(teams_dir):
+    app = create_app(FakeRuntime(session_scoped=False), teams_dir=str(teams_dir))
+    client = test_utils.TestClient(test_utils.TestServer(app))
+    await client.start_server()
+    return client
+
+
+class TestServeEndpoints:
+    """Test the run, stream and health endpoints."""
+
+    def setup_method(self):
+        FakeBuilder.builds = 0
+
+    @pytest.mark.asyncio
+    async def test_run_reuses_team_across_sessions(self, teams_dir):
+        """Test that runs of different sessions share one built team."""
+        client = await make_client(teams_dir)
+        try:
+            for session_id in ("s1", "s2"):
+                response = await client.post("/run", json={"team": "echo", "message": "hi", "session_id": session_id})
+                assert response.status == 200
+                assert (await response.json())["outputs"][0]["content"] == "echo: hi"
+        finally:
+            await client.close()
+
+        assert FakeBuilder.builds == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_server_sent_events(self, teams_dir):
+        """Test that stream events are sent as SSE messages."""
+        client = await make_client(teams_dir)
+        try:
+            response = await client.post("/stream", json={"team": "echo", "message": "hi"})
+            assert response.headers["Content-Type"].startswith("text/event-stream")
+            body = await response.text()
+        finally:
+            await client.close()
+
+        messages = [block for block in body.split("\n\n") if block]
+        assert messages[0].startswith("event: response\n")
+        assert json.loads(messages[-1].split("data: ", 1)[1])["type"] == "completion"
+
+    @pytest.mark.asyncio
+    async def test_unknown_team_is_rejected(self, teams_dir):
+        """Test that teams outside the teams directory cannot be selected."""
+        client = await make_client(teams_dir)
+        try:
+            missing = await client.post("/run", json={"team": "missing", "message": "hi"})
+            escape = await client.post("/run", json={"team": "../echo", "message": "hi"})
+        finally:
+            await client.close()
+
+        assert missing.status == 404
+        assert escape.status == 404
+
+    @pytest.mark.asyncio
+    async def test_invalid_bodies_are_rejected(self, teams_dir):
+        """Test that undecodable bodies and invalid max_turns are client errors."""
+        client = await make_client(teams_dir)
+        try:
+            latin1 = await client.post(
+                "/run", data='{"team": "echo", "message": "café"}'.encode("latin-1"),
+                headers={"Content-Type": "application/json"}
+            )
+            text_turns = await client.post("/run", json={"team": "echo", "message": "hi", "max_turns": "ten"})
+            text_turns_error = (await text_turns.json())["error"]
+            bool_turns = await client.post("/stream", json={"team": "echo", "message": "hi", "max_turns": True})
+            valid = await client.post("/run", json={"team": "echo", "message": "hi", "max_turns": 3})
+        finally:
+            await client.close()
+
+        assert latin1.status == 400
+        assert text_turns.status == 400
+        assert "max_turns" in text_turns_error
+        assert bool_turns.status == 400
+        assert valid.status == 200
@@ -0,0 +1,74 @@
+"""
+Tests for the tokenizer-based SQL statement classifier.
+"""
+
+import pytest
+from gnosari.tools.sql.classifier import classify_sql, normalize_sql
+
+
+class TestSQLClassifier:
+    """Test statement classification and keyword detection."""
+
+    def test_keywords_inside_identifiers_and_literals_are_ignored(self):
+        """Test that updated_at and string literals don't match blocked keywords."""
+        classification = classify_sql("SELECT updated_at, 'DROP DATABASE x' FROM deleted_items")
+
+        assert classification.statement_count == 1
+        assert classification.statement_type == "SELECT"
+        assert classification.read_only is True
+        assert classification.find_keywords(["UPDATE", "DROP DATABASE", "DELETE FROM"]) == []
+
+    def test_multi_statement_payload_is_detected(self):
+        """Test that a write hidden after a read is counted as a second statement."""
+        classification = classify_sql("SELECT 1; DROP TABLE users")
+
+        assert classification.statement_count == 2
+        assert [s.statement_type for s in classification.statements] == ["SELECT", "DROP"]
+        assert classification.read_only is False
+        assert classification.find_keywords(["DROP TABLE"]) == ["DROP TABLE"]
+
+    def test_comments_do_not_hide_statements(self):
+        """Test that line comments end at the newline."""
+        classification = classify_sql("SELECT 1 -- harmless\n; DELETE FROM users")
+
+        assert classification.statement_count == 2
+        assert classification.statements[1].statement_type == "DELETE"
+
+    @pytest.mark.parametrize("query,dialect,expected_count", [
+        ("SELECT 'a\\'; DROP TABLE t; --'", "generic", 2),
+        ("SELECT 'a\\'; DROP TABLE t; --'", "mysql", 1),
+        ("SELECT E'a\\''; DROP TABLE t; --'", "generic", 2),
+        ("SELECT 1 # comment\n; DELETE FROM t", "mysql", 2),
+        ("SELECT 1 /*!50000 ; DROP TABLE t */", "mysql", 2),
+    ])
+    def test_dialect_specific_lexing(self, query, dialect, expected_count):
+        """Test backslash escapes, E-strings, # comments and executable comments."""
+        assert classify_sql(query, dialect).statement_count == expected_count
+
+    @pytest.mark.parametrize("query,expected_type,read_only", [
+        ("WITH x AS (SELECT 1) SELECT * FROM x", "SELECT", True),
+        ("WITH x AS (DELETE FROM t RETURNING *) SELECT * FROM x", "SELECT", False),
+        ("EXPLAIN SELECT * FROM t", "EXPLAIN", True),
+        ("EXPLAIN ANALYZE DELETE FROM t", "EXPLAIN", False),
+        ("SELECT * FROM t FOR UPDATE", "SELECT", False),
+        ("desc users", "DESCRIBE", True),
+        ("UPDATE t SET a = 1", "UPDATE", False),
+    ])
+    def test_statement_type_and_read_only(self, query, expected_type, read_only):
+        """Test statement type detection and read-only verdicts."""
+        classification = classify_sql(query)
+
+        assert classification.statement_type == expected_type
+        assert classification.read_only is read_only
+
+    def test_verdict_is_cached_per_normalized_sql(self):
+        """Test that spacing and comments map to the same cached verdict."""
+        first = classify_sql("SELECT  a\nFROM t")
+        second = classify_sql("select a /* note */ FROM t;")
+
+        assert first is second
+
+    def test_normalize_sql_keeps_literals_verbatim(self):
+        """Test that whitespace inside literals is preserved."""
+        assert normalize_sql("SELECT  'a  b'  -- c\n FROM t;") == "SELECT 'a  b' FROM t"
+        assert normalize_sql("SELECT 'a b'") != normalize_sql("SELECT 'a  b'")
@@ -0,0 +1,148 @@
+"""
+Tests for the compact SQL result encodings and token budgeting.
+"""
+
+import json
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from gnosari.tools.sql import formatters
+from gnosari.tools.sql.formatters import count_tokens, fit_to_token_budget, format_rows
+
+COLUMNS = ["id", "name", "joined"]
+ROWS = [(index, f"user {index}", datetime(2024, 1, index)) for index in range(1, 21)]
+
+
+@pytest.fixture
+def estimated_tokens(monkeypatch):
+    """Use the four-characters-per-token estimate regardless of tiktoken."""
+    monkeypatch.setattr(formatters, "_encoding_loaded", True)
+    monkeypatch.setattr(formatters, "_encoding", None)
+
+
+def largest_fitting(render, total, max_tokens):
+    return max(count for count in range(total + 1) if count == 0 or count_tokens(render(count)) <= max_tokens)
+
+
+class TestEncodings:
+    """Test each compact encoding."""
+
+    def test_columnar_lists_columns_once(self):
+        """Test that columnar JSON carries metadata, columns and converted cells."""
+        output = format_rows(["id", "data", "note"], [(1, b"\x01\xff", None)], "columnar", metadata={"status": "success"})
+
+        assert json.loads(output) == {
+            "status": "success", "row_count": 1, "columns": ["id", "data", "note"], "rows": [[1, "01ff", None]]
+        }
+        assert " " not in output
+
+    def test_csv_quotes_delimiters(self):
+        """Test that CSV output has a header row and quotes cells containing commas."""
+        output = format_rows(["id", "name"], [(1, "Lovelace, Ada"), (2, None)], "csv")
+
+        assert output == 'id,name\n1,"Lovelace, Ada"\n2,'
+
+    def test_tsv(self):
+        """Test that TSV output separates cells with tabs and renders datetimes as ISO strings."""
+        output = format_rows(COLUMNS, ROWS[:1], "tsv")
+
+        assert output == "id\tname\tjoined\n1\tuser 1\t2024-01-01T00:00:00"
+
+    def test_markdown_escapes_pipes_and_newlines(self):
+        """Test that markdown cells cannot break the table layout."""
+        output = format_rows(["id", "note"], [(1, "a|b\nc")], "markdown")
+
+        assert output == "| id | note |\n|---|---|\n| 1 | a\\|b c |"
+
+    def test_unknown_format_is_rejected(self):
+        """Test that unsupported formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported compact format"):
+            format_rows(COLUMNS, ROWS, "xml")
+
+
+class TestTokenBudget:
+    """Test trimming of results to a token budget."""
+
+    @pytest.mark.parametrize("return_format", ["csv", "tsv", "markdown"])
+    def test_text_formats_are_cut_at_row_boundaries_with_notice(self, estimated_tokens, return_format):
+        """Test that the largest fitting prefix of rows is kept and the truncation is announced."""
+        full = format_rows(COLUMNS, ROWS, return_format)
+        budget = count_tokens(full) // 2
+
+        output = format_rows(COLUMNS, ROWS, return_format, max_tokens=budget)
+
+        kept = largest_fitting(lambda n: format_rows(COLUMNS, ROWS[:n], return_format) +
+                               f"\n(truncated: showing {n} of 20 rows)", len(ROWS), budget)
+        assert 0 < kept < len(ROWS)
+        assert output.endswith(f"(truncated: showing {kept} of 20 rows)")
+        assert count_tokens(output) <= budget
+
+    def test_columnar_marks_truncation(self, estimated_tokens):
+        """Test that truncated columnar JSON reports the kept and total row counts."""
+        full = format_rows(COLUMNS, ROWS, "columnar")
+
+        output = json.loads(format_rows(COLUMNS, ROWS, "columnar", max_tokens=count_tokens(full) // 3))
+
+        assert output["truncated"] is True
+        assert output["total_rows"] == 20
+        assert output["row_count"] == len(output["rows"]) < 20
+
+    def test_result_within_budget_is_untouched(self, estimated_tokens):
+        """Test that a result that fits the budget is returned unchanged."""
+        output = format_rows(COLUMNS, ROWS, "csv", max_tokens=10_000)
+
+        assert output == format_rows(COLUMNS, ROWS, "csv")
+
+    def test_binary_search_renders_logarithmically(self, estimated_tokens):
+        """Test that the search renders O(log n) candidates and never returns an oversized one."""
+        calls = []
+
+        def render(count):
+            calls.append(count)
+            return "header\n" + "row-data\n" * count
+
+        output = fit_to_token_budget(render, 1000, max_tokens=200)
+
+        assert len(calls) <= 14
+        assert output == render(largest_fitting(render, 1000, 200))
+
+    def test_header_is_returned_when_nothing_fits(self, estimated_tokens):
+        """Test that at least the zero-row rendering is returned."""
+        output = fit_to_token_budget(lambda count: "x" * (100 + count), 5, max_tokens=1)
+
+        assert output == "x" * 100
+
+
+class TestCountTokens:
+    """Test token counting with and without tiktoken."""
+
+    def test_estimate_when_tiktoken_is_missing(self, monkeypatch):
+        """Test that a missing tiktoken falls back to four characters per token."""
+        monkeypatch.setattr(formatters, "_encoding_loaded", False)
+        monkeypatch.setattr(formatters, "_encoding", None)
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+
+        assert count_tokens("") == 0
+        assert count_tokens("abcd") == 1
+        assert count_tokens("abcde") == 2
+        assert formatters._encoding_loaded is True
+
+    def test_tiktoken_encoding_is_used_when_available(self, monkeypatch):
+        """Test that an installed tiktoken is loaded once and used for counting."""
+        loaded = []
+
+        def get_encoding(name):
+            loaded.append(name)
+            if name == "o200k_base":
+                raise ValueError("unknown encoding")
+            return SimpleNamespace(encode=lambda text, disallowed_special: text.split())
+
+        monkeypatch.setattr(formatters, "_encoding_loaded", False)
+        monkeypatch.setattr(formatters, "_encoding", None)
+        monkeypatch.setitem(sys.modules, "tiktoken", SimpleNamespace(get_encoding=get_encoding))
+
+        assert count_tokens("one two three") == 3
+        assert count_tokens("four five") == 2
+        assert loaded == ["o200k_base", "cl100k_base"]
@@ -0,0 +1,149 @@
+"""
+Tests for the read-only SQL result cache.
+"""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from gnosari.tools.builtin.sql_query import SQLQueryTool
+from gnosari.tools.sql import SQLEngineRegistry, SQLResultCache
+
+
+class FakeClock:
+    """Monotonic clock stand-in advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("gnosari.tools.sql.result_cache.time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SQLResultCache()
+    monkeypatch.setattr("gnosari.tools.builtin.sql_query.sql_result_cache", cache)
+    monkeypatch.setattr("gnosari.tools.builtin.sql_query.sql_engine_registry", SQLEngineRegistry())
+    return cache
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "app.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        connection.execute("INSERT INTO users (name) VALUES ('ada')")
+    return path
+
+
+def query(tool, sql, query_type="SELECT"):
+    return tool._run_sql_query(None, json.dumps({"query": sql, "query_type": query_type, "return_format": "csv"}))
+
+
+class TestSQLResultCache:
+    """Test expiry and the memory bound of the cache itself."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test that an entry is served until its TTL passes and then dropped."""
+        cache = SQLResultCache()
+        cache.put("db", "SELECT 1", "1", ttl=10)
+
+        clock.now += 9.9
+        assert cache.get("db", "SELECT 1") == "1"
+
+        clock.now += 0.1
+        assert cache.get("db", "SELECT 1") is None
+        assert cache.get_stats()["total_entries"] == 0
+        assert cache.get_stats()["total_bytes"] == 0
+
+    def test_least_recently_used_entries_are_evicted(self, clock):
+        """Test that the byte budget evicts the least recently read entry first."""
+        cache = SQLResultCache(max_bytes=30)
+        for name in ("a", "b", "c"):
+            cache.put("db", name, name * 10)
+
+        cache.get("db", "a")
+        cache.put("db", "d", "d" * 10)
+
+        assert cache.get("db", "b") is None
+        assert [cache.get("db", name) for name in ("a", "c", "d")] == ["a" * 10, "c" * 10, "d" * 10]
+        assert cache.get_stats()["total_bytes"] == 30
+
+    def test_oversized_results_are_not_cached(self):
+        """Test that a result larger than the whole budget is skipped."""
+        cache = SQLResultCache(max_bytes=5)
+        cache.put("db", "big", "x" * 6)
+
+        assert cache.get("db", "big") is None
+
+    def test_invalidate_connection_only_drops_that_connection(self):
+        """Test that invalidation is scoped to one connection."""
+        cache = SQLResultCache()
+        cache.put("db1", "q", "one")
+        cache.put("db2", "q", "two")
+
+        assert cache.invalidate_connection("db1") == 1
+        assert cache.get("db1", "q") is None
+        assert cache.get("db2", "q") == "two"
+
+
+class TestSQLQueryToolResultCache:
+    """Test result caching through the SQL query tool."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_served_from_cache(self, cache, database):
+        """Test that an equivalent read-only query is answered without hitting the database."""
+        tool = SQLQueryTool(f"sqlite:///{database}", enable_result_cache=True)
+
+        first = await query(tool, "SELECT name FROM users")
+        with sqlite3.connect(database) as connection:
+            connection.execute("INSERT INTO users (name) VALUES ('grace')")
+        second = await query(tool, "SELECT name\n  FROM users -- again")
+
+        assert second == first
+        assert "grace" not in second
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_through_tool_invalidates_connection(self, cache, database):
+        """Test that a write made by the tool drops the cached reads of its connection."""
+        tool = SQLQueryTool(f"sqlite:///{database}", enable_result_cache=True)
+
+        await query(tool, "SELECT name FROM users")
+        await query(tool, "INSERT INTO users (name) VALUES ('grace')", "INSERT")
+        after = await query(tool, "SELECT name FROM users")
+
+        assert "grace" in after
+        assert cache.get_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_only_read_only_statements_are_cached(self, cache, database):
+        """Test that writes are never stored, whatever query_type the caller claims."""
+        tool = SQLQueryTool(f"sqlite:///{database}", enable_result_cache=True)
+
+        await query(tool, "UPDATE users SET name = 'grace'", "UPDATE")
+        await query(tool, "INSERT INTO users (name) VALUES ('linus')")
+        assert cache.get_stats()["total_entries"] == 0
+
+        await query(tool, "SELECT name FROM users")
+        assert cache.get_stats()["total_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_opt_in(self, cache, database):
+        """Test that tools without enable_result_cache neither read nor fill the cache."""
+        tool = SQLQueryTool(f"sqlite:///{database}")
+
+        await query(tool, "SELECT name FROM users")
+        await query(tool, "SELECT name FROM users")
+
+        assert cache.get_stats()["total_entries"] == 0
+        assert cache.get_stats()["hits"] == 0
@@ -0,0 +1,80 @@
+"""
+Tests for the bounded stream buffer.
+"""
+
+import asyncio
+
+import pytest
+from gnosari.engine.runners.stream_buffer import StreamBuffer
+from gnosari.engine.stream_events import ResponseEvent
+
+
+async def produce(events):
+    for event in events:
+        yield event
+
+
+async def consume_slowly(buffer, events):
+    received = []
+    async for event in buffer.stream(produce(events)):
+        received.append(event)
+        await asyncio.sleep(0.01)
+    return received
+
+
+def deltas(count, agent_name="Writer"):
+    return [ResponseEvent(str(i), agent_name, delta=True) for i in range(count)]
+
+
+class TestStreamBuffer:
+    """Test backpressure policies and metrics of the stream buffer."""
+
+    @pytest.mark.asyncio
+    async def test_block_policy_keeps_every_event(self):
+        """Test that the block policy delivers all events in order."""
+        buffer = StreamBuffer(max_size=2, policy="block")
+
+        received = await consume_slowly(buffer, deltas(10))
+
+        assert [event["content"] for event in received] == [str(i) for i in range(10)]
+        stats = buffer.get_stats()
+        assert stats["max_depth"] <= 2
+        assert stats["delivered"] == 10
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_merges_deltas(self):
+        """Test that deltas arriving at a full buffer are merged without losing text."""
+        buffer = StreamBuffer(max_size=2, policy="coalesce")
+
+        received = await consume_slowly(buffer, deltas(10))
+
+        assert "".join(event["content"] for event in received) == "0123456789"
+        assert len(received) < 10
+        assert buffer.get_stats()["coalesced"] == 10 - len(received)
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_drops_low_priority_events(self):
+        """Test that low-priority events make room for response text."""
+        buffer = StreamBuffer(max_size=1, policy="drop")
+        events = [ResponseEvent("a", "Writer", delta=True), {"type": "unknown"},
+                  {"type": "unknown"}, ResponseEvent("b", "Writer")]
+
+        received = await consume_slowly(buffer, events)
+
+        assert [event["type"] for event in received if event["type"] == "response"] == ["response", "response"]
+        assert buffer.get_stats()["dropped"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_source_error_is_reraised(self):
+        """Test that an error in the source stream reaches the consumer."""
+        async def failing():
+            yield ResponseEvent("a", "Writer", delta=True)
+            raise RuntimeError("model failed")
+
+        buffer = StreamBuffer(max_size=4)
+        received = []
+        with pytest.raises(RuntimeError):
+            async for event in buffer.stream(failing()):
+                received.append(event)
+
+        assert len(received) == 1
@@ -0,0 +1,58 @@
+"""
+Tests for structured stream events.
+"""
+
+import json
+
+from gnosari.engine.stream_events import ResponseEvent, ToolCallEvent
+
+
+class CountingItem:
+    """SDK item stand-in that counts string conversions."""
+
+    def __init__(self):
+        self.conversions = 0
+
+    def __str__(self):
+        self.conversions += 1
+        return "item"
+
+
+class TestStreamEvents:
+    """Test dict compatibility and lazy serialization of stream events."""
+
+    def test_token_delta_reads_like_a_dict(self):
+        """Test that a token delta exposes the keys of the previous dict events."""
+        event = ResponseEvent("Hel", "Writer", delta=True)
+
+        assert event["type"] == "response"
+        assert event.get("content") == "Hel"
+        assert event == {"type": "response", "id": "response_Writer", "content": "Hel", "agent_name": "Writer"}
+
+    def test_optional_key_is_omitted(self):
+        """Test that a complete message response has no id key."""
+        event = ResponseEvent("Hello", "Writer")
+
+        assert "id" not in event
+        assert event.get("id") is None
+        assert set(event) == {"type", "content", "agent_name"}
+
+    def test_nested_items_are_stringified_lazily(self):
+        """Test that SDK items are only converted to text when serialized."""
+        item, raw_item = CountingItem(), CountingItem()
+        event = ToolCallEvent("call_1", "search", {}, "{}", "Researcher", item, raw_item)
+
+        assert event["tool_name"] == "search"
+        assert item.conversions == 0 and raw_item.conversions == 0
+
+        data = json.loads(json.dumps(event))
+        assert data["item_data"] == "item"
+        assert data["tool_item"] == "item"
+        assert item.conversions == 1 and raw_item.conversions == 1
+
+    def test_mutation_keeps_all_keys(self):
+        """Test that setting a key keeps the lazily served keys."""
+        event = ResponseEvent("Hi", "Writer")
+        event["extra"] = True
+
+        assert event.to_dict() == {"type": "response", "content": "Hi", "agent_name": "Writer", "extra": True}
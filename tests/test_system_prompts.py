@@ -0,0 +1,129 @@
+"""
+Tests for system prompt assembly.
+"""
+
+from types import SimpleNamespace
+
+from gnosari.engine.agents.agent_factory import AgentFactory
+from gnosari.prompts import build_agent_system_prompt, render_system_prompt, system_prompt_cache
+
+
+class FakeRegistry:
+    """Tool registry stand-in."""
+
+    def __init__(self):
+        self.tools = {
+            "web_search": SimpleNamespace(name="Web Search", description="Search the web"),
+            "file_ops": SimpleNamespace(name="File Operations", description="Read and write files"),
+        }
+
+    def get(self, tool_name):
+        return self.tools.get(tool_name)
+
+    def get_config(self, tool_name):
+        return {"id": tool_name}
+
+
+class FakeToolManager:
+    """Tool manager stand-in counting tool loads."""
+
+    def __init__(self):
+        self.registry = FakeRegistry()
+        self.loads = 0
+
+    def load_tools_from_config(self, team_config):
+        self.loads += 1
+
+
+def make_tool_manager():
+    return FakeToolManager()
+
+
+AGENT_CONFIG = {
+    "tools": ["web_search", "file_ops"],
+    "knowledge": ["docs"],
+    "delegation": [{"agent": "Writer", "instructions": "Delegate writing"}],
+}
+KNOWLEDGE = {"docs": "Product documentation"}
+
+
+class TestSystemPromptPrefix:
+    """Test that system prompts keep a stable, shared prefix."""
+
+    def test_prompt_is_byte_stable_across_builds(self):
+        """Test that separate builds of the same agent render identical bytes."""
+        prompts = [
+            render_system_prompt(build_agent_system_prompt(
+                "Researcher", "Find facts.", AGENT_CONFIG["tools"], make_tool_manager(),
+                dict(AGENT_CONFIG), dict(KNOWLEDGE)
+            )).encode("utf-8")
+            for _ in range(2)
+        ]
+
+        assert prompts[0] == prompts[1]
+
+    def test_agents_with_same_tools_share_prefix(self):
+        """Test that tools and knowledge come before agent-specific content."""
+        researcher = render_system_prompt(build_agent_system_prompt(
+            "Researcher", "Find facts.", AGENT_CONFIG["tools"], make_tool_manager(), AGENT_CONFIG, KNOWLEDGE
+        ))
+        analyst = render_system_prompt(build_agent_system_prompt(
+            "Analyst", "Analyse data.", AGENT_CONFIG["tools"], make_tool_manager(), AGENT_CONFIG, KNOWLEDGE
+        ))
+
+        prefix = researcher[:researcher.index("# Researcher")]
+        assert "## Available Tools" in prefix
+        assert "## Available Knowledge Bases" in prefix
+        assert analyst.startswith(prefix)
+        assert researcher.index("## Team Collaboration") > researcher.index("Find facts.")
+
+    def test_factory_renders_markdown_text(self):
+        """Test that agents receive the rendered prompt rather than list representations."""
+        factory = AgentFactory(SimpleNamespace(tool_manager=make_tool_manager()), mcp_registry=None)
+
+        prompt = factory._build_system_prompt("Researcher", "Find facts.", False, None, AGENT_CONFIG)
+
+        assert prompt == render_system_prompt(build_agent_system_prompt(
+            "Researcher", "Find facts.", AGENT_CONFIG["tools"], make_tool_manager(), AGENT_CONFIG, {}
+        ))
+        assert prompt.startswith("## Available Tools\n- **Web Search** (`web_search`): Search the web\n")
+        assert "\\n" not in prompt
+
+
+class TestSystemPromptCache:
+    """Test memoization of rendered system prompts across team builds."""
+
+    def setup_method(self):
+        system_prompt_cache.clear()
+
+    def make_factory(self, tool_manager):
+        return AgentFactory(SimpleNamespace(tool_manager=tool_manager), mcp_registry=None)
+
+    def test_rebuild_reuses_rendered_prompt(self):
+        """Test that rebuilding an unchanged orchestrator skips prompt assembly and tool loading."""
+        tool_manager = make_tool_manager()
+        team_config = {"tools": [{"name": "web_search"}]}
+
+        first = self.make_factory(tool_manager)._build_system_prompt(
+            "Lead", "Coordinate.", True, team_config, AGENT_CONFIG
+        )
+        second = self.make_factory(tool_manager)._build_system_prompt(
+            "Lead", "Coordinate.", True, team_config, AGENT_CONFIG
+        )
+
+        assert first == second
+        assert tool_manager.loads == 1
+        assert system_prompt_cache.get_stats()["hits"] == 1
+
+    def test_changed_tool_invalidates_prompt(self):
+        """Test that a changed tool definition renders a new prompt."""
+        tool_manager = make_tool_manager()
+        factory = self.make_factory(tool_manager)
+        before = factory._build_system_prompt("Researcher", "Find facts.", False, None, AGENT_CONFIG)
+
+        tool_manager.registry.tools["web_search"].description = "Search the internet"
+        tool_manager.registry.get_config = lambda tool_name: {"id": tool_name, "description": "Search the internet"}
+        after = factory._build_system_prompt("Researcher", "Find facts.", False, None, AGENT_CONFIG)
+
+        assert before != after
+        assert "Search the internet" in after
@@ -0,0 +1,272 @@
+"""
+Tests for the warm team runtime.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from gnosari.engine.event_handlers import MCPServerManager
+from gnosari.engine.runners import CompositeTeamRunner
+from gnosari.engine.runners.team_runner import TeamRunner
+from gnosari.engine.runtime import TeamRuntime
+from gnosari.tools.builtin.delegation import DelegateAgentArgs, DelegateAgentTool
+
+
+class FakeMCPServer:
+    """MCP server stand-in recording the tasks that connect and clean it up."""
+
+    def __init__(self):
+        self.name = "fake-mcp"
+        self.connected_in = None
+        self.cleaned_up_in = None
+
+    async def connect(self):
+        self.connected_in = asyncio.current_task()
+
+    async def cleanup(self):
+        self.cleaned_up_in = asyncio.current_task()
+
+
+class FakeTeam:
+    """Built team stand-in with one MCP server."""
+
+    def __init__(self, name):
+        self.name = name
+        self.mcp_server = FakeMCPServer()
+        self.orchestrator = SimpleNamespace(name="Lead", mcp_servers=[self.mcp_server])
+        self.workers = {}
+
+
+class FakeBuilder:
+    """Team builder stand-in counting builds and cleanups."""
+
+    builds = 0
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.cleaned_up = False
+
+    async def build_team(self, config_path):
+        FakeBuilder.builds += 1
+        await asyncio.sleep(0.01)
+        return FakeTeam(f"team-{self.session_id}")
+
+    async def cleanup_mcp_servers(self):
+        self.cleaned_up = True
+
+
+class FakeRunner:
+    """Runner stand-in answering every message."""
+
+    def __init__(self, team):
+        self.team = team
+        self.closed = False
+
+    async def run_team_async(self, message, debug, session_id, session_context, max_turns):
+        return {"outputs": [{"type": "completion", "content": f"{self.team.name}: {message}"}]}
+
+    async def close_idle_sessions(self, max_idle):
+        return 0
+
+    async def close(self):
+        self.closed = True
+        await MCPServerManager().cleanup_servers([self.team.orchestrator])
+
+
+class FakeSession:
+    """Session stand-in recording its cleanup."""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.cleaned_up = False
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+class FakeRuntime(TeamRuntime):
+    """Runtime building fake teams."""
+
+    def _create_builder(self, session_id):
+        return FakeBuilder(session_id)
+
+    def _create_runner(self, team):
+        return FakeRunner(team)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "team.yaml"
+    path.write_text("name: Test Team\n")
+    return str(path)
+
+
+class TestTeamRuntime:
+    """Test reuse, shared builds and eviction of resident teams."""
+
+    def setup_method(self):
+        FakeBuilder.builds = 0
+
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_reuses_team(self, config_path):
+        """Test that a second turn of a session does not rebuild the team."""
+        runtime = FakeRuntime(max_teams=4, idle_timeout=60)
+
+        await runtime.run_team_async(config_path, "hello", session_id="s1")
+        result = await runtime.run_team_async(config_path, "again", session_id="s1")
+        await runtime.close()
+
+        assert result["outputs"][0]["content"] == "team-s1: again"
+        assert FakeBuilder.builds == 1
+        assert runtime.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_build(self, config_path):
+        """Test that concurrent first turns wait for the same build."""
+        runtime = FakeRuntime(max_teams=4, idle_timeout=60)
+
+        teams = await asyncio.gather(*(runtime.get_team(config_path, "s1") for _ in range(3)))
+        await runtime.close()
+
+        assert FakeBuilder.builds == 1
+        assert teams[0] is teams[1] is teams[2]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_team_is_evicted(self, config_path):
+        """Test that exceeding max_teams closes the least recently used team."""
+        runtime = FakeRuntime(max_teams=2, idle_timeout=60)
+
+        first = await runtime.get_team(config_path, "s1")
+        await runtime.get_team(config_path, "s2")
+        await runtime.get_team(config_path, "s1")
+        await runtime.get_team(config_path, "s3")
+
+        stats = runtime.get_stats()
+        assert stats["resident"] == 2
+        assert stats["evictions"] == 1
+        assert not first.runner.closed
+        await runtime.close()
+        assert first.runner.closed and first.builder.cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_idle_team_is_evicted(self, config_path):
+        """Test that the background sweeper evicts teams past the idle timeout."""
+        runtime = FakeRuntime(max_teams=2, idle_timeout=0.02)
+
+        warm = await runtime.get_team(config_path, "s1")
+        await asyncio.sleep(0.05)
+
+        assert runtime.get_stats()["resident"] == 0
+        assert warm.runner.closed
+        await runtime.close()
+
+    @pytest.mark.asyncio
+    async def test_mcp_servers_are_released_by_the_task_that_connected_them(self, config_path):
+        """Test that connect and cleanup of a team's MCP servers run in the same task."""
+        runtime = FakeRuntime(max_teams=2, idle_timeout=60)
+
+        warm = await runtime.get_team(config_path, "s1")
+        await runtime.run_team_async(config_path, "hello", session_id="s1")
+        # Close from a different task, as the idle sweeper does
+        await asyncio.create_task(runtime.close())
+
+        server = warm.team.mcp_server
+        assert server.connected_in is not None
+        assert server.cleaned_up_in is server.connected_in
+        assert server.cleaned_up_in is not asyncio.current_task()
+
+
+class TestRunnerSessions:
+    """Test sessions kept open by a keep-alive runner."""
+
+    @pytest.mark.asyncio
+    async def test_close_idle_sessions(self):
+        """Test that only sessions idle past the limit are closed and new ones are created afterwards."""
+        team = SimpleNamespace(name="Team", orchestrator=SimpleNamespace(name="Lead", mcp_servers=[]), workers={})
+        runner = TeamRunner(team)
+        runner.set_keep_alive(True)
+        runner.set_custom_session_provider(FakeSession)
+
+        idle = runner._get_session("idle")
+        reused = runner._get_session("reused")
+        await asyncio.sleep(0.1)
+        # Using a session again keeps it open
+        assert runner._get_session("reused") is reused
+
+        closed = await runner.close_idle_sessions(0.05)
+
+        assert closed == 1
+        assert idle.cleaned_up and not reused.cleaned_up
+        assert runner._get_session("idle") is not idle
+
+        await runner.close()
+        assert reused.cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_run_leaves_interactive_bash_sessions(self):
+        """Test that finishing one conversation's run does not kill shared interactive bash sessions."""
+        team = SimpleNamespace(name="Team", orchestrator=SimpleNamespace(name="Lead", mcp_servers=[]), workers={})
+        runner = TeamRunner(team)
+        cleanups = []
+
+        async def cleanup_interactive_bash_sessions():
+            cleanups.append(runner.keep_alive)
+
+        runner.cleanup_manager.cleanup_interactive_bash_sessions = cleanup_interactive_bash_sessions
+
+        runner.set_keep_alive(True)
+        await runner._cleanup_run(None, MCPServerManager(), [team.orchestrator])
+        runner.set_keep_alive(False)
+        await runner._cleanup_run(None, MCPServerManager(), [team.orchestrator])
+
+        assert cleanups == [False]
+
+
+class TestNestedRunCleanup:
+    """Test that delegated runs leave the shared interactive bash sessions to their parent."""
+
+    def make_team(self):
+        lead = SimpleNamespace(name="Lead", mcp_servers=[])
+        worker = SimpleNamespace(name="Worker", mcp_servers=[])
+        return SimpleNamespace(name="Team", original_config={"name": "Team"}, orchestrator=lead,
+                               workers={"Worker": worker}, max_turns=None, name_to_agent_id={})
+
+    async def run_with_delegation(self, monkeypatch, keep_alive):
+        team = self.make_team()
+        cleanups = []
+        delegated = []
+
+        async def cleanup_all_global_interactive_bash_sessions():
+            cleanups.append("bash")
+
+        async def run(agent, input, **kwargs):
+            if agent.name == "Lead":
+                # The lead delegates within its own run, as the delegate_agent tool does
+                args = DelegateAgentArgs(target_agent="Worker", message=input)
+                delegated.append(await DelegateAgentTool()._execute_delegation(team, team.workers["Worker"], args, None))
+            return SimpleNamespace(final_output=f"{agent.name} done")
+
+        monkeypatch.setattr(
+            "gnosari.tools.builtin.interactive_bash_operations.cleanup_all_global_interactive_bash_sessions",
+            cleanup_all_global_interactive_bash_sessions
+        )
+        monkeypatch.setattr("gnosari.engine.runners.agent_runner.Runner.run", run)
+        parent = CompositeTeamRunner(team)
+        parent.set_keep_alive(keep_alive)
+
+        result = await parent.run_agent_until_done_async(team.orchestrator, "task")
+
+        assert result["outputs"][0]["content"] == "Lead done"
+        assert delegated[0]["outputs"][0]["content"] == "Worker done"
+        return cleanups
+
+    @pytest.mark.asyncio
+    async def test_delegation_under_keep_alive_parent_leaves_registry(self, monkeypatch):
+        """Test that a finished delegation does not clear the sessions of a keep-alive parent."""
+        assert await self.run_with_delegation(monkeypatch, keep_alive=True) == []
+
+    @pytest.mark.asyncio
+    async def test_outermost_run_cleans_registry_once(self, monkeypatch):
+        """Test that without keep-alive only the outermost run cleans up the registry."""
+        assert await self.run_with_delegation(monkeypatch, keep_alive=False) == ["bash"]
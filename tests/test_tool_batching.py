@@ -0,0 +1,163 @@
+"""
+Tests for micro-batched tool execution.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from gnosari.queue.consumers.tool_execution import (
+    ToolExecutionBatchConsumer,
+    ToolExecutionBatcher,
+    ToolExecutionMessage,
+    process_tool_execution_batch_task,
+    process_tool_execution_task,
+)
+
+
+class EchoTool:
+    """Tool answering each call with its arguments; ``run_batch`` behaviour is configurable."""
+
+    batch_mode = "fail"
+    batch_calls = 0
+
+    def __init__(self):
+        self.tool = SimpleNamespace(on_invoke_tool=self._invoke)
+
+    async def _invoke(self, ctx, args):
+        return f"echo {args}"
+
+    async def run_batch(self, items):
+        EchoTool.batch_calls += 1
+        if EchoTool.batch_mode == "fail":
+            raise RuntimeError("batch endpoint down")
+        if EchoTool.batch_mode == "short":
+            return ["only one"]
+        return [f"batched {args}" for _, args in items]
+
+
+def make_message(index):
+    return ToolExecutionMessage.create(
+        task_id=f"task-{index}",
+        tool_name="echo",
+        tool_module=__name__,
+        tool_class="EchoTool",
+        tool_args=f'{{"n": {index}}}',
+        context_data={"context_wrapper": {
+            "context": {"session_id": "s1", "session_context": {}, "original_config": {"name": "Team"}},
+            "agent_id": "Lead",
+        }},
+        session_id="s1",
+    )
+
+
+class SentTasks:
+    """Records apply_async calls and the threads they were made from."""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = []
+        self.sent = threading.Event()
+
+    def recorder(self, kind):
+        def apply_async(args, **options):
+            self.calls.append((kind, args[0], options))
+            self.threads.append(threading.current_thread())
+            self.sent.set()
+        return apply_async
+
+    async def wait(self, timeout=1.0):
+        assert await asyncio.to_thread(self.sent.wait, timeout)
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    tasks = SentTasks()
+    monkeypatch.setattr(process_tool_execution_task, "apply_async", tasks.recorder("single"))
+    monkeypatch.setattr(process_tool_execution_batch_task, "apply_async", tasks.recorder("batch"))
+    return tasks
+
+
+class TestToolExecutionBatcher:
+    """Test producer-side micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_is_sent_off_the_event_loop(self, sent):
+        """Test that reaching max_batch_size sends one batch task from a worker thread."""
+        batcher = ToolExecutionBatcher(max_batch_size=3, max_wait_ms=10_000)
+
+        for index in range(3):
+            batcher.add({"task_id": f"task-{index}"}, "tools", 5)
+        await sent.wait()
+
+        kind, batch, options = sent.calls[0]
+        assert kind == "batch"
+        assert [item["task_id"] for item in batch] == ["task-0", "task-1", "task-2"]
+        assert options == {"priority": 5, "queue": "tools"}
+        assert threading.main_thread() not in sent.threads
+
+    @pytest.mark.asyncio
+    async def test_partial_buffer_is_sent_after_max_wait(self, sent):
+        """Test that a partial batch is sent once max_wait_ms has passed."""
+        batcher = ToolExecutionBatcher(max_batch_size=10, max_wait_ms=20)
+
+        batcher.add({"task_id": "task-0"}, None, 5)
+        batcher.add({"task_id": "task-1"}, None, 5)
+        await asyncio.sleep(0.005)
+        assert sent.calls == []
+        await sent.wait()
+
+        kind, batch, options = sent.calls[0]
+        assert kind == "batch" and len(batch) == 2
+        assert options == {"priority": 5}
+
+    @pytest.mark.asyncio
+    async def test_single_message_is_sent_as_regular_task(self, sent):
+        """Test that a batch of one keeps its own task ID."""
+        batcher = ToolExecutionBatcher(max_batch_size=10, max_wait_ms=1)
+
+        batcher.add({"task_id": "task-0"}, None, 3)
+        await sent.wait()
+
+        assert sent.calls == [("single", {"task_id": "task-0"}, {"priority": 3, "task_id": "task-0"})]
+
+    def test_without_event_loop_messages_are_sent_at_once(self, sent):
+        """Test that callers without an event loop do not wait for companions."""
+        batcher = ToolExecutionBatcher(max_batch_size=10, max_wait_ms=10_000)
+
+        batcher.add({"task_id": "task-0"}, None, 5)
+
+        assert len(sent.calls) == 1
+
+
+class TestToolExecutionBatchConsumer:
+    """Test worker-side batch processing."""
+
+    def setup_method(self):
+        EchoTool.batch_calls = 0
+
+    @pytest.mark.asyncio
+    async def test_run_batch_handles_group(self):
+        """Test that a group is executed through the tool's run_batch hook."""
+        EchoTool.batch_mode = "ok"
+        messages = [make_message(index) for index in range(3)]
+
+        results = await ToolExecutionBatchConsumer().process_batch(messages)
+
+        assert EchoTool.batch_calls == 1
+        assert [result["result"] for result in results] == [f'batched {{"n": {index}}}' for index in range(3)]
+        assert [result["task_id"] for result in results] == ["task-0", "task-1", "task-2"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_mode", ["fail", "short"])
+    async def test_failed_batch_falls_back_to_per_item_execution(self, batch_mode):
+        """Test that a failing or mismatched run_batch leads to per-item execution."""
+        EchoTool.batch_mode = batch_mode
+        messages = [make_message(index) for index in range(3)]
+
+        results = await ToolExecutionBatchConsumer().process_batch(messages)
+
+        assert EchoTool.batch_calls == 1
+        assert [result["status"] for result in results] == ["success"] * 3
+        assert [result["result"] for result in results] == [f'echo {{"n": {index}}}' for index in range(3)]